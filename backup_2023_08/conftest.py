@@ -0,0 +1,17 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+import locale
+import sys
+from pathlib import Path
+
+# racine du depot apres ce dossier: simple_ass_mat.controller est celui de ce dossier,
+# simple_ass_mat.model celui du paquet principal
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+
+def pytest_configure():
+    """Set the French locale"""
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
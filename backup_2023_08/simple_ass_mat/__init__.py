@@ -0,0 +1,11 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+
+Paquet etendu aux paquets simple_ass_mat du chemin de recherche: avec la racine du depot dans sys.path,
+simple_ass_mat.model est celui du paquet principal, le registre des parametres legaux y est defini une seule fois
+"""
+
+from pkgutil import extend_path
+
+__path__ = extend_path(__path__, __name__)
@@ -0,0 +1,131 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+
+import calendar
+import datetime
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import NamedTuple
+
+_ANNEES_MAX = 16
+
+
+class CalendrierAnnee(NamedTuple):
+    """Tables calendaires d'une annee, calculees une fois par annee
+
+    Les semaines sont celles de helper: numerotation ISO a partir du premier jeudi de l'annee.
+    Une semaine absente de dates_par_semaine n'existe pas dans l'annee.
+    Les tables sont partagees par tous les appelants, elles sont en lecture seule.
+    """
+    annee: int
+    dates_par_mois: Mapping[int, tuple[datetime.date, ...]]
+    numeros_semaine_par_mois: Mapping[int, tuple[int, ...]]
+    dates_par_semaine: Mapping[int, tuple[datetime.date, ...]]
+    dernier_jour_par_semaine: Mapping[int, datetime.date]
+
+
+@functools.lru_cache(maxsize=_ANNEES_MAX)
+def get_calendrier_annee(annee: int) -> CalendrierAnnee:
+    """Return les tables de l'annee, les _ANNEES_MAX dernieres annees demandees sont conservees"""
+    dates_par_semaine = {}
+    for numero_semaine in range(1, 54):
+        try:
+            dates_par_semaine[numero_semaine] = tuple(calculer_dates_semaine(annee, numero_semaine))
+        except ValueError:
+            pass
+
+    return CalendrierAnnee(
+        annee=annee,
+        dates_par_mois=MappingProxyType({mois: tuple(calculer_dates_mois(annee, mois)) for mois in range(1, 13)}),
+        numeros_semaine_par_mois=MappingProxyType({mois: tuple(calculer_numeros_semaine(annee, mois))
+                                                   for mois in range(1, 13)}),
+        dates_par_semaine=MappingProxyType(dates_par_semaine),
+        dernier_jour_par_semaine=MappingProxyType({numero_semaine: calculer_dernier_jour_semaine(annee, numero_semaine)
+                                                   for numero_semaine in range(1, 54)}))
+
+
+def calculer_dates_semaine(year, week_number) -> list[datetime.date]:
+    """Return all dates in a given week"""
+    # Check if week number is valid
+    if not 1 <= week_number <= 53:
+        raise ValueError(f'Invalid ISO week number {week_number}. Week number must be in 1-53.')
+
+    # Jan 1 of the given year
+    jan1 = datetime.date(year, 1, 1)
+
+    # Number of days to the first Thursday
+    days_to_first_thursday = (3 - jan1.weekday() + 7) % 7
+
+    # First Thursday of the given year
+    first_thursday = jan1 + datetime.timedelta(days=days_to_first_thursday)
+
+    # If week number is 53, check if the year actually has a week 53
+    if week_number == 53 and jan1.isocalendar()[1] == 1:
+        raise ValueError(f'The year {year} does not have 53 weeks.')
+
+    # Compute the datetime.date of the Thursday in the given ISO week number
+    week_thursday = first_thursday + datetime.timedelta(weeks=week_number-1)
+
+    # Compute the dates of the Monday to Sunday of the week
+    week_dates = [week_thursday + datetime.timedelta(days=i) for i in range(-3, 4)]
+
+    return week_dates
+
+
+def calculer_numeros_semaine(year, month) -> list[int]:
+    """Return all week numbers in a given month"""
+    # Number of days in the month
+    month_days = calendar.monthrange(year, month)[1]
+
+    # Date for the first day and last day of the month
+    first_date = datetime.date(year, month, 1)
+    last_date = datetime.date(year, month, month_days)
+
+    # Week numbers for the first day and last day of the month
+    first_week_number = first_date.isocalendar()[1]
+    last_week_number = last_date.isocalendar()[1]
+
+    last_date_last_week = calculer_dernier_jour_semaine(year, last_week_number)
+
+    if last_date_last_week.month != month:
+        last_week_number -= 1
+
+    week_numbers = []
+    # Edge case for weeks in early January that count as the last week of the previous year
+    if month == 1 and first_week_number > last_week_number:
+        first_week_number = 1
+        week_numbers = [52]
+
+    # Week numbers for the specified month
+    week_numbers.extend(list(range(first_week_number, last_week_number + 1)))
+
+    return week_numbers
+
+
+def calculer_dernier_jour_semaine(year: int, week: int) -> datetime.date:
+    """Return the last day of a given week"""
+    first_day = datetime.date(year, 1, 1)
+
+    # Counting the number of days to reach the first Thursday
+    first_thursday_delta = 3 - first_day.weekday() if first_day.weekday() < 4 else 10 - first_day.weekday()
+
+    # Identifying the first Thursday
+    first_thursday = first_day + datetime.timedelta(days=first_thursday_delta)
+
+    # Resolving the first Monday on or before the first Thursday
+    first_monday = first_thursday - datetime.timedelta(days=3)
+
+    # Resolving any given week's Sunday (last day of the week)
+    last_day = first_monday + datetime.timedelta(weeks=(week-1), days=6)
+    return last_day
+
+
+def calculer_dates_mois(year: int, month: int) -> list[datetime.date]:
+    """Return all dates in a given month"""
+    # Get the number of days in the month
+    _, num_days = calendar.monthrange(year, month)
+    # Create a list of all days in the month
+    return [datetime.date(year, month, day) for day in range(1, num_days+1)]
@@ -0,0 +1,45 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+
+import datetime
+from typing import NamedTuple
+
+from .calendrier_cache import get_calendrier_annee
+from .frais_entretien import FraisEntretien, PeriodeFraisEntretien, TableFraisEntretien, get_table_frais_entretien
+
+
+class CalendrierMois(NamedTuple):
+    """Donnees calendaires d'un mois, independantes du contrat
+
+    Calculees une seule fois puis partagees par tous les contrats evalues pour ce mois.
+    """
+    mois: datetime.date
+    dates: tuple[datetime.date, ...]
+    numeros_semaine: tuple[int, ...]
+    dates_par_semaine: dict[int, tuple[datetime.date, ...]]
+    frais_entretien_par_date: dict[datetime.date, FraisEntretien]
+    periodes_frais_entretien: tuple[PeriodeFraisEntretien, ...]
+
+
+def make_calendrier_mois(date: datetime.date,
+                         table_frais_entretien: TableFraisEntretien | None = None) -> CalendrierMois:
+    """Construit le calendrier du mois contenant date, table_frais_entretien du registre si None"""
+    calendrier_annee = get_calendrier_annee(date.year)
+    dates = calendrier_annee.dates_par_mois[date.month]
+    numeros_semaine = calendrier_annee.numeros_semaine_par_mois[date.month]
+    dates_par_semaine = {numero_semaine: calendrier_annee.dates_par_semaine[numero_semaine]
+                         for numero_semaine in numeros_semaine}
+    table_frais_entretien = table_frais_entretien or get_table_frais_entretien()
+    periodes_frais_entretien = tuple(table_frais_entretien.get_periodes(dates[0], dates[-1]))
+    frais_entretien_par_date = {i_date: periode.frais_entretien
+                                for periode in periodes_frais_entretien
+                                for i_date in dates[periode.debut.day - 1:periode.fin.day]}
+
+    return CalendrierMois(mois=datetime.date(date.year, date.month, 1),
+                          dates=dates,
+                          numeros_semaine=numeros_semaine,
+                          dates_par_semaine=dates_par_semaine,
+                          frais_entretien_par_date=frais_entretien_par_date,
+                          periodes_frais_entretien=periodes_frais_entretien)
@@ -0,0 +1,167 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+
+import datetime
+import math
+from typing import NamedTuple
+
+from .calendrier_cache import get_calendrier_annee
+from .contrat import Contrat
+
+
+class AcquisitionCongesPayes(NamedTuple):
+    """Conges payes d'une periode de reference, du 1er juin au 31 mai"""
+    debut_periode: datetime.date
+    semaines_travail_effectif: int
+    jours_acquis: int
+    jours_pris: int
+    salaire_net_periode: float
+
+
+class IndemniteCongesPayes(NamedTuple):
+    """Indemnite de conges payes, la plus favorable du dixieme et du maintien de salaire"""
+    jours: int
+    dixieme: float
+    maintien_salaire: float
+    montant: float
+
+
+class _ContributionMois(NamedTuple):
+    """Ce qu'un mois ajoute aux compteurs de sa periode de reference"""
+    debut_periode: datetime.date
+    semaines_travail_effectif: frozenset[datetime.date]
+    jours_pris: int
+    salaire_net: float
+
+
+class CompteurCongesPayes:
+    """Acquisition des conges payes d'un contrat, mise a jour mois par mois
+
+    Un mois ajoute ses semaines de travail effectif, ses jours de conges pris et son salaire aux compteurs
+    de sa periode de reference, en O(jours du mois). Les mois peuvent etre ajoutes dans n'importe quel ordre,
+    ajouter de nouveau un mois remplace sa contribution precedente.
+
+    Une semaine compte a la periode de son lundi, si au moins un jour y est de travail effectif:
+    jour planifie sans absence non remuneree, absence payee un jour planifie, heures realisees ou conges payes.
+    2,5 jours ouvrables sont acquis par 4 semaines de travail effectif, arrondis au jour superieur, 30 au plus.
+    Les conges pris sont les jours ouvrables des semaines enfant absent en annee complete,
+    en annee incomplete les absences de l'enfant ne sont pas des conges de l'assistante maternelle.
+    """
+
+    _JOURS_PAR_4_SEMAINES = 2.5
+    _JOURS_ACQUIS_MAX = 30
+    _MOIS_DEBUT_PERIODE = 6
+    _DIXIEME = 0.10
+
+    def __init__(self, contrat: Contrat) -> None:
+        self._contrat = contrat
+        self._contributions: dict[tuple[int, int], _ContributionMois] = {}
+        # par periode: lundi de chaque semaine de travail effectif -> nombre de mois y contribuant
+        self._semaines: dict[datetime.date, dict[datetime.date, int]] = {}
+
+    @staticmethod
+    def get_debut_periode(date: datetime.date) -> datetime.date:
+        """Return le 1er juin de la periode de reference contenant date"""
+        annee = date.year if date.month >= CompteurCongesPayes._MOIS_DEBUT_PERIODE else date.year - 1
+        return datetime.date(annee, CompteurCongesPayes._MOIS_DEBUT_PERIODE, 1)
+
+    def ajouter_mois(self, mois: datetime.date, salaire_net: float) -> AcquisitionCongesPayes:
+        """Ajoute ou remplace un mois, salaire_net est le salaire declare pour ce mois
+
+        Return l'acquisition de la periode de reference du mois"""
+        cle = (mois.year, mois.month)
+        if cle in self._contributions:
+            self._retirer(self._contributions.pop(cle))
+
+        contribution = self._evaluer_mois(mois, salaire_net)
+        self._contributions[cle] = contribution
+        self._ajouter(contribution)
+        return self.get_acquisition(mois)
+
+    def get_jours_pris(self, mois: datetime.date) -> int:
+        """Return le nombre de jours de conges pris dans un mois ajoute"""
+        return self._contributions[(mois.year, mois.month)].jours_pris
+
+    def get_acquisition(self, date: datetime.date) -> AcquisitionCongesPayes:
+        """Return l'acquisition de la periode de reference contenant date, depuis les mois ajoutes"""
+        debut_periode = CompteurCongesPayes.get_debut_periode(date)
+        semaines = len(self._semaines.get(debut_periode, {}))
+        # sommes dans l'ordre des mois de la periode, independamment de l'ordre des ajouts
+        cles = [(debut_periode.year + (mois - 1) // 12, (mois - 1) % 12 + 1)
+                for mois in range(debut_periode.month, debut_periode.month + 12)]
+        contributions = [self._contributions[cle] for cle in cles if cle in self._contributions]
+        return AcquisitionCongesPayes(
+            debut_periode=debut_periode,
+            semaines_travail_effectif=semaines,
+            jours_acquis=min(math.ceil(semaines * CompteurCongesPayes._JOURS_PAR_4_SEMAINES / 4),
+                             CompteurCongesPayes._JOURS_ACQUIS_MAX),
+            jours_pris=sum(contribution.jours_pris for contribution in contributions),
+            salaire_net_periode=sum(contribution.salaire_net for contribution in contributions))
+
+    def get_indemnite(self, mois: datetime.date) -> IndemniteCongesPayes:
+        """Compare le dixieme et le maintien de salaire pour les jours pris dans un mois ajoute
+
+        Les jours sont acquis sur la periode de reference precedente, sur la periode en cours la premiere annee.
+        Maintien de salaire: salaire mensualise * jours pris / jours ouvrables du mois"""
+        jours = self.get_jours_pris(mois)
+        debut_periode = CompteurCongesPayes.get_debut_periode(mois)
+        acquisition = self.get_acquisition(debut_periode.replace(year=debut_periode.year - 1))
+        if acquisition.jours_acquis == 0:
+            acquisition = self.get_acquisition(mois)
+
+        dixieme = 0.0
+        if acquisition.jours_acquis > 0:
+            dixieme = acquisition.salaire_net_periode * CompteurCongesPayes._DIXIEME \
+                * jours / acquisition.jours_acquis
+
+        jours_ouvrables = sum(1 for date in get_calendrier_annee(mois.year).dates_par_mois[mois.month]
+                              if date.weekday() < 6)
+        maintien_salaire = self._contrat.get_salaire_net_mensualise() * jours / jours_ouvrables
+
+        return IndemniteCongesPayes(jours=jours, dixieme=dixieme, maintien_salaire=maintien_salaire,
+                                    montant=max(dixieme, maintien_salaire))
+
+    def _evaluer_mois(self, mois: datetime.date, salaire_net: float) -> _ContributionMois:
+        """Semaines de travail effectif et jours pris d'un mois, chaque jour evalue une seule fois"""
+        conges_payes_planifies = self._contrat.planning.is_annee_complete()
+        semaines: set[datetime.date] = set()
+        jours_pris = 0
+
+        for date in get_calendrier_annee(mois.year).dates_par_mois[mois.month]:
+            jour_pris = conges_payes_planifies and date.weekday() < 6 \
+                and self._contrat.planning.is_enfant_absent_par_date(date)
+            if jour_pris:
+                jours_pris += 1
+            if jour_pris or self._is_jour_travail_effectif(date):
+                semaines.add(date - datetime.timedelta(days=date.weekday()))
+
+        return _ContributionMois(debut_periode=CompteurCongesPayes.get_debut_periode(mois),
+                                 semaines_travail_effectif=frozenset(semaines),
+                                 jours_pris=jours_pris,
+                                 salaire_net=salaire_net)
+
+    def _is_jour_travail_effectif(self, date: datetime.date) -> bool:
+        """Jour de travail effectif ou assimile"""
+        jour_garde = self._contrat.garde.get_jour_garde(date)
+        if jour_garde is None or jour_garde.absence_payee:
+            return self._contrat.planning.is_jour_planifie_par_date(date)
+        if jour_garde.absence_non_remuneree:
+            return False
+        return self._contrat.garde.get_heures_travaillees_jour_par_date(date) > 0
+
+    def _ajouter(self, contribution: _ContributionMois) -> None:
+        """Ajoute les semaines d'une contribution aux compteurs"""
+        for lundi in contribution.semaines_travail_effectif:
+            # la semaine compte a la periode de son lundi, qui peut etre la periode precedente
+            semaines = self._semaines.setdefault(CompteurCongesPayes.get_debut_periode(lundi), {})
+            semaines[lundi] = semaines.get(lundi, 0) + 1
+
+    def _retirer(self, contribution: _ContributionMois) -> None:
+        """Retire les semaines d'une contribution des compteurs"""
+        for lundi in contribution.semaines_travail_effectif:
+            semaines = self._semaines[CompteurCongesPayes.get_debut_periode(lundi)]
+            semaines[lundi] -= 1
+            if semaines[lundi] == 0:
+                del semaines[lundi]
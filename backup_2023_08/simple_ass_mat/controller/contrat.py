@@ -8,19 +8,14 @@ import logging
 import datetime
 from typing import NamedTuple
 
-from . import helper
 from .planning import Planning
-from .garde import Garde
+from .garde import Garde, sommer_heures_complementaires, sommer_heures_majorees
+from .calendrier_mois import CalendrierMois, make_calendrier_mois
+from .frais_entretien import FraisEntretien, get_frais_entretien_taux_horaire
 
 logger = logging.getLogger(__name__)
 
 
-class FraisEntretien(NamedTuple):
-    """FraisEntretien namedtuple"""
-    minimum: float
-    taux_9h: float
-
-
 class IndemniteRepas(NamedTuple):
     """IndemniteRepas namedtuple"""
     dejeuner: float
@@ -58,37 +53,46 @@ class Contrat:
         """SalairesHoraires getter"""
         return self._salaires
 
+    @property
+    def indemnite_repas(self) -> IndemniteRepas:
+        """IndemniteRepas getter"""
+        return self._indemnite_repas
+
     def get_salaire_net_mensualise(self):
         """working_hour_per_month_count * net_hourly_rate"""
         return self._planning.get_heures_travaillees_mois_mensualisees() * self._salaires.horaire_net
 
-    def get_salaire_net_mois_par_date(self, date: datetime.date) -> float:
+    def get_salaire_net_mois_par_date(self, date: datetime.date, calendrier: CalendrierMois | None = None) -> float:
         """Salaire net mensuel incluant heure complementaire et heure majoree"""
+        calendrier = calendrier or make_calendrier_mois(date)
         salaire_net_mensualise = self.get_salaire_net_mensualise()
-        heure_absence_non_remuneree = self._garde.get_heure_absence_non_remuneree_mois(date)
-        heure_travaille_prevu = self._planning.get_heures_travaillees_prevu_mois_par_date(date)
+        heure_absence_non_remuneree = self._garde.get_heure_absence_non_remuneree_mois(date, calendrier)
+        heure_travaille_prevu = self._planning.get_heures_travaillees_prevu_mois_par_date(date, calendrier)
+        heures_semaines = self._garde.get_heures_semaines_mois_par_date(date, calendrier)
 
         return salaire_net_mensualise \
             - (salaire_net_mensualise * heure_absence_non_remuneree / heure_travaille_prevu) \
-            + self._garde.get_heures_complementaires_mois_par_date(date) * self._salaires.horaire_complementaires_net \
-            + self._garde.get_heures_majorees_mois_par_date(date) * self._salaires.horaire_majorees_net
+            + sommer_heures_complementaires(heures_semaines) * self._salaires.horaire_complementaires_net \
+            + sommer_heures_majorees(heures_semaines) * self._salaires.horaire_majorees_net
 
-    def get_frais_entretien_mois_par_date(self, date: datetime.date) -> float:
-        """Frais d'entretien mensuel"""
-        dates = helper.get_dates_in_month(date)
+    def get_frais_entretien_mois_par_date(self, date: datetime.date, calendrier: CalendrierMois | None = None) -> float:
+        """Frais d'entretien mensuel, calcule periode par periode de taux constant"""
+        calendrier = calendrier or make_calendrier_mois(date)
         frais_entretien_mois = 0.0
 
-        for i_date in dates:
-            h_trav = self._garde.get_heures_travaillees_jour_par_date(i_date)
-            if h_trav > 0:
-                frais_entretien_jour = self.get_frais_entretien_jour(h_trav, i_date)
-                logger.debug(f"get_frais_entretien_mois_par_date: {i_date} {h_trav} {frais_entretien_jour}")
-                frais_entretien_mois += frais_entretien_jour
+        for periode in calendrier.periodes_frais_entretien:
+            for i_date in calendrier.dates[periode.debut.day - 1:periode.fin.day]:
+                h_trav = self._garde.get_heures_travaillees_jour_par_date(i_date)
+                if h_trav > 0:
+                    frais_entretien_jour = self.get_frais_entretien_jour(h_trav, i_date, periode.frais_entretien)
+                    logger.debug(f"get_frais_entretien_mois_par_date: {i_date} {h_trav} {frais_entretien_jour}")
+                    frais_entretien_mois += frais_entretien_jour
         return frais_entretien_mois
 
-    def get_frais_entretien_jour(self, duree: float, date: datetime.date) -> float:
+    def get_frais_entretien_jour(self, duree: float, date: datetime.date,
+                                 frais_entretien: FraisEntretien | None = None) -> float:
         """Frais d'entretien journalier"""
-        frais_entretien = self.get_frais_entretien_taux_horaire(date)
+        frais_entretien = frais_entretien or self.get_frais_entretien_taux_horaire(date)
         value = 0.0
 
         if duree == 0:
@@ -102,22 +106,14 @@ class Contrat:
 
     def get_frais_entretien_taux_horaire(self, date: datetime.date) -> FraisEntretien:
         """"Get frais entretien taux horaire"""
-        frais_entretien_annuel = {datetime.date(2022, 1, 1): FraisEntretien(2.65, 3.39/9),
-                                  datetime.date(2023, 1, 1): FraisEntretien(2.65, 3.61/9),
-                                  datetime.date(2023, 5, 1): FraisEntretien(2.65, 3.69/9)}
-
-        frais_entretien = None
-        for key, value in frais_entretien_annuel.items():
-            if date >= key:
-                frais_entretien = value
-        return frais_entretien
+        return get_frais_entretien_taux_horaire(date)
 
-    def get_indemnite_repas_mois_par_date(self, date: datetime.date) -> float:
+    def get_indemnite_repas_mois_par_date(self, date: datetime.date, calendrier: CalendrierMois | None = None) -> float:
         """Get frais de repas mensuel"""
-        dates = helper.get_dates_in_month(date)
+        calendrier = calendrier or make_calendrier_mois(date)
         indemnite_repas_mois = 0.0
 
-        for i_date in dates:
+        for i_date in calendrier.dates:
             if self._garde.avec_frais_repas_dejeuner_jour_par_date(i_date):
                 indemnite_repas_mois += self._indemnite_repas.dejeuner
 
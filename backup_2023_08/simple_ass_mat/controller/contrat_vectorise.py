@@ -0,0 +1,131 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+
+import datetime
+from typing import NamedTuple
+
+import numpy as np
+
+from .contrat import Contrat
+from .calendrier_mois import CalendrierMois, make_calendrier_mois
+
+
+class TableauxMois(NamedTuple):
+    """Un mois represente par des tableaux, un element par jour"""
+    heures_prevues: np.ndarray
+    heures_realisees: np.ndarray
+    jour_planifie: np.ndarray
+    absence_non_remuneree: np.ndarray
+    dejeuner: np.ndarray
+    gouter: np.ndarray
+    frais_entretien_minimum: np.ndarray
+    frais_entretien_taux_9h: np.ndarray
+
+
+def _somme(valeurs: np.ndarray) -> float:
+    """Somme dans l'ordre des jours, identique a l'accumulation d'une boucle"""
+    if valeurs.size == 0:
+        return 0.0
+    return float(np.cumsum(valeurs)[-1])
+
+
+class ContratVectorise:
+    """Agregats mensuels d'un contrat calcules par reduction de tableaux NumPy
+
+    Fournit les memes methodes mensuelles que Planning, Garde et Contrat avec des resultats identiques.
+    Les tableaux d'un mois sont construits une seule fois puis reutilises,
+    ceux des mois dont un jour de garde a ete modifie depuis sont reconstruits.
+    """
+
+    def __init__(self, contrat: Contrat) -> None:
+        self._contrat = contrat
+        self._tableaux: dict[datetime.date, TableauxMois] = {}
+        self._version_garde = contrat.garde.version
+
+    def get_tableaux_mois(self, date: datetime.date, calendrier: CalendrierMois | None = None) -> TableauxMois:
+        """Return les tableaux du mois contenant date"""
+        calendrier = calendrier or make_calendrier_mois(date)
+        self._invalider_mois_modifies()
+        try:
+            return self._tableaux[calendrier.mois]
+        except KeyError:
+            pass
+
+        garde = self._contrat.garde
+        dates = calendrier.dates
+        tranche = self._contrat.planning.compile(date.year).get_tranche(calendrier.mois, len(dates))
+        frais_entretien = [calendrier.frais_entretien_par_date[i_date] for i_date in dates]
+
+        tableaux = TableauxMois(
+            heures_prevues=np.array(tranche.heures, dtype=float),
+            heures_realisees=np.fromiter((garde.get_heures_travaillees_jour_par_date(i_date) for i_date in dates),
+                                         dtype=float, count=len(dates)),
+            jour_planifie=np.array([jour_id is not None for jour_id in tranche.jour_ids], dtype=bool),
+            absence_non_remuneree=np.fromiter((garde.is_absence_non_remuneree_jour_par_date(i_date)
+                                               for i_date in dates), dtype=bool, count=len(dates)),
+            dejeuner=np.fromiter((garde.avec_frais_repas_dejeuner_jour_par_date(i_date) for i_date in dates),
+                                 dtype=bool, count=len(dates)),
+            gouter=np.fromiter((garde.avec_frais_repas_gouter_jour_par_date(i_date) for i_date in dates),
+                               dtype=bool, count=len(dates)),
+            frais_entretien_minimum=np.array([frais.minimum for frais in frais_entretien], dtype=float),
+            frais_entretien_taux_9h=np.array([frais.taux_9h for frais in frais_entretien], dtype=float))
+        self._tableaux[calendrier.mois] = tableaux
+        return tableaux
+
+    def _invalider_mois_modifies(self) -> None:
+        """Retire les tableaux des mois dont un jour de garde a ete modifie depuis leur construction"""
+        garde = self._contrat.garde
+        if garde.version == self._version_garde:
+            return
+        for date in garde.get_dates_modifiees_depuis(self._version_garde):
+            self._tableaux.pop(date.replace(day=1), None)
+        self._version_garde = garde.version
+
+    def get_heures_travaillees_prevu_mois_par_date(self, date: datetime.date,
+                                                   calendrier: CalendrierMois | None = None) -> float:
+        """Get working hour planned for a month by date"""
+        tableaux = self.get_tableaux_mois(date, calendrier)
+        return _somme(tableaux.heures_prevues[tableaux.jour_planifie])
+
+    def get_jours_travailles_planifies_mois_par_date(self, date: datetime.date,
+                                                     calendrier: CalendrierMois | None = None) -> int:
+        """Get working day count for a given month"""
+        return int(np.count_nonzero(self.get_tableaux_mois(date, calendrier).jour_planifie))
+
+    def get_jour_absence_non_remuneree_mois(self, date: datetime.date,
+                                            calendrier: CalendrierMois | None = None) -> int:
+        """Calculate the number of unpaid absence days for a given month"""
+        return int(np.count_nonzero(self.get_tableaux_mois(date, calendrier).absence_non_remuneree))
+
+    def get_heure_absence_non_remuneree_mois(self, date: datetime.date,
+                                             calendrier: CalendrierMois | None = None) -> float:
+        """Calculate the number of unpaid absence hours for a given month"""
+        tableaux = self.get_tableaux_mois(date, calendrier)
+        return _somme(tableaux.heures_prevues[tableaux.absence_non_remuneree])
+
+    def get_frais_entretien_mois_par_date(self, date: datetime.date,
+                                          calendrier: CalendrierMois | None = None) -> float:
+        """Frais d'entretien mensuel, voir Contrat.get_frais_entretien_jour"""
+        tableaux = self.get_tableaux_mois(date, calendrier)
+        travaille = tableaux.heures_realisees > 0
+        duree = tableaux.heures_realisees[travaille]
+        taux_9h = tableaux.frais_entretien_taux_9h[travaille]
+        minimum = tableaux.frais_entretien_minimum[travaille]
+
+        frais_entretien_jour = np.where(duree <= 9.0,
+                                        np.maximum(duree * taux_9h, minimum),
+                                        9 * taux_9h + (duree - 9) * taux_9h)
+        # round jour par jour comme Contrat.get_frais_entretien_jour, np.round arrondit les demis differemment
+        return _somme(np.array([round(float(valeur), 2) for valeur in frais_entretien_jour], dtype=float))
+
+    def get_indemnite_repas_mois_par_date(self, date: datetime.date,
+                                          calendrier: CalendrierMois | None = None) -> float:
+        """Get frais de repas mensuel"""
+        tableaux = self.get_tableaux_mois(date, calendrier)
+        indemnite_repas = self._contrat.indemnite_repas
+        # dejeuner puis gouter pour chaque jour, dans l'ordre de la boucle
+        indemnites_jour = np.column_stack((np.where(tableaux.dejeuner, indemnite_repas.dejeuner, 0.0),
+                                           np.where(tableaux.gouter, indemnite_repas.gouter, 0.0)))
+        return _somme(indemnites_jour.ravel())
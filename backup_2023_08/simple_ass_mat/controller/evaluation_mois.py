@@ -0,0 +1,199 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+# pylint: disable=too-many-instance-attributes
+
+import datetime
+from typing import NamedTuple
+
+from .contrat import Contrat
+from .garde import HeuresSemaine, evaluer_heures_semaine
+from .calendrier_mois import CalendrierMois, make_calendrier_mois
+
+
+class EvaluationJour(NamedTuple):
+    """Quantites d'un jour, evaluees une seule fois"""
+    heures_prevues: float
+    heures_realisees: float
+
+
+class ContributionJour(NamedTuple):
+    """Contribution d'un jour du mois aux totaux du mois"""
+    planifie: bool
+    absence_non_remuneree: bool
+    frais_entretien: float | None
+    dejeuner: bool
+    gouter: bool
+
+
+class EvaluationMois:
+    """Evaluation d'un contrat pour un mois
+
+    Chaque jour du mois (et des semaines a cheval sur le mois) est evalue une seule fois,
+    tous les champs de la declaration sont ensuite servis depuis ces valeurs.
+
+    Apres modification de la garde, mettre_a_jour evalue de nouveau les jours modifies et leurs semaines,
+    les totaux du mois sont refaits depuis les valeurs conservees, dans le meme ordre qu'une evaluation complete.
+    """
+
+    def __init__(self, contrat: Contrat, mois: datetime.date, calendrier: CalendrierMois | None = None) -> None:
+        self._contrat = contrat
+        self._mois = mois
+        self._calendrier = calendrier or make_calendrier_mois(mois)
+        self._jours: dict[datetime.date, EvaluationJour] = {}
+        self._contributions: dict[datetime.date, ContributionJour] = {}
+        self._semaines: dict[int, HeuresSemaine] = {}
+        self._version_garde = contrat.garde.version
+
+        self._semaines_par_date: dict[datetime.date, list[int]] = {}
+        for numero_semaine in self._calendrier.numeros_semaine:
+            for date in self._calendrier.dates_par_semaine[numero_semaine]:
+                self._semaines_par_date.setdefault(date, []).append(numero_semaine)
+
+        self.heures_travaillees_prevu: float = 0.0
+        self.jours_travailles_planifies: int = 0
+        self.jour_absence_non_remuneree: int = 0
+        self.heure_absence_non_remuneree: float = 0.0
+        self.frais_entretien: float = 0.0
+        self.indemnite_repas: float = 0.0
+        self.heures_complementaires: float = 0.0
+        self.heures_majorees: float = 0.0
+        self.salaire_net: float = 0.0
+
+        self._evaluer()
+
+    @property
+    def calendrier(self) -> CalendrierMois:
+        """Return le calendrier du mois evalue"""
+        return self._calendrier
+
+    def has_heures_complementaires(self) -> bool:
+        """Check if there are complementary hours"""
+        return self.heures_complementaires > 0.0
+
+    def has_jour_absence_non_remuneree(self) -> bool:
+        """Check if there are unpaid absence days"""
+        return self.jour_absence_non_remuneree > 0
+
+    def mettre_a_jour(self) -> bool:
+        """Prend en compte les jours de garde modifies depuis la derniere evaluation
+
+        Return True si un jour du mois ou de ses semaines a ete modifie"""
+        garde = self._contrat.garde
+        dates = garde.get_dates_modifiees_depuis(self._version_garde)
+        self._version_garde = garde.version
+
+        modifie = False
+        for date in dates:
+            if date not in self._semaines_par_date and date not in self._contributions:
+                continue
+            modifie = True
+            self._jours.pop(date, None)
+            self._contributions.pop(date, None)
+            for numero_semaine in self._semaines_par_date.get(date, []):
+                self._semaines.pop(numero_semaine, None)
+
+        if modifie:
+            self._evaluer()
+        return modifie
+
+    def _evaluer(self) -> None:
+        """Evalue les jours et semaines manquants puis les totaux du mois"""
+        for date in self._calendrier.dates:
+            if date not in self._contributions:
+                self._contributions[date] = self._evaluer_contribution(date)
+
+        for numero_semaine in self._calendrier.numeros_semaine:
+            if numero_semaine not in self._semaines:
+                self._semaines[numero_semaine] = self._evaluer_semaine(numero_semaine)
+
+        self._totaliser()
+
+    def _evaluer_jour(self, date: datetime.date) -> EvaluationJour:
+        """Evalue un jour, une seule fois"""
+        try:
+            return self._jours[date]
+        except KeyError:
+            pass
+
+        heures_prevues = self._contrat.planning.get_heures_travaillees_jour_par_date(date)
+        heures_realisees = self._contrat.garde.get_heures_travaillees_jour_par_date(date)
+        evaluation_jour = EvaluationJour(heures_prevues=heures_prevues, heures_realisees=heures_realisees)
+        self._jours[date] = evaluation_jour
+        return evaluation_jour
+
+    def _evaluer_contribution(self, date: datetime.date) -> ContributionJour:
+        """Contribution d'un jour du mois"""
+        garde = self._contrat.garde
+        evaluation_jour = self._evaluer_jour(date)
+
+        frais_entretien = None
+        if evaluation_jour.heures_realisees > 0:
+            frais_entretien = self._contrat.get_frais_entretien_jour(
+                evaluation_jour.heures_realisees, date, self._calendrier.frais_entretien_par_date[date])
+
+        return ContributionJour(planifie=self._contrat.planning.is_jour_planifie_par_date(date),
+                                absence_non_remuneree=garde.is_absence_non_remuneree_jour_par_date(date),
+                                frais_entretien=frais_entretien,
+                                dejeuner=garde.avec_frais_repas_dejeuner_jour_par_date(date),
+                                gouter=garde.avec_frais_repas_gouter_jour_par_date(date))
+
+    def _evaluer_semaine(self, numero_semaine: int) -> HeuresSemaine:
+        """Heures d'une semaine, depuis les jours evalues"""
+        dates = self._calendrier.dates_par_semaine[numero_semaine]
+        h_trav_prevu_semaine = self._contrat.planning.get_heures_travaillees_semaine_par_date(
+            self._mois.year, numero_semaine, dates)
+        return evaluer_heures_semaine(
+            h_trav_prevu_semaine,
+            ((evaluation_jour.heures_prevues, evaluation_jour.heures_realisees)
+             for evaluation_jour in map(self._evaluer_jour, dates)),
+            dates[0])
+
+    def _totaliser(self) -> None:
+        """Totaux du mois depuis les jours et semaines evalues"""
+        indemnite_repas = self._contrat.indemnite_repas
+
+        self.heures_travaillees_prevu = 0.0
+        self.jours_travailles_planifies = 0
+        self.jour_absence_non_remuneree = 0
+        self.heure_absence_non_remuneree = 0.0
+        self.frais_entretien = 0.0
+        self.indemnite_repas = 0.0
+        for date in self._calendrier.dates:
+            evaluation_jour = self._jours[date]
+            contribution = self._contributions[date]
+
+            if contribution.planifie:
+                self.heures_travaillees_prevu += evaluation_jour.heures_prevues
+                self.jours_travailles_planifies += 1
+
+            if contribution.absence_non_remuneree:
+                self.jour_absence_non_remuneree += 1
+                self.heure_absence_non_remuneree += evaluation_jour.heures_prevues
+
+            if contribution.frais_entretien is not None:
+                self.frais_entretien += contribution.frais_entretien
+
+            if contribution.dejeuner:
+                self.indemnite_repas += indemnite_repas.dejeuner
+            if contribution.gouter:
+                self.indemnite_repas += indemnite_repas.gouter
+
+        self.heures_complementaires = 0.0
+        self.heures_majorees = 0.0
+        for numero_semaine in self._calendrier.numeros_semaine:
+            self.heures_complementaires += self._semaines[numero_semaine].heures_complementaires
+            self.heures_majorees += self._semaines[numero_semaine].heures_majorees
+
+        self.salaire_net = self._evaluer_salaire_net()
+
+    def _evaluer_salaire_net(self) -> float:
+        """Salaire net mensuel incluant heure complementaire et heure majoree"""
+        salaires = self._contrat.salaires_horaires
+        salaire_net_mensualise = self._contrat.get_salaire_net_mensualise()
+
+        return salaire_net_mensualise \
+            - (salaire_net_mensualise * self.heure_absence_non_remuneree / self.heures_travaillees_prevu) \
+            + self.heures_complementaires * salaires.horaire_complementaires_net \
+            + self.heures_majorees * salaires.horaire_majorees_net
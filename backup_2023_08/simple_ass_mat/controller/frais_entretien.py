@@ -0,0 +1,96 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+
+import bisect
+import datetime
+import functools
+from typing import NamedTuple
+
+from simple_ass_mat.model.parametres import RegistreParametres, get_registre_parametres
+
+
+class FraisEntretien(NamedTuple):
+    """FraisEntretien namedtuple"""
+    minimum: float
+    taux_9h: float
+
+
+class PeriodeFraisEntretien(NamedTuple):
+    """Periode ou un meme taux de frais d'entretien s'applique, debut et fin inclus"""
+    debut: datetime.date
+    fin: datetime.date
+    frais_entretien: FraisEntretien | None
+
+
+class TableFraisEntretien:
+    """Taux de frais d'entretien par date d'effet, recherche par bisection sur les dates d'effet
+
+    Un taux s'applique de sa date d'effet jusqu'a la date d'effet suivante, aucun taux avant la premiere."""
+
+    def __init__(self, taux: dict[datetime.date, FraisEntretien], version: str) -> None:
+        self._version = version
+        self._dates = sorted(taux)
+        self._taux = [taux[date] for date in self._dates]
+
+    @property
+    def version(self) -> str:
+        """Version de la table"""
+        return self._version
+
+    def get_taux(self, date: datetime.date) -> FraisEntretien | None:
+        """Taux applicable a une date, None avant la premiere date d'effet"""
+        index = bisect.bisect_right(self._dates, date)
+        return self._taux[index - 1] if index > 0 else None
+
+    def get_periodes(self, debut: datetime.date, fin: datetime.date) -> list[PeriodeFraisEntretien]:
+        """Periodes de taux constant couvrant debut..fin inclus, dans l'ordre des dates"""
+        periodes = []
+        index = bisect.bisect_right(self._dates, debut)
+        debut_periode = debut
+        while debut_periode <= fin:
+            fin_periode = fin
+            if index < len(self._dates):
+                fin_periode = min(fin, self._dates[index] - datetime.timedelta(days=1))
+            periodes.append(PeriodeFraisEntretien(debut=debut_periode,
+                                                  fin=fin_periode,
+                                                  frais_entretien=self._taux[index - 1] if index > 0 else None))
+            debut_periode = fin_periode + datetime.timedelta(days=1)
+            index += 1
+        return periodes
+
+
+def charger_table_frais_entretien(data: dict) -> TableFraisEntretien:
+    """Construit une table depuis des donnees chargees, par exemple d'un fichier yaml:
+    {'version': '2023-05', 'taux': {'2023-05-01': {'minimum': 2.65, 'taux_9h': 3.69}}}
+    taux_9h est le montant pour 9 heures de garde"""
+    taux = {}
+    for date, frais in data['taux'].items():
+        if not isinstance(date, datetime.date):
+            date = datetime.date.fromisoformat(str(date))
+        taux[date] = FraisEntretien(minimum=float(frais['minimum']), taux_9h=float(frais['taux_9h'])/9)
+    return TableFraisEntretien(taux, version=str(data['version']))
+
+
+@functools.lru_cache(maxsize=1)
+def make_table_frais_entretien(registre: RegistreParametres) -> TableFraisEntretien:
+    """Table des taux du registre des parametres legaux, une date d'effet par changement de taux"""
+    taux: dict[datetime.date, FraisEntretien] = {}
+    precedent = None
+    for periode in registre.get_periodes():
+        frais_entretien = FraisEntretien(periode.frais_entretien_minimum, periode.frais_entretien_9h/9)
+        if frais_entretien != precedent:
+            taux[periode.date_effet] = frais_entretien
+            precedent = frais_entretien
+    return TableFraisEntretien(taux, version=max(taux).isoformat())
+
+
+def get_table_frais_entretien() -> TableFraisEntretien:
+    """Table des taux du registre des parametres legaux"""
+    return make_table_frais_entretien(get_registre_parametres())
+
+
+def get_frais_entretien_taux_horaire(date: datetime.date, table: TableFraisEntretien | None = None) -> FraisEntretien:
+    """Get frais entretien taux horaire applicable a une date, table du registre si table est None"""
+    return (table or get_table_frais_entretien()).get_taux(date)
@@ -6,62 +6,170 @@
 
 import logging
 import datetime
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from simple_ass_mat.model.parametres import get_registre_parametres
 
 from . import helper
 from .planning import Planning
+from .calendrier_mois import CalendrierMois, make_calendrier_mois
 
 logger = logging.getLogger(__name__)
 
 
+class JourGarde(NamedTuple):
+    """Garde réalisée pour un jour, None si l'information n'est pas renseignée"""
+    absence_payee: bool | None = None
+    absence_non_remuneree: bool | None = None
+    heures: float | None = None
+    dejeuner: bool | None = None
+    gouter: bool | None = None
+
+
+class HeuresSemaine(NamedTuple):
+    """Heures d'une semaine, chaque jour evalue une seule fois
+    heures_complementaires + heures_majorees: heures realisees au dela du planning, jour par jour"""
+    heures_prevues: float
+    heures_realisees: float
+    heures_complementaires: float
+    heures_majorees: float
+
+
+def make_jour_garde(jour: dict) -> JourGarde:
+    """Convertit les données d'un jour en JourGarde, les horaires sont convertis en heures"""
+    heures = None
+    if 'heures' in jour:
+        heures = helper.convert_minutes_to_hours(helper.convert_time_ranges_to_minutes(jour['heures']))
+
+    return JourGarde(absence_payee=jour.get('absence_payee'),
+                     absence_non_remuneree=jour.get('absence_non_remuneree'),
+                     heures=heures,
+                     dejeuner=jour.get('dejeuner'),
+                     gouter=jour.get('gouter'))
+
+
+def evaluer_heures_semaine(h_trav_prevu_semaine: float, heures_jours: Iterable[tuple[float, float]],
+                           date: datetime.date) -> HeuresSemaine:
+    """Heures d'une semaine depuis les heures prevues et realisees de chacun de ses jours
+
+    Regle des heures complementaires et majorees de la semaine, au seuil en vigueur a date,
+    commune a Garde, EvaluationMois et la regularisation annuelle"""
+    h_trav_realisee_semaine: float = 0.0
+    h_comp_and_maj_semaine: float = 0.0
+    for h_trav_prevu_jour, h_trav_realisee_jour in heures_jours:
+        h_trav_realisee_semaine += h_trav_realisee_jour
+        h_comp_and_maj_semaine += max(h_trav_realisee_jour - h_trav_prevu_jour, 0)  # cannot be negative
+
+    h_comp_semaine = plafonner_heures_complementaires(h_trav_prevu_semaine, h_comp_and_maj_semaine,
+                                                      get_seuil_heures_majorees(date))
+
+    return HeuresSemaine(heures_prevues=h_trav_prevu_semaine,
+                         heures_realisees=h_trav_realisee_semaine,
+                         heures_complementaires=h_comp_semaine,
+                         heures_majorees=h_comp_and_maj_semaine - h_comp_semaine)
+
+
+def get_seuil_heures_majorees(date: datetime.date) -> float:
+    """Seuil hebdomadaire des heures majorees en vigueur a une date"""
+    return get_registre_parametres().get_parametres(date).seuil_heures_majorees
+
+
+def plafonner_heures_complementaires(h_trav_prevu_semaine: float, h_comp_semaine: float, seuil: float) -> float:
+    """Heures complementaires d'une semaine, limitees au seuil des heures majorees
+    h_comp_semaine: somme des heures realisees au dela du planning sur la semaine"""
+    return max(min(h_trav_prevu_semaine + h_comp_semaine, seuil) - h_trav_prevu_semaine, 0)
+
+
+def sommer_heures_complementaires(heures_semaines: Iterable[HeuresSemaine]) -> float:
+    """Somme des heures complementaires des semaines"""
+    h_comp_mois: float = 0.0
+    for heures_semaine in heures_semaines:
+        h_comp_mois += heures_semaine.heures_complementaires
+    return h_comp_mois
+
+
+def sommer_heures_majorees(heures_semaines: Iterable[HeuresSemaine]) -> float:
+    """Somme des heures majorees des semaines"""
+    h_maj_mois: float = 0.0
+    for heures_semaine in heures_semaines:
+        h_maj_mois += heures_semaine.heures_majorees
+    return h_maj_mois
+
+
 class Garde:
     """Informations de garde réalisée, heure, gouter, repas, ..."""
 
-    _HEURE_COMPLEMENTAIRE_SEUIL = 45
-
     garde_info_t = dict[str, dict[str, str]]
 
     def __init__(self, garde: garde_info_t, planning: Planning) -> None:
-        self._garde = garde
+        self._jours = Garde._make_jours_garde(garde)
         self._planning = planning
+        # dates modifiees depuis la construction, dans l'ordre des modifications
+        self._journal: list[datetime.date] = []
+
+    @staticmethod
+    def _make_jours_garde(garde: garde_info_t) -> dict[datetime.date, JourGarde]:
+        """Convertit les données annee/mois/jour en un JourGarde par date"""
+        jours: dict[datetime.date, JourGarde] = {}
+
+        for year_str, mois in (garde or {}).items():
+            for month_str, jours_mois in (mois or {}).items():
+                for day_str, jour in (jours_mois or {}).items():
+                    date = datetime.date(int(year_str), int(month_str), int(day_str))
+                    jours[date] = make_jour_garde(jour or {})
+        return jours
+
+    def get_jour_garde(self, date: datetime.date) -> JourGarde | None:
+        """Return la garde réalisée pour un jour, None si non renseignée"""
+        return self._jours.get(date)
+
+    def ajouter_jours_garde(self, jours: Iterable[tuple[datetime.date, dict]]) -> None:
+        """Ajoute ou remplace des jours de garde, lus par exemple en flux depuis un fichier
+
+        Les jours sont convertis un par un, l'itérable n'est pas conservé."""
+        for date, jour in jours:
+            self.modifier_jour_garde(date, jour)
+
+    def modifier_jour_garde(self, date: datetime.date, jour: dict | None) -> None:
+        """Ajoute ou remplace un jour de garde, None supprime le jour et revient au planning"""
+        if jour is None:
+            self._jours.pop(date, None)
+        else:
+            self._jours[date] = make_jour_garde(jour)
+        self._journal.append(date)
+
+    @property
+    def version(self) -> int:
+        """Nombre de modifications depuis la construction"""
+        return len(self._journal)
+
+    def get_dates_modifiees_depuis(self, version: int) -> list[datetime.date]:
+        """Return les dates modifiees depuis version, dans l'ordre des modifications"""
+        return self._journal[version:]
 
     def get_heures_travaillees_jour_par_date(self, date: datetime.date) -> float:
         """Nombre heures travaillees en un jour par date"""
-        year_str = date.strftime('%Y')
-        month_str = date.strftime('%m')
-        day_str = date.strftime('%d')
-        garde_day = None
-        heures_travaillees_jour = 0.0
-
-        try:
-            garde_day = self._garde[year_str][month_str][day_str]
-        except (KeyError, TypeError):
+        heures_travaillees_jour = Garde._get_heures_realisees(self._jours.get(date))
+
+        if heures_travaillees_jour is None:
             # no information from garde data, use planning value
             heures_travaillees_jour = self._planning.get_heures_travaillees_jour_par_date(date)
-        else:
-            try:
-                if garde_day['absence_payee']:
-                    logger.debug(f"heures_travaillees_jour: {date} = {heures_travaillees_jour}")
-                    return 0.0
-            except KeyError:
-                pass
-
-            try:
-                if garde_day['absence_non_remuneree']:
-                    logger.debug(f"heures_travaillees_jour: {date} = {heures_travaillees_jour}")
-                    return 0.0
-            except KeyError:
-                pass
-
-            try:
-                time_range = garde_day['heures']
-                duration = helper.convert_time_ranges_to_duration(time_range)
-                heures_travaillees_jour = duration.seconds / 3600.0
-            except KeyError:
-                pass
 
         logger.debug(f"heures_travaillees_jour: {date} = {heures_travaillees_jour}")
         return heures_travaillees_jour
 
+    @staticmethod
+    def _get_heures_realisees(jour_garde: JourGarde | None) -> float | None:
+        """Heures realisees d'un jour de garde, None si le jour suit le planning"""
+        if jour_garde is None:
+            return None
+        if jour_garde.absence_payee or jour_garde.absence_non_remuneree:
+            return 0.0
+        if jour_garde.heures is not None:
+            return jour_garde.heures
+        return 0.0
+
     def get_heures_complementaires_jour_par_date(self, date: datetime.date) -> float:
         """Calculate the number of complementary hours for a given day
         Heure prévu - heure réalisée"""
@@ -69,130 +177,106 @@ class Garde:
         h_trav_realisee_jour = self.get_heures_travaillees_jour_par_date(date)
         return max(h_trav_realisee_jour - h_trav_prevu_jour, 0)  # cannot be negative
 
-    def get_heures_complementaires_semaine_par_date(self, annee: int, numero_semaine: int) -> float:
-        """Calculate the number of complementary hours for a given week"""
-        h_comp_semaine: float = 0.0
-        dates = helper.get_dates_in_week(annee, numero_semaine)
+    def get_heures_semaine_par_date(self, annee: int, numero_semaine: int,
+                                    dates: list[datetime.date] | None = None) -> HeuresSemaine:
+        """Heures prevues, realisees, complementaires et majorees d'une semaine, en un seul parcours des jours"""
+        dates = dates or helper.get_dates_in_week(annee, numero_semaine)
+        heures_jours: list[tuple[float, float]] = []
 
         for date_ in dates:
-            h_comp_semaine += self.get_heures_complementaires_jour_par_date(date_)
-
-        h_trav_prevu_semaine = self._planning. get_heures_travaillees_semaine_par_date(annee, numero_semaine)
-
-        return max(
-            min(h_trav_prevu_semaine + h_comp_semaine, Garde._HEURE_COMPLEMENTAIRE_SEUIL) - h_trav_prevu_semaine,
-            0)
+            h_trav_prevu_jour = self._planning.get_heures_travaillees_jour_par_date(date_)
+            h_trav_realisee_jour = Garde._get_heures_realisees(self._jours.get(date_))
+            if h_trav_realisee_jour is None:
+                h_trav_realisee_jour = h_trav_prevu_jour
+            heures_jours.append((h_trav_prevu_jour, h_trav_realisee_jour))
+
+        h_trav_prevu_semaine = self._planning.get_heures_travaillees_semaine_par_date(annee, numero_semaine, dates)
+        return evaluer_heures_semaine(h_trav_prevu_semaine, heures_jours, dates[0])
+
+    def get_heures_semaines_mois_par_date(self, date: datetime.date,
+                                          calendrier: CalendrierMois | None = None) -> list[HeuresSemaine]:
+        """Heures de chaque semaine du mois, dans l'ordre des semaines"""
+        calendrier = calendrier or make_calendrier_mois(date)
+        return [self.get_heures_semaine_par_date(date.year, week_number, calendrier.dates_par_semaine[week_number])
+                for week_number in calendrier.numeros_semaine]
+
+    def get_heures_complementaires_semaine_par_date(self, annee: int, numero_semaine: int,
+                                                    dates: list[datetime.date] | None = None) -> float:
+        """Calculate the number of complementary hours for a given week"""
+        return self.get_heures_semaine_par_date(annee, numero_semaine, dates).heures_complementaires
 
-    def get_heures_complementaires_mois_par_date(self, date: datetime.date) -> float:
+    def get_heures_complementaires_mois_par_date(self, date: datetime.date,
+                                                 calendrier: CalendrierMois | None = None) -> float:
         """Calculate the number of complementary hours for a given month"""
-        h_comp_mois: float = 0.0
-        week_numbers = helper.get_week_numbers(date.year, date.month)
-
-        for week_number in week_numbers:
-            h_comp_mois += self.get_heures_complementaires_semaine_par_date(date.year, week_number)
-        return h_comp_mois
+        return sommer_heures_complementaires(self.get_heures_semaines_mois_par_date(date, calendrier))
 
-    def has_heures_complementaires_mois(self, date: datetime.date) -> bool:
+    def has_heures_complementaires_mois(self, date: datetime.date, calendrier: CalendrierMois | None = None) -> bool:
         """Check if there are complementary hours for a given month"""
-        return self.get_heures_complementaires_mois_par_date(date) > 0.0
+        return self.get_heures_complementaires_mois_par_date(date, calendrier) > 0.0
 
-    def get_heures_majorees_semaine_par_date(self, annee: int, numero_semaine: int) -> float:
+    def get_heures_majorees_semaine_par_date(self, annee: int, numero_semaine: int,
+                                             dates: list[datetime.date] | None = None) -> float:
         """Calculate the number of additional hours for a given week"""
-        h_comp_and_maj_semaine: float = 0.0
-        dates = helper.get_dates_in_week(annee, numero_semaine)
-
-        for date_ in dates:
-            h_comp_and_maj_semaine += self.get_heures_complementaires_jour_par_date(date_)
-
-        h_comp_semaine = self.get_heures_complementaires_semaine_par_date(annee, numero_semaine)
+        return self.get_heures_semaine_par_date(annee, numero_semaine, dates).heures_majorees
 
-        return h_comp_and_maj_semaine - h_comp_semaine
-
-    def get_heures_majorees_mois_par_date(self, date: datetime.date) -> float:
+    def get_heures_majorees_mois_par_date(self, date: datetime.date, calendrier: CalendrierMois | None = None) -> float:
         """Calculate the number of additional hours for a given month"""
-        h_maj_mois: float = 0.0
-        week_numbers = helper.get_week_numbers(date.year, date.month)
-
-        for week_number in week_numbers:
-            h_maj_mois += self.get_heures_majorees_semaine_par_date(date.year, week_number)
-        return h_maj_mois
+        return sommer_heures_majorees(self.get_heures_semaines_mois_par_date(date, calendrier))
 
-    def has_jour_absence_non_remuneree_mois(self, date: datetime.date) -> bool:
+    def has_jour_absence_non_remuneree_mois(self, date: datetime.date,
+                                            calendrier: CalendrierMois | None = None) -> bool:
         """Check if there are unpaid absence days for a given day"""
-        return self.get_jour_absence_non_remuneree_mois(date) > 0
+        return self.get_jour_absence_non_remuneree_mois(date, calendrier) > 0
 
-    def get_jour_absence_non_remuneree_mois(self, date: datetime.date) -> int:
+    def get_jour_absence_non_remuneree_mois(self, date: datetime.date,
+                                            calendrier: CalendrierMois | None = None) -> int:
         """Calculate the number of unpaid absence days for a given month"""
+        calendrier = calendrier or make_calendrier_mois(date)
         jour_count: int = 0
-        dates = helper.get_dates_in_month(date)
-
-        for i_date in dates:
-            year_str = i_date.strftime('%Y')
-            month_str = i_date.strftime('%m')
-            day_str = i_date.strftime('%d')
-            try:
-                if self._garde[year_str][month_str][day_str]['absence_non_remuneree']:
-                    jour_count += 1
-            except (KeyError, TypeError):
-                pass
+
+        for i_date in calendrier.dates:
+            if self.is_absence_non_remuneree_jour_par_date(i_date):
+                jour_count += 1
 
         return jour_count
 
-    def get_heure_absence_non_remuneree_mois(self, date: datetime.date) -> float:
+    def is_absence_non_remuneree_jour_par_date(self, date: datetime.date) -> bool:
+        """Check if the given day is an unpaid absence"""
+        jour_garde = self._jours.get(date)
+        return jour_garde is not None and bool(jour_garde.absence_non_remuneree)
+
+    def get_heure_absence_non_remuneree_mois(self, date: datetime.date,
+                                             calendrier: CalendrierMois | None = None) -> float:
         """Calculate the number of unpaid absence hours for a given month"""
+        calendrier = calendrier or make_calendrier_mois(date)
         heure_count: float = 0.0
-        dates = helper.get_dates_in_month(date)
-
-        for i_date in dates:
-            year_str = i_date.strftime('%Y')
-            month_str = i_date.strftime('%m')
-            day_str = i_date.strftime('%d')
-            try:
-                if self._garde[year_str][month_str][day_str]['absence_non_remuneree']:
-                    heure_count += self._planning.get_heures_travaillees_jour_par_date(i_date)
-            except (KeyError, TypeError):
-                pass
+
+        for i_date in calendrier.dates:
+            if self.is_absence_non_remuneree_jour_par_date(i_date):
+                heure_count += self._planning.get_heures_travaillees_jour_par_date(i_date)
 
         return heure_count
 
     def avec_frais_repas_dejeuner_jour_par_date(self, date: datetime.date) -> bool:
         """Check if there are lunch costs for a given day"""
-        year_str = date.strftime('%Y')
-        month_str = date.strftime('%m')
-        day_str = date.strftime('%d')
-
-        jour_garde = None
+        jour_garde = self._jours.get(date)
 
-        try:
-            jour_garde = self._garde[year_str][month_str][day_str]
-        except (KeyError, TypeError):
+        if jour_garde is None:
             return self._planning.avec_frais_repas_dejeuner_jour_par_date(date)
-
-        if 'absence_payee' in jour_garde:
-            return False
-        if 'absence_non_remuneree' in jour_garde:
+        if jour_garde.absence_payee is not None or jour_garde.absence_non_remuneree is not None:
             return False
-        if 'dejeuner' in jour_garde:
-            return jour_garde['dejeuner']
+        if jour_garde.dejeuner is not None:
+            return jour_garde.dejeuner
         return self._planning.avec_frais_repas_dejeuner_jour_par_date(date)
 
     def avec_frais_repas_gouter_jour_par_date(self, date: datetime.date) -> bool:
         """Check if there are snack costs for a given day"""
-        year_str = date.strftime('%Y')
-        month_str = date.strftime('%m')
-        day_str = date.strftime('%d')
-
-        jour_garde = None
+        jour_garde = self._jours.get(date)
 
-        try:
-            jour_garde = self._garde[year_str][month_str][day_str]
-        except (KeyError, TypeError):
+        if jour_garde is None:
             return self._planning.avec_frais_repas_gouter_jour_par_date(date)
-
-        if 'absence_payee' in jour_garde:
-            return False
-        if 'absence_non_remuneree' in jour_garde:
+        if jour_garde.absence_payee is not None or jour_garde.absence_non_remuneree is not None:
             return False
-        if 'gouter' in jour_garde:
-            return jour_garde['gouter']
+        if jour_garde.gouter is not None:
+            return jour_garde.gouter
         return self._planning.avec_frais_repas_dejeuner_jour_par_date(date)
@@ -0,0 +1,60 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+# pylint: disable=too-few-public-methods
+
+import datetime
+import locale
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+from .contrat import Contrat
+from .calendrier_mois import CalendrierMois, make_calendrier_mois
+from .pajemploi_declaration import PajemploiDeclaration, Declaration
+
+
+def _init_processus(locale_courante: str) -> None:
+    """Applique la locale du processus parent (noms des jours) au processus fils"""
+    locale.setlocale(locale.LC_ALL, locale_courante)
+
+
+def _get_declarations(contrats: list[Contrat], mois_courant: datetime.date, today: datetime.date,
+                      calendrier: CalendrierMois) -> list[Declaration]:
+    """Calcule les declarations d'un lot de contrats avec un calendrier partage"""
+    return [PajemploiDeclaration(contrat).get_declaration(mois_courant, today, calendrier) for contrat in contrats]
+
+
+class PajemploiDeclarationBatch:
+    """Calcule les declarations Pajemploi de plusieurs contrats pour un meme mois
+
+    Le calendrier du mois (dates, numeros de semaine, taux de frais d'entretien)
+    est calcule une seule fois pour tous les contrats.
+    """
+
+    def __init__(self, contrats: Iterable[Contrat]):
+        self._contrats = list(contrats)
+
+    def get_declarations(self, mois_courant: datetime.date, today: datetime.date,
+                         processus: int | None = 1, taille_lot: int = 64) -> list[Declaration]:
+        """Return les declarations dans l'ordre des contrats
+
+        processus: nombre de processus, 1 calcule dans le processus courant, None utilise tous les coeurs
+        taille_lot: nombre de contrats envoyes a un processus en une fois
+        """
+        if taille_lot < 1:
+            raise ValueError(f"taille_lot must be at least 1: {taille_lot}")
+
+        calendrier = make_calendrier_mois(mois_courant)
+
+        if processus == 1 or len(self._contrats) <= taille_lot:
+            return _get_declarations(self._contrats, mois_courant, today, calendrier)
+
+        lots = [self._contrats[index:index + taille_lot] for index in range(0, len(self._contrats), taille_lot)]
+        declarations = []
+        with ProcessPoolExecutor(max_workers=processus, initializer=_init_processus,
+                                 initargs=(locale.setlocale(locale.LC_ALL),)) as executor:
+            futures = [executor.submit(_get_declarations, lot, mois_courant, today, calendrier) for lot in lots]
+            for future in futures:
+                declarations.extend(future.result())
+        return declarations
@@ -11,6 +11,9 @@ import math
 from typing import NamedTuple
 
 from .contrat import Contrat
+from .calendrier_mois import CalendrierMois
+from .conges_payes import CompteurCongesPayes
+from .evaluation_mois import EvaluationMois
 
 logger = logging.getLogger(__name__)
 
@@ -56,76 +59,103 @@ class Declaration(NamedTuple):
 
 
 class PajemploiDeclaration:
-    """Format data pour la declaration Pajemploi"""
+    """Format data pour la declaration Pajemploi
+
+    L'evaluation de chaque mois est conservee, une nouvelle declaration du meme mois
+    n'evalue de nouveau que les jours de garde modifies entre temps et leurs semaines.
+    Chaque mois declare met a jour l'acquisition des conges payes du contrat.
+    """
 
     def __init__(self, contrat: Contrat):
         self._contrat = contrat
+        self._evaluations: dict[tuple[int, int], EvaluationMois] = {}
+        self._conges_payes = CompteurCongesPayes(contrat)
+
+    @property
+    def conges_payes(self) -> CompteurCongesPayes:
+        """Acquisition des conges payes sur les mois declares"""
+        return self._conges_payes
+
+    def get_declaration(self, mois_courant: datetime.date, today: datetime.date,
+                        calendrier: CalendrierMois | None = None) -> Declaration:
+        """Make PajemploiData
 
-    def get_declaration(self, mois_courant: datetime.date, today: datetime.date) -> Declaration:
-        """Make PajemploiData"""
+        calendrier: calendrier du mois courant, partage entre plusieurs declarations si fourni"""
 
-        indemnites_complementaires = self._get_indemnites_complementaires(mois_courant)
+        evaluation = self._get_evaluation(mois_courant, calendrier)
+        self._conges_payes.ajouter_mois(mois_courant, evaluation.salaire_net)
+        indemnites_complementaires = self._get_indemnites_complementaires(evaluation)
         avec_indemnite_repas_ou_kilometrique = indemnites_complementaires.indemnite_repas > 0
 
         return Declaration(
-            travail_effectue=self._get_travail_effectue(mois_courant, today),
-            remuneration=self._get_remuneration(mois_courant, avec_indemnite_repas_ou_kilometrique),
-            heures_majorees_ou_complementaires=self._get_heures_majorees_ou_complementaires(mois_courant),
+            travail_effectue=self._get_travail_effectue(mois_courant, today, evaluation),
+            remuneration=self._get_remuneration(evaluation, avec_indemnite_repas_ou_kilometrique),
+            heures_majorees_ou_complementaires=self._get_heures_majorees_ou_complementaires(evaluation),
             indemnites_complementaires=indemnites_complementaires
         )
 
-    def _get_travail_effectue(self, mois_courant: datetime.date, today: datetime.date) -> TravailEffectue:
+    def _get_evaluation(self, mois_courant: datetime.date, calendrier: CalendrierMois | None) -> EvaluationMois:
+        """Evaluation du mois, mise a jour des jours de garde modifies"""
+        mois = (mois_courant.year, mois_courant.month)
+        evaluation = self._evaluations.get(mois)
+        if evaluation is None:
+            evaluation = EvaluationMois(self._contrat, mois_courant, calendrier)
+            self._evaluations[mois] = evaluation
+        else:
+            evaluation.mettre_a_jour()
+        return evaluation
+
+    def _get_travail_effectue(self, mois_courant: datetime.date, today: datetime.date,
+                              evaluation: EvaluationMois) -> TravailEffectue:
         """Make TravailEffectue"""
         return TravailEffectue(
             periode_d_emploi=(mois_courant.year, mois_courant.month, 1),
             date_de_paiement=today,
-            nombre_heures_normales=self._get_nombre_heures_normales(mois_courant),
-            nombre_jours_activite=self._get_nombre_jours_activite(mois_courant),
-            nombre_jours_conges_payes=0,
-            avec_heures_complementaires_ou_majorees=self._contrat.garde.has_heures_complementaires_mois(mois_courant),
+            nombre_heures_normales=self._get_nombre_heures_normales(evaluation),
+            nombre_jours_activite=self._get_nombre_jours_activite(evaluation),
+            nombre_jours_conges_payes=self._conges_payes.get_jours_pris(mois_courant),
+            avec_heures_complementaires_ou_majorees=evaluation.has_heures_complementaires(),
             avec_heures_specifiques=False
         )
 
-    def _get_remuneration(self, mois_courant: datetime.date, avec_indemnite_repas_ou_kilometrique) -> Remuneration:
+    def _get_remuneration(self, evaluation: EvaluationMois, avec_indemnite_repas_ou_kilometrique) -> Remuneration:
         """Make Remuneration"""
         return Remuneration(
-            salaire_net=self._contrat.get_salaire_net_mois_par_date(mois_courant),
-            indemnite_entretien=self._contrat.get_frais_entretien_mois_par_date(mois_courant),
+            salaire_net=evaluation.salaire_net,
+            indemnite_entretien=evaluation.frais_entretien,
             avec_acompte_verse_au_salarie=False,
             avec_indemnite_repas_ou_kilometrique=avec_indemnite_repas_ou_kilometrique
         )
 
-    def _get_heures_majorees_ou_complementaires(self, mois_courant: datetime.date) -> HeuresMajoreesOuComplementaires:
+    def _get_heures_majorees_ou_complementaires(self, evaluation: EvaluationMois) -> HeuresMajoreesOuComplementaires:
         """Make HeuresMajoreesOuComplementaires"""
         return HeuresMajoreesOuComplementaires(
             salaire_horaire_net=self._contrat.salaires_horaires.horaire_net,
-            nombre_heures_majorees=self._contrat.garde.get_heures_majorees_mois_par_date(mois_courant),
-            nombre_heures_complementaires=self._contrat.garde.get_heures_complementaires_mois_par_date(mois_courant)
+            nombre_heures_majorees=evaluation.heures_majorees,
+            nombre_heures_complementaires=evaluation.heures_complementaires
         )
 
-    def _get_nombre_heures_normales(self, mois_courant: datetime.date) -> int:
+    def _get_nombre_heures_normales(self, evaluation: EvaluationMois) -> int:
         """Compute the number of normal hours worked for a given month
         « Nombre d heures normales » : Salaire mensuel ÷ Taux horaire net"""
 
-        if not self._contrat.garde.has_jour_absence_non_remuneree_mois(mois_courant):
+        if not evaluation.has_jour_absence_non_remuneree():
             return round(self._contrat.planning.get_heures_travaillees_mois_mensualisees())
 
-        return round(self._contrat.get_salaire_net_mois_par_date(mois_courant)
-                     / self._contrat.salaires_horaires.horaire_net)
+        return round(evaluation.salaire_net / self._contrat.salaires_horaires.horaire_net)
 
-    def _get_nombre_jours_activite(self, mois_courant: datetime.date) -> int:
+    def _get_nombre_jours_activite(self, evaluation: EvaluationMois) -> int:
         """Compute the number of days worked for a given month
         « Nombre de jours d activité » : Nombre d heures normales ÷ Nombre d heures par jour"""
 
-        if not self._contrat.garde.has_jour_absence_non_remuneree_mois(mois_courant):
+        if not evaluation.has_jour_absence_non_remuneree():
             return math.ceil(self._contrat.planning.get_jours_travailles_mois_mensualise())
 
-        return (self._contrat.planning.get_jours_travailles_planifies_mois_par_date(mois_courant)
-                - self._contrat.garde.get_jour_absence_non_remuneree_mois(mois_courant))
+        return evaluation.jours_travailles_planifies - evaluation.jour_absence_non_remuneree
 
-    def _get_indemnites_complementaires(self, mois_courant: datetime.date) -> IndemnitesComplementaires:
+    def _get_indemnites_complementaires(self, evaluation: EvaluationMois) -> IndemnitesComplementaires:
         """Make IndemnitesComplementaires"""
         return IndemnitesComplementaires(
-            indemnite_repas=self._contrat.get_indemnite_repas_mois_par_date(mois_courant),
+            indemnite_repas=evaluation.indemnite_repas,
             indemnite_kilometrique=0
         )
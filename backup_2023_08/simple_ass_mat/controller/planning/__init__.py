@@ -7,4 +7,5 @@ from .planning import Planning  # noqa: F401
 from .planning_jour import PlanningJour  # noqa: F401
 from .planning_semaine import PlanningSemaine  # noqa: F401
 from .planning_annee import PlanningAnnee  # noqa: F401
+from .planning_compile import PlanningCompile, TranchePlanning  # noqa: F401
 from .planning_error import JourIdError, SemaineIdError  # noqa: F401
@@ -9,9 +9,12 @@ import logging
 import datetime
 
 from .. import helper
-from .planning_jour import PlanningJour, JourIdError
+from ..calendrier_mois import CalendrierMois, make_calendrier_mois
+from .planning_jour import PlanningJour
 from .planning_semaine import PlanningSemaine, SemaineIdError
 from .planning_annee import PlanningAnnee
+from .planning_error import PlanningAnneeError
+from .planning_compile import PlanningCompile
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +38,10 @@ class Planning:
         self._semaines = semaines
         self._annees = annees
         self._enfant_absent = enfant_absent
+        self._compiles: dict[int, PlanningCompile] = {}
 
         self._check_input_data()
+        self._semaines_enfant_absent = self._make_semaines_enfant_absent(enfant_absent)
 
     @property
     def semaines(self) -> PlanningSemaine:
@@ -55,46 +60,53 @@ class Planning:
 
     def get_enfant_absent_semaine_count(self) -> int:
         """Count week of paid vacation"""
-        semaine_count = 0
-        for semaine_interval in self._enfant_absent:
-            if len(semaine_interval) == 1:
-                semaine_count += 1
-            elif len(semaine_interval) == 2:
-                semaine_count += semaine_interval[1] - semaine_interval[0] + 1
-            else:
-                raise PlanningError("week_range length is not 1 or 2 for conges_payes")
-        return semaine_count
+        try:
+            return PlanningAnnee.compter_semaines(self._enfant_absent)
+        except PlanningAnneeError as error:
+            raise PlanningError(f"{error} for conges_payes") from error
+
+    def is_enfant_absent_par_date(self, date: datetime.date) -> bool:
+        """Check if the week of a given day is a week of paid vacation"""
+        return int(date.strftime('%U')) in self._semaines_enfant_absent
+
+    @staticmethod
+    def _make_semaines_enfant_absent(enfant_absent: semaine_interval_t) -> frozenset[int]:
+        """Numeros des semaines de conges payes"""
+        semaines: set[int] = set()
+        for semaine_interval in enfant_absent:
+            semaines.update(range(semaine_interval[0], semaine_interval[-1] + 1))
+        return frozenset(semaines)
+
+    def compile(self, annee: int) -> PlanningCompile:
+        """Return le planning déplié jour par jour pour une année civile, construit au premier appel"""
+        try:
+            return self._compiles[annee]
+        except KeyError:
+            planning_compile = PlanningCompile(annee, self._jours, self._resoudre_jour_id_par_date)
+            self._compiles[annee] = planning_compile
+            return planning_compile
 
     def get_heures_travaillees_jour_par_date(self, date: datetime.date) -> float:
         """Calculate working hour per day"""
-        heures_travaillees = 0.0
-        jour_id = self._get_jour_id_par_date(date)
-        try:
-            heures_travaillees = self._jours.get_heures_travaillees(jour_id)
-        except JourIdError:
-            pass
+        heures_travaillees = self.compile(date.year).get_heures_travaillees(date)
         logger.debug(f"heures_travaillees_jour_par_date: {date} = {heures_travaillees}")
         return heures_travaillees
 
-    def get_heures_travaillees_semaine_par_date(self, year,  week_number: int) -> float:
+    def get_heures_travaillees_semaine_par_date(self, year,  week_number: int,
+                                                dates: list[datetime.date] | None = None) -> float:
         """Calculate working hour per week"""
         try:
-            dates = helper.get_dates_in_week(year, week_number)
+            dates = dates or helper.get_dates_in_week(year, week_number)
             week_id = self._get_semaine_id_par_date(dates[0])
             return self._semaines.get_heures_travaillees(week_id)
         except SemaineIdError:
             return 0.0
 
-    def get_heures_travaillees_prevu_mois_par_date(self, date: datetime.date) -> float:
+    def get_heures_travaillees_prevu_mois_par_date(self, date: datetime.date,
+                                                   calendrier: CalendrierMois | None = None) -> float:
         """Get working hour planned for a month by date"""
-        hour_count: float = 0.0
-        dates = helper.get_dates_in_month(date)
-
-        for i_date in dates:
-            jour_id = self._get_jour_id_par_date(i_date)
-            if jour_id is not None:
-                hour_count += self._jours.get_heures_travaillees(jour_id)
-        return hour_count
+        calendrier = calendrier or make_calendrier_mois(date)
+        return self.compile(date.year).get_heures_travaillees_periode(calendrier.mois, len(calendrier.dates))
 
     def get_heures_travaillees_mois_mensualisees(self) -> float:
         """Calculate working hour per month"""
@@ -127,29 +139,30 @@ class Planning:
                 jours_travailles_annee += jours_travailles_semaine * semaines_travaillees
             return jours_travailles_annee / 12
 
-    def get_jours_travailles_planifies_mois_par_date(self, date: datetime.date) -> int:
+    def get_jours_travailles_planifies_mois_par_date(self, date: datetime.date,
+                                                     calendrier: CalendrierMois | None = None) -> int:
         """Get working day count for a given month"""
-        jour: int = 0
-        dates = helper.get_dates_in_month(date)
+        calendrier = calendrier or make_calendrier_mois(date)
+        return self.compile(date.year).get_jours_planifies_periode(calendrier.mois, len(calendrier.dates))
 
-        for i_date in dates:
-            day_id = self._get_jour_id_par_date(i_date)
-            if day_id is not None:
-                jour += 1
-        return jour
+    def is_jour_planifie_par_date(self, date: datetime.date) -> bool:
+        """Check if a working day is planned for a given day"""
+        return self._get_jour_id_par_date(date) is not None
 
     def avec_frais_repas_dejeuner_jour_par_date(self, date: datetime.date) -> bool:
         """Check lunch cost for a given day"""
-        day_id = self._get_jour_id_par_date(date)
-        return self._jours.avec_frais_repas_dejeuner(day_id)
+        return self.compile(date.year).avec_frais_repas_dejeuner(date)
 
     def avec_frais_repas_gouter_jour_par_date(self, date: datetime.date) -> bool:
         """Check snack cost for a given day"""
-        day_id = self._get_jour_id_par_date(date)
-        return self._jours.avec_frais_repas_gouter(day_id)
+        return self.compile(date.year).avec_frais_repas_gouter(date)
 
     def _get_jour_id_par_date(self, date: datetime.date) -> PlanningJour.jour_id_t:
         """Get jour_id par date"""
+        return self.compile(date.year).get_jour_id(date)
+
+    def _resoudre_jour_id_par_date(self, date: datetime.date) -> PlanningJour.jour_id_t:
+        """Resoud jour_id par date depuis les plannings annee et semaine"""
         try:
             semaine_id = self._get_semaine_id_par_date(date)
             jour_nom = date.strftime('%A').lower()
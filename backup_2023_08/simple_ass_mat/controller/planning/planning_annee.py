@@ -10,12 +10,15 @@ from .planning_error import PlanningAnneeError, SemaineIdError
 class PlanningAnnee:
     """Gere le planning de garde pour une année"""
 
+    _SEMAINE_NUMERO_MAX = 53  # strftime('%U') retourne un numero de semaine de 0 a 53
+
     semaine_id_t = int
     week_range_t = list[dict[str, int]]
     year_t = dict[semaine_id_t, week_range_t]
 
     def __init__(self, annees_data: year_t) -> None:
         self._annees = annees_data
+        self._semaine_ids = self._make_semaine_ids_index(annees_data)
 
     @property
     def annee_ids(self) -> set[int]:
@@ -31,24 +34,58 @@ class PlanningAnnee:
 
     def get_semaines_travaillees_count_par_id(self, semaine_id: semaine_id_t) -> int:
         """Compte nombre de semaine travaille pour week_id donné"""
+        try:
+            return PlanningAnnee.compter_semaines(self._annees[semaine_id])
+        except PlanningAnneeError as error:
+            raise PlanningAnneeError(f"{error} for semaine_id {semaine_id}") from error
+
+    @staticmethod
+    def compter_semaines(semaine_intervals: list[list[int]]) -> int:
+        """Compte les semaines d'intervalles [numero] ou [debut, fin], fin incluse"""
         semaine_count: int = 0
-        for semaine_interval in self._annees[semaine_id]:
+        for semaine_interval in semaine_intervals:
             if len(semaine_interval) == 1:
                 semaine_count += 1
             elif len(semaine_interval) == 2:
                 semaine_count += semaine_interval[1] - semaine_interval[0] + 1
             else:
-                raise PlanningAnneeError(f"semaine_interval length is not 1 or 2 for semaine_id {semaine_id}")
+                raise PlanningAnneeError("semaine_interval length is not 1 or 2")
         return semaine_count
 
     def get_semaine_id(self, semaine_numero: int) -> semaine_id_t:
         """Retourne l'id de la semaine pour le numéro de semaine donné"""
-        for semaine_id, semaine_intervals in self._annees.items():
+        semaine_id = None
+        if 0 <= semaine_numero <= PlanningAnnee._SEMAINE_NUMERO_MAX:
+            semaine_id = self._semaine_ids[semaine_numero]
+
+        if semaine_id is None:
+            raise SemaineIdError(f"semaine_id not found for semaine_numero: {semaine_numero}")
+        return semaine_id
+
+    @staticmethod
+    def _make_semaine_ids_index(annees_data: year_t) -> list[semaine_id_t | None]:
+        """Construit l'index numero de semaine -> semaine_id
+        Verifie que les intervals sont valides et ne se chevauchent pas"""
+        semaine_ids: list[PlanningAnnee.semaine_id_t | None] = [None] * (PlanningAnnee._SEMAINE_NUMERO_MAX + 1)
+
+        for semaine_id, semaine_intervals in annees_data.items():
             for semaine_interval in semaine_intervals:
-                if len(semaine_interval) == 1 and semaine_interval[0] == semaine_numero:
-                    return semaine_id
+                if len(semaine_interval) == 1:
+                    debut = fin = semaine_interval[0]
+                elif len(semaine_interval) == 2:
+                    debut, fin = semaine_interval
+                else:
+                    raise PlanningAnneeError(f"semaine_interval length is not 1 or 2 for semaine_id {semaine_id}")
+
+                if not 0 <= debut <= fin <= PlanningAnnee._SEMAINE_NUMERO_MAX:
+                    raise PlanningAnneeError(
+                        f"semaine_interval {semaine_interval} is invalid for semaine_id {semaine_id}")
+
+                for semaine_numero in range(debut, fin + 1):
+                    if semaine_ids[semaine_numero] is not None:
+                        raise PlanningAnneeError(
+                            f"semaine_numero {semaine_numero} of semaine_id {semaine_id}"
+                            f" already used by semaine_id {semaine_ids[semaine_numero]}")
+                    semaine_ids[semaine_numero] = semaine_id
 
-                if len(semaine_interval) == 2:
-                    if semaine_interval[0] <= semaine_numero <= semaine_interval[1]:
-                        return semaine_id
-        raise SemaineIdError(f"semaine_id not found for semaine_numero: {semaine_numero}")
+        return semaine_ids
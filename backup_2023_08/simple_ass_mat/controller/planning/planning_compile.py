@@ -0,0 +1,104 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+
+import datetime
+from collections.abc import Callable
+from typing import NamedTuple
+
+from .planning_jour import PlanningJour
+from .planning_error import JourIdError
+
+
+class TranchePlanning(NamedTuple):
+    """Jours consécutifs d'un planning compilé"""
+    jour_ids: tuple[PlanningJour.jour_id_t, ...]
+    heures: tuple[float, ...]
+    dejeuner: tuple[bool, ...]
+    gouter: tuple[bool, ...]
+
+
+class PlanningCompile:
+    """Planning d'une année civile déplié jour par jour
+
+    Chaque jour de l'année est résolu une seule fois (jour_id, heures prévues, dejeuner, gouter),
+    les requêtes par date deviennent une lecture par index.
+    """
+
+    def __init__(self, annee: int, jours: PlanningJour,
+                 get_jour_id_par_date: Callable[[datetime.date], PlanningJour.jour_id_t]) -> None:
+        self._annee = annee
+        self._premier_jour = datetime.date(annee, 1, 1)
+
+        jour_ids = []
+        heures = []
+        dejeuner = []
+        gouter = []
+
+        date = self._premier_jour
+        while date.year == annee:
+            jour_id = get_jour_id_par_date(date)
+            jour_ids.append(jour_id)
+            heures.append(PlanningCompile._get_heures_travaillees(jours, jour_id))
+            dejeuner.append(jours.avec_frais_repas_dejeuner(jour_id))
+            gouter.append(jours.avec_frais_repas_gouter(jour_id))
+            date += datetime.timedelta(days=1)
+
+        self._jour_ids = tuple(jour_ids)
+        self._heures = tuple(heures)
+        self._dejeuner = tuple(dejeuner)
+        self._gouter = tuple(gouter)
+
+    @property
+    def annee(self) -> int:
+        """Return l'année compilée"""
+        return self._annee
+
+    def index(self, date: datetime.date) -> int:
+        """Return l'index du jour dans l'année"""
+        return date.toordinal() - self._premier_jour.toordinal()
+
+    def get_jour_id(self, date: datetime.date) -> PlanningJour.jour_id_t:
+        """Return jour_id par date"""
+        return self._jour_ids[self.index(date)]
+
+    def get_heures_travaillees(self, date: datetime.date) -> float:
+        """Return heures prévues par date"""
+        return self._heures[self.index(date)]
+
+    def avec_frais_repas_dejeuner(self, date: datetime.date) -> bool:
+        """Return dejeuner prévu par date"""
+        return self._dejeuner[self.index(date)]
+
+    def avec_frais_repas_gouter(self, date: datetime.date) -> bool:
+        """Return gouter prévu par date"""
+        return self._gouter[self.index(date)]
+
+    def get_tranche(self, debut: datetime.date, nombre_jours: int) -> TranchePlanning:
+        """Return les nombre_jours jours à partir de debut"""
+        index = self.index(debut)
+        return TranchePlanning(jour_ids=self._jour_ids[index:index + nombre_jours],
+                               heures=self._heures[index:index + nombre_jours],
+                               dejeuner=self._dejeuner[index:index + nombre_jours],
+                               gouter=self._gouter[index:index + nombre_jours])
+
+    def get_heures_travaillees_periode(self, debut: datetime.date, nombre_jours: int) -> float:
+        """Somme des heures prévues sur nombre_jours à partir de debut"""
+        index = self.index(debut)
+        return sum(self._heures[index:index + nombre_jours], 0.0)
+
+    def get_jours_planifies_periode(self, debut: datetime.date, nombre_jours: int) -> int:
+        """Nombre de jours planifiés sur nombre_jours à partir de debut"""
+        index = self.index(debut)
+        return sum(1 for jour_id in self._jour_ids[index:index + nombre_jours] if jour_id is not None)
+
+    @staticmethod
+    def _get_heures_travaillees(jours: PlanningJour, jour_id: PlanningJour.jour_id_t) -> float:
+        """Return heures travaillées, 0 si pas de jour de garde"""
+        if jour_id is None:
+            return 0.0
+        try:
+            return jours.get_heures_travaillees(jour_id)
+        except JourIdError:
+            return 0.0
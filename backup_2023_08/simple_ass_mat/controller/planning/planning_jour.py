@@ -4,8 +4,6 @@
 """
 # pylint: disable=logging-fstring-interpolation
 
-import datetime
-
 from .. import helper
 from .planning_error import JourIdError, HorairesError
 
@@ -25,12 +23,21 @@ class PlanningJour:
 
     def __init__(self, jours_data: jours_t) -> None:
         self._jours = jours_data
+        # horaires convertis une seule fois, None si le jour n'a pas d'horaires
+        self._heures_travaillees: dict[PlanningJour.jour_id_t, float | None] = {
+            jour_id: helper.convert_minutes_to_hours(helper.convert_time_ranges_to_minutes(jour['horaires']))
+            if 'horaires' in jour else None
+            for jour_id, jour in jours_data.items()}
 
     def get_heures_travaillees(self, jour_id: jour_id_t) -> float:
         """Calcul le nombre d'heures travaillées pour un jour donné par jour_id"""
-        horaires = self._get_horaires(jour_id)
-        duree: datetime.timedelta = helper.convert_time_ranges_to_duration(horaires)
-        heures_travaillees: float = duree.seconds / 3600.0
+        try:
+            heures_travaillees = self._heures_travaillees[jour_id]
+        except KeyError as key_error:
+            raise JourIdError(f"jour_id {jour_id} not found") from key_error
+
+        if heures_travaillees is None:
+            raise HorairesError(f"horaires not found for {jour_id}")
         return heures_travaillees
 
     def avec_frais_repas_dejeuner(self, jour_id: jour_id_t) -> bool:
@@ -65,13 +72,3 @@ class PlanningJour:
             raise JourIdError(f"jour_id {jour_id} not found") from key_error
 
         return jour
-
-    def _get_horaires(self, day_id: jour_id_t) -> horaires_t:
-        """Return les horaires pour un jour donné par jour_id"""
-        jour = self._get_jour(day_id)
-        try:
-            horaires = jour['horaires']
-        except KeyError as key_error:
-            raise HorairesError(f"horaires not found for {day_id}") from key_error
-
-        return horaires
@@ -0,0 +1,151 @@
+"""
+:author Nicolas Boutin
+:date 2023-08
+"""
+
+import datetime
+from typing import NamedTuple
+
+from .calendrier_cache import get_calendrier_annee
+from .contrat import Contrat
+from .garde import HeuresSemaine, evaluer_heures_semaine
+
+
+class TotauxRegularisation(NamedTuple):
+    """Totaux d'un mois ou de l'annee pour la regularisation
+
+    salaire_net_verse: salaire des declarations mensuelles, mensualise moins absences plus heures sup
+    salaire_net_du: salaire des heures realisees, heures normales au taux net plus heures sup
+    """
+    heures_mensualisees: float
+    heures_prevues: float
+    heures_realisees: float
+    heures_complementaires: float
+    heures_majorees: float
+    heures_absence_non_remuneree: float
+    salaire_net_verse: float
+    salaire_net_du: float
+    delta_salaire_net: float
+
+
+class RegularisationAnnuelle(NamedTuple):
+    """Regularisation de fin d'annee d'un contrat en annee incomplete"""
+    annee: int
+    mois: tuple[TotauxRegularisation, ...]
+    total: TotauxRegularisation
+
+
+class _EvaluationJour(NamedTuple):
+    """Heures d'un jour, evaluees une seule fois pour l'annee"""
+    heures_prevues: float
+    heures_realisees: float
+    absence_non_remuneree: bool
+
+
+def regularisation_annuelle(contrat: Contrat, annee: int) -> RegularisationAnnuelle:
+    """Compare le salaire mensualise verse sur l'annee au salaire des heures realisees
+
+    Les jours de l'annee sont evalues une seule fois, dans l'ordre, les semaines a cheval
+    sur l'annee ajoutent leurs jours hors annee. Les totaux de chaque mois sont ceux d'EvaluationMois."""
+    calendrier = get_calendrier_annee(annee)
+    jours: dict[datetime.date, _EvaluationJour] = {}
+
+    def evaluer_jour(date: datetime.date) -> _EvaluationJour:
+        try:
+            return jours[date]
+        except KeyError:
+            pass
+        heures_prevues = contrat.planning.get_heures_travaillees_jour_par_date(date)
+        jour_garde = contrat.garde.get_jour_garde(date)
+        if jour_garde is None:
+            evaluation_jour = _EvaluationJour(heures_prevues, heures_prevues, False)
+        else:
+            evaluation_jour = _EvaluationJour(heures_prevues,
+                                              contrat.garde.get_heures_travaillees_jour_par_date(date),
+                                              bool(jour_garde.absence_non_remuneree))
+        jours[date] = evaluation_jour
+        return evaluation_jour
+
+    for mois in range(1, 13):
+        for date in calendrier.dates_par_mois[mois]:
+            evaluer_jour(date)
+
+    semaines: dict[int, HeuresSemaine] = {}
+    totaux_mois = tuple(_totaliser_mois(contrat, annee, mois, evaluer_jour, semaines) for mois in range(1, 13))
+    return RegularisationAnnuelle(annee=annee, mois=totaux_mois, total=_totaliser_annee(totaux_mois))
+
+
+def _evaluer_semaine(contrat: Contrat, annee: int, numero_semaine: int, evaluer_jour) -> HeuresSemaine:
+    """Heures d'une semaine, depuis les jours evalues"""
+    dates = get_calendrier_annee(annee).dates_par_semaine[numero_semaine]
+    h_trav_prevu_semaine = contrat.planning.get_heures_travaillees_semaine_par_date(annee, numero_semaine, dates)
+    return evaluer_heures_semaine(
+        h_trav_prevu_semaine,
+        ((evaluation_jour.heures_prevues, evaluation_jour.heures_realisees)
+         for evaluation_jour in map(evaluer_jour, dates)),
+        dates[0])
+
+
+def _totaliser_mois(contrat: Contrat, annee: int, mois: int, evaluer_jour,
+                    semaines: dict[int, HeuresSemaine]) -> TotauxRegularisation:
+    """Totaux d'un mois, chaque semaine du mois est evaluee une seule fois pour l'annee"""
+    heures_prevues, heures_realisees, heures_absence_non_remuneree = _sommer_jours(annee, mois, evaluer_jour)
+    heures_complementaires, heures_majorees = _sommer_semaines(contrat, annee, mois, evaluer_jour, semaines)
+    salaires = contrat.salaires_horaires
+
+    salaire_net_mensualise = contrat.get_salaire_net_mensualise()
+    salaire_net_verse = salaire_net_mensualise
+    if heures_prevues > 0:
+        salaire_net_verse -= salaire_net_mensualise * heures_absence_non_remuneree / heures_prevues
+    salaire_net_verse += heures_complementaires * salaires.horaire_complementaires_net \
+        + heures_majorees * salaires.horaire_majorees_net
+
+    salaire_net_du = (heures_realisees - heures_complementaires - heures_majorees) * salaires.horaire_net \
+        + heures_complementaires * salaires.horaire_complementaires_net \
+        + heures_majorees * salaires.horaire_majorees_net
+
+    return TotauxRegularisation(heures_mensualisees=contrat.planning.get_heures_travaillees_mois_mensualisees(),
+                                heures_prevues=heures_prevues,
+                                heures_realisees=heures_realisees,
+                                heures_complementaires=heures_complementaires,
+                                heures_majorees=heures_majorees,
+                                heures_absence_non_remuneree=heures_absence_non_remuneree,
+                                salaire_net_verse=salaire_net_verse,
+                                salaire_net_du=salaire_net_du,
+                                delta_salaire_net=salaire_net_du - salaire_net_verse)
+
+
+def _sommer_jours(annee: int, mois: int, evaluer_jour) -> tuple[float, float, float]:
+    """Heures prevues, realisees et d'absence non remuneree des jours d'un mois"""
+    heures_prevues = 0.0
+    heures_realisees = 0.0
+    heures_absence_non_remuneree = 0.0
+    for date in get_calendrier_annee(annee).dates_par_mois[mois]:
+        evaluation_jour = evaluer_jour(date)
+        heures_prevues += evaluation_jour.heures_prevues
+        heures_realisees += evaluation_jour.heures_realisees
+        if evaluation_jour.absence_non_remuneree:
+            heures_absence_non_remuneree += evaluation_jour.heures_prevues
+    return heures_prevues, heures_realisees, heures_absence_non_remuneree
+
+
+def _sommer_semaines(contrat: Contrat, annee: int, mois: int, evaluer_jour,
+                     semaines: dict[int, HeuresSemaine]) -> tuple[float, float]:
+    """Heures complementaires et majorees des semaines d'un mois, chaque semaine evaluee une seule fois"""
+    heures_complementaires = 0.0
+    heures_majorees = 0.0
+    for numero_semaine in get_calendrier_annee(annee).numeros_semaine_par_mois[mois]:
+        if numero_semaine not in semaines:
+            semaines[numero_semaine] = _evaluer_semaine(contrat, annee, numero_semaine, evaluer_jour)
+        heures_complementaires += semaines[numero_semaine].heures_complementaires
+        heures_majorees += semaines[numero_semaine].heures_majorees
+    return heures_complementaires, heures_majorees
+
+
+def _totaliser_annee(totaux_mois: tuple[TotauxRegularisation, ...]) -> TotauxRegularisation:
+    """Somme des totaux des mois, champ par champ dans l'ordre des mois"""
+    total = [0.0] * len(TotauxRegularisation._fields)
+    for totaux in totaux_mois:
+        for index, valeur in enumerate(totaux):
+            total[index] += valeur
+    return TotauxRegularisation(*total)
@@ -0,0 +1,88 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import datetime
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))  # OK
+
+
+from simple_ass_mat.controller import calendrier_cache  # nopep8 # noqa: E402
+from simple_ass_mat.controller import helper  # nopep8 # noqa: E402
+
+
+class TestCalendrierAnnee(unittest.TestCase):
+
+    def test_same_as_calcul(self):
+        for annee in range(2019, 2031):
+            calendrier = calendrier_cache.get_calendrier_annee(annee)
+            for mois in range(1, 13):
+                self.assertEqual(list(calendrier.dates_par_mois[mois]),
+                                 calendrier_cache.calculer_dates_mois(annee, mois))
+                self.assertEqual(list(calendrier.numeros_semaine_par_mois[mois]),
+                                 calendrier_cache.calculer_numeros_semaine(annee, mois))
+            for semaine in range(1, 54):
+                self.assertEqual(calendrier.dernier_jour_par_semaine[semaine],
+                                 calendrier_cache.calculer_dernier_jour_semaine(annee, semaine))
+                try:
+                    dates = calendrier_cache.calculer_dates_semaine(annee, semaine)
+                except ValueError:
+                    self.assertNotIn(semaine, calendrier.dates_par_semaine)
+                else:
+                    self.assertEqual(list(calendrier.dates_par_semaine[semaine]), dates)
+
+    def test_lru_borne(self):
+        calendrier_cache.get_calendrier_annee.cache_clear()
+        for annee in range(2000, 2000 + 2 * calendrier_cache._ANNEES_MAX):  # pylint: disable=protected-access
+            calendrier_cache.get_calendrier_annee(annee)
+        info = calendrier_cache.get_calendrier_annee.cache_info()
+        self.assertEqual(info.currsize, calendrier_cache._ANNEES_MAX)  # pylint: disable=protected-access
+
+        calendrier = calendrier_cache.get_calendrier_annee(2023)
+        self.assertIs(calendrier_cache.get_calendrier_annee(2023), calendrier)
+
+    def test_lecture_seule(self):
+        calendrier = calendrier_cache.get_calendrier_annee(2023)
+        for table in (calendrier.dates_par_mois, calendrier.numeros_semaine_par_mois,
+                      calendrier.dates_par_semaine, calendrier.dernier_jour_par_semaine):
+            with self.assertRaises(TypeError):
+                table[1] = ()
+            with self.assertRaises(TypeError):
+                del table[1]
+        with self.assertRaises(AttributeError):
+            calendrier.dates_par_mois[1].append(datetime.date(2023, 2, 1))  # pylint: disable=no-member
+        self.assertEqual(len(calendrier_cache.get_calendrier_annee(2023).dates_par_mois[1]), 31)
+
+
+class TestHelper(unittest.TestCase):
+
+    def test_list_copy(self):
+        dates = helper.get_dates_in_week(2023, 1)
+        dates.append(datetime.date(2023, 1, 9))
+        self.assertEqual(len(helper.get_dates_in_week(2023, 1)), 7)
+
+    def test_invalid_week(self):
+        with self.assertRaises(ValueError):
+            helper.get_dates_in_week(2024, 53)
+        with self.assertRaises(ValueError):
+            helper.get_dates_in_week(2023, 0)
+
+    def test_last_day_out_of_table(self):
+        self.assertEqual(helper.get_last_day_of_week(2022, 54),
+                         calendrier_cache.calculer_dernier_jour_semaine(2022, 54))
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller import factory  # nopep8 # noqa: E402
+from simple_ass_mat.controller.conges_payes import CompteurCongesPayes  # nopep8 # noqa: E402
+from simple_ass_mat.controller.pajemploi_declaration import PajemploiDeclaration  # nopep8 # noqa: E402
+
+
+def make_contrat(dossier: str, nom: str):
+    data_filepath = Path(__file__).parent.parent.parent / "pajemploi" / dossier / nom
+    with open(data_filepath, 'r', encoding='UTF-8') as file:
+        data = yaml.safe_load(file)
+    return factory.make_contrat(data['contrat'])
+
+
+def make_contrat_annee_complete():
+    return make_contrat("annee_complete", "data_pajemploi_exemple_annee_complete.yml")
+
+
+MOIS_2023 = [date(2023, mois, 1) for mois in range(1, 12)]
+
+
+class TestCompteurCongesPayes(unittest.TestCase):
+
+    def test_get_debut_periode(self):
+        self.assertEqual(CompteurCongesPayes.get_debut_periode(date(2023, 5, 31)), date(2022, 6, 1))
+        self.assertEqual(CompteurCongesPayes.get_debut_periode(date(2023, 6, 1)), date(2023, 6, 1))
+
+    def test_acquisition(self):
+        compteur = CompteurCongesPayes(make_contrat_annee_complete())
+        for mois in MOIS_2023:
+            compteur.ajouter_mois(mois, 100.0)
+
+        acquisition = compteur.get_acquisition(date(2023, 1, 1))
+        self.assertEqual(acquisition.debut_periode, date(2022, 6, 1))
+        self.assertEqual(acquisition.semaines_travail_effectif, 22)
+        self.assertEqual(acquisition.jours_acquis, 14)  # 22 * 2.5 / 4 = 13.75
+        self.assertEqual(acquisition.salaire_net_periode, 500.0)
+
+        acquisition = compteur.get_acquisition(date(2023, 11, 1))
+        self.assertEqual(acquisition.jours_pris, 4)
+        self.assertEqual(compteur.get_jours_pris(date(2023, 11, 1)), 4)
+        self.assertEqual(compteur.get_jours_pris(date(2023, 10, 1)), 0)
+
+    def test_ordre_et_remplacement(self):
+        contrat = make_contrat_annee_complete()
+        compteur = CompteurCongesPayes(contrat)
+        for mois in MOIS_2023:
+            compteur.ajouter_mois(mois, float(mois.month))
+
+        compteur_desordre = CompteurCongesPayes(contrat)
+        for mois in reversed(MOIS_2023):
+            compteur_desordre.ajouter_mois(mois, 0.0)
+        for mois in MOIS_2023:
+            compteur_desordre.ajouter_mois(mois, float(mois.month))
+
+        for mois in MOIS_2023:
+            self.assertEqual(compteur_desordre.get_acquisition(mois), compteur.get_acquisition(mois))
+
+    def test_annee_incomplete(self):
+        compteur = CompteurCongesPayes(make_contrat("annee_incomplete",
+                                                    "data_pajemploi_exemple_annee_incomplete.yml"))
+        for mois in MOIS_2023:
+            compteur.ajouter_mois(mois, 0.0)
+        self.assertEqual(compteur.get_acquisition(date(2023, 11, 1)).jours_pris, 0)
+
+    def test_indemnite(self):
+        contrat = make_contrat_annee_complete()
+        compteur = CompteurCongesPayes(contrat)
+        for mois in MOIS_2023:
+            compteur.ajouter_mois(mois, 400.0)
+
+        indemnite = compteur.get_indemnite(date(2023, 11, 1))
+        # jours acquis sur la periode de reference precedente
+        acquisition = compteur.get_acquisition(date(2023, 5, 1))
+        self.assertEqual(indemnite.jours, 4)
+        self.assertEqual(indemnite.dixieme, acquisition.salaire_net_periode * 0.10 * 4 / acquisition.jours_acquis)
+        self.assertEqual(indemnite.maintien_salaire, contrat.get_salaire_net_mensualise() * 4 / 26)
+        self.assertEqual(indemnite.montant, max(indemnite.dixieme, indemnite.maintien_salaire))
+
+
+class TestPajemploiDeclaration(unittest.TestCase):
+
+    def test_nombre_jours_conges_payes(self):
+        pajemploi_declaration = PajemploiDeclaration(make_contrat_annee_complete())
+
+        declaration = pajemploi_declaration.get_declaration(date(2023, 10, 1), date(2023, 11, 1))
+        self.assertEqual(declaration.travail_effectue.nombre_jours_conges_payes, 0)
+        declaration = pajemploi_declaration.get_declaration(date(2023, 11, 1), date(2023, 12, 1))
+        self.assertEqual(declaration.travail_effectue.nombre_jours_conges_payes, 4)
+        self.assertEqual(pajemploi_declaration.conges_payes.get_acquisition(date(2023, 11, 1)).salaire_net_periode,
+                         declaration.remuneration.salaire_net
+                         + pajemploi_declaration.get_declaration(date(2023, 10, 1), date(2023, 11, 1))
+                         .remuneration.salaire_net)
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller import factory  # nopep8 # noqa: E402
+from simple_ass_mat.controller.contrat_vectorise import ContratVectorise  # nopep8 # noqa: E402
+
+
+class TestContratVectorise(unittest.TestCase):
+    """Results are identical to the loop version"""
+
+    def _assert_identical(self, data_filepath: Path, horaires_jours: dict | None = None):
+        with open(data_filepath, 'r', encoding='UTF-8') as file:
+            data = yaml.safe_load(file)
+        for jour_id, horaires in (horaires_jours or {}).items():
+            data['contrat']['planning']['jours'][jour_id]['horaires'] = horaires
+        contrat = factory.make_contrat(data['contrat'])
+        contrat_vectorise = ContratVectorise(contrat)
+
+        for month in range(1, 13):
+            self._assert_mois_identical(contrat, contrat_vectorise, date(2023, month, 1))
+        return contrat, contrat_vectorise
+
+    def _assert_mois_identical(self, contrat, contrat_vectorise: ContratVectorise, mois: date):
+        self.assertEqual(contrat_vectorise.get_heures_travaillees_prevu_mois_par_date(mois),
+                         contrat.planning.get_heures_travaillees_prevu_mois_par_date(mois))
+        self.assertEqual(contrat_vectorise.get_jours_travailles_planifies_mois_par_date(mois),
+                         contrat.planning.get_jours_travailles_planifies_mois_par_date(mois))
+        self.assertEqual(contrat_vectorise.get_jour_absence_non_remuneree_mois(mois),
+                         contrat.garde.get_jour_absence_non_remuneree_mois(mois))
+        self.assertEqual(contrat_vectorise.get_heure_absence_non_remuneree_mois(mois),
+                         contrat.garde.get_heure_absence_non_remuneree_mois(mois))
+        self.assertEqual(contrat_vectorise.get_frais_entretien_mois_par_date(mois),
+                         contrat.get_frais_entretien_mois_par_date(mois))
+        self.assertEqual(contrat_vectorise.get_indemnite_repas_mois_par_date(mois),
+                         contrat.get_indemnite_repas_mois_par_date(mois))
+
+    def test_pajemploi_annee_complete(self):
+        self._assert_identical(Path(__file__).parent.parent.parent / "pajemploi" / "annee_complete"
+                               / "data_pajemploi_exemple_annee_complete.yml")
+
+    def test_parent_usecase_1(self):
+        self._assert_identical(Path(__file__).parent.parent.parent / "parent_usecases" / "parent_usecase_1"
+                               / "data_parent_usecase_1.yml")
+
+    def test_parent_usecase_2(self):
+        self._assert_identical(Path(__file__).parent.parent.parent / "parent_usecases" / "parent_usecase_2"
+                               / "data_parent_usecase_2.yml")
+
+    def test_frais_entretien_arrondi(self):
+        """Journees de 6h30 et 7h30, frais d'entretien journalier a un demi centime de l'arrondi"""
+        self._assert_identical(Path(__file__).parent.parent.parent / "parent_usecases" / "parent_usecase_2"
+                               / "data_parent_usecase_2.yml",
+                               {0: [["08:00", "15:30"]], 1: [["08:00", "14:30"]]})
+
+    def test_jour_garde_modifie(self):
+        contrat, contrat_vectorise = self._assert_identical(
+            Path(__file__).parent.parent.parent / "pajemploi" / "annee_complete"
+            / "data_pajemploi_exemple_annee_complete.yml")
+        mois = date(2023, 2, 1)
+        tableaux = contrat_vectorise.get_tableaux_mois(mois)
+        frais_entretien = contrat_vectorise.get_frais_entretien_mois_par_date(mois)
+
+        contrat.garde.modifier_jour_garde(date(2023, 2, 8), {"heures": [["07:00", "20:30"]], "dejeuner": False})
+        contrat.garde.modifier_jour_garde(date(2023, 2, 9), {"absence_non_remuneree": True})
+        self._assert_mois_identical(contrat, contrat_vectorise, mois)
+        self.assertNotEqual(contrat_vectorise.get_frais_entretien_mois_par_date(mois), frais_entretien)
+        # les autres mois restent en cache
+        self.assertIs(contrat_vectorise.get_tableaux_mois(date(2023, 3, 1)),
+                      contrat_vectorise.get_tableaux_mois(date(2023, 3, 1)))
+        self.assertIsNot(contrat_vectorise.get_tableaux_mois(mois), tableaux)
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller import factory  # nopep8 # noqa: E402
+from simple_ass_mat.controller.evaluation_mois import EvaluationMois  # nopep8 # noqa: E402
+from simple_ass_mat.controller.pajemploi_declaration import PajemploiDeclaration  # nopep8 # noqa: E402
+
+
+class TestEvaluationMois(unittest.TestCase):
+    """Each field is equal to the value computed by Contrat, Garde and Planning"""
+
+    def _assert_evaluation(self, data_filepath: Path, mois_list: list[date]):
+        with open(data_filepath, 'r', encoding='UTF-8') as file:
+            data = yaml.safe_load(file)
+        contrat = factory.make_contrat(data['contrat'])
+
+        for mois in mois_list:
+            evaluation = EvaluationMois(contrat, mois)
+            self.assertEqual(evaluation.heures_travaillees_prevu,
+                             contrat.planning.get_heures_travaillees_prevu_mois_par_date(mois))
+            self.assertEqual(evaluation.jours_travailles_planifies,
+                             contrat.planning.get_jours_travailles_planifies_mois_par_date(mois))
+            self.assertEqual(evaluation.jour_absence_non_remuneree,
+                             contrat.garde.get_jour_absence_non_remuneree_mois(mois))
+            self.assertEqual(evaluation.heure_absence_non_remuneree,
+                             contrat.garde.get_heure_absence_non_remuneree_mois(mois))
+            self.assertEqual(evaluation.heures_complementaires,
+                             contrat.garde.get_heures_complementaires_mois_par_date(mois))
+            self.assertEqual(evaluation.heures_majorees, contrat.garde.get_heures_majorees_mois_par_date(mois))
+            self.assertEqual(evaluation.frais_entretien, contrat.get_frais_entretien_mois_par_date(mois))
+            self.assertEqual(evaluation.indemnite_repas, contrat.get_indemnite_repas_mois_par_date(mois))
+            self.assertEqual(evaluation.salaire_net, contrat.get_salaire_net_mois_par_date(mois))
+
+    def test_pajemploi_annee_complete(self):
+        data_filepath = Path(__file__).parent.parent.parent / "pajemploi" / "annee_complete" \
+            / "data_pajemploi_exemple_annee_complete.yml"
+        self._assert_evaluation(data_filepath, [date(2023, 1, 1), date(2023, 2, 1), date(2023, 9, 1)])
+
+    def test_parent_usecase_2(self):
+        data_filepath = Path(__file__).parent.parent.parent / "parent_usecases" / "parent_usecase_2" \
+            / "data_parent_usecase_2.yml"
+        self._assert_evaluation(data_filepath, [date(2023, month, 1) for month in range(1, 6)])
+
+
+class TestMettreAJour(unittest.TestCase):
+    """Apres modification d'un jour, meme valeurs qu'une nouvelle evaluation"""
+
+    FIELDS = ["heures_travaillees_prevu", "jours_travailles_planifies", "jour_absence_non_remuneree",
+              "heure_absence_non_remuneree", "frais_entretien", "indemnite_repas", "heures_complementaires",
+              "heures_majorees", "salaire_net"]
+
+    def setUp(self):
+        data_filepath = Path(__file__).parent.parent.parent / "pajemploi" / "annee_complete" \
+            / "data_pajemploi_exemple_annee_complete.yml"
+        with open(data_filepath, 'r', encoding='UTF-8') as file:
+            data = yaml.safe_load(file)
+        self.contrat = factory.make_contrat(data['contrat'])
+        self.mois = date(2023, 2, 1)
+
+    def _assert_same_as_new(self, evaluation: EvaluationMois):
+        expected = EvaluationMois(self.contrat, self.mois)
+        for field in TestMettreAJour.FIELDS:
+            self.assertEqual(getattr(evaluation, field), getattr(expected, field), field)
+
+    def test_jour_du_mois(self):
+        evaluation = EvaluationMois(self.contrat, self.mois)
+        heures_complementaires = evaluation.heures_complementaires
+
+        self.contrat.garde.modifier_jour_garde(date(2023, 2, 8), {"heures": [["07:00", "20:30"]], "dejeuner": False})
+        with mock.patch.object(self.contrat.garde, "get_heures_travaillees_jour_par_date",
+                               wraps=self.contrat.garde.get_heures_travaillees_jour_par_date) as jour_mock:
+            self.assertTrue(evaluation.mettre_a_jour())
+        self.assertEqual(jour_mock.call_count, 1)
+        self.assertGreater(evaluation.heures_complementaires, heures_complementaires)
+        self._assert_same_as_new(evaluation)
+
+        self.contrat.garde.modifier_jour_garde(date(2023, 2, 8), None)
+        self.contrat.garde.modifier_jour_garde(date(2023, 2, 9), {"absence_non_remuneree": True})
+        self.assertTrue(evaluation.mettre_a_jour())
+        self._assert_same_as_new(evaluation)
+        self.assertFalse(evaluation.mettre_a_jour())
+
+    def test_jour_hors_mois(self):
+        evaluation = EvaluationMois(self.contrat, self.mois)
+
+        self.contrat.garde.modifier_jour_garde(date(2023, 3, 15), {"heures": [["07:00", "20:30"]]})
+        self.assertFalse(evaluation.mettre_a_jour())
+
+        # semaine a cheval sur janvier et fevrier
+        self.contrat.garde.modifier_jour_garde(date(2023, 1, 30), {"heures": [["07:00", "20:30"]]})
+        self.assertTrue(evaluation.mettre_a_jour())
+        self._assert_same_as_new(evaluation)
+
+    def test_declaration(self):
+        declaration = PajemploiDeclaration(self.contrat)
+        today = date(2023, 3, 2)
+        declaration.get_declaration(self.mois, today)
+
+        self.contrat.garde.modifier_jour_garde(date(2023, 2, 8), {"absence_non_remuneree": True})
+        self.assertEqual(declaration.get_declaration(self.mois, today),
+                         PajemploiDeclaration(self.contrat).get_declaration(self.mois, today))
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
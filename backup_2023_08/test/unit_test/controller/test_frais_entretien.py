@@ -0,0 +1,90 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))  # OK
+
+
+from simple_ass_mat.controller import frais_entretien  # nopep8 # noqa: E402
+from simple_ass_mat.controller.frais_entretien import (  # nopep8 # noqa: E402
+    FraisEntretien, PeriodeFraisEntretien, charger_table_frais_entretien)
+from simple_ass_mat.controller.calendrier_mois import make_calendrier_mois  # nopep8 # noqa: E402
+
+
+FRAIS_ENTRETIEN_ANNUEL = {date(2022, 1, 1): FraisEntretien(2.65, 3.39/9),
+                          date(2023, 1, 1): FraisEntretien(2.65, 3.61/9),
+                          date(2023, 5, 1): FraisEntretien(2.65, 3.69/9)}
+
+
+def get_taux_lineaire(date_):
+    """Recherche lineaire, comme avant la table"""
+    taux = None
+    for key, value in FRAIS_ENTRETIEN_ANNUEL.items():
+        if date_ >= key:
+            taux = value
+    return taux
+
+
+class TestTableFraisEntretien(unittest.TestCase):
+
+    def test_get_taux(self):
+        table = frais_entretien.get_table_frais_entretien()
+        date_ = date(2021, 12, 1)
+        while date_ < date(2024, 1, 1):
+            self.assertEqual(table.get_taux(date_), get_taux_lineaire(date_))
+            date_ += timedelta(days=1)
+
+    def test_table_du_registre(self):
+        table = frais_entretien.get_table_frais_entretien()
+        self.assertEqual(table.version, "2023-05-01")
+        self.assertIs(frais_entretien.get_table_frais_entretien(), table)
+        self.assertEqual(len(table.get_periodes(date(2022, 1, 1), date(2023, 12, 31))), len(FRAIS_ENTRETIEN_ANNUEL))
+
+    def test_get_periodes(self):
+        table = frais_entretien.get_table_frais_entretien()
+        self.assertEqual(table.get_periodes(date(2023, 4, 15), date(2023, 5, 15)),
+                         [PeriodeFraisEntretien(date(2023, 4, 15), date(2023, 4, 30), FraisEntretien(2.65, 3.61/9)),
+                          PeriodeFraisEntretien(date(2023, 5, 1), date(2023, 5, 15), FraisEntretien(2.65, 3.69/9))])
+        self.assertEqual(table.get_periodes(date(2021, 12, 31), date(2022, 1, 1)),
+                         [PeriodeFraisEntretien(date(2021, 12, 31), date(2021, 12, 31), None),
+                          PeriodeFraisEntretien(date(2022, 1, 1), date(2022, 1, 1), FraisEntretien(2.65, 3.39/9))])
+        self.assertEqual(len(table.get_periodes(date(2023, 6, 1), date(2023, 6, 30))), 1)
+
+    def test_calendrier_mois(self):
+        for mois in range(1, 13):
+            calendrier = make_calendrier_mois(date(2023, mois, 1))
+            self.assertEqual(calendrier.frais_entretien_par_date,
+                             {date_: get_taux_lineaire(date_) for date_ in calendrier.dates})
+
+    def test_charger(self):
+        table = charger_table_frais_entretien({"version": "2024-01",
+                                               "taux": {date(2024, 1, 1): {"minimum": 2.70, "taux_9h": 3.78},
+                                                        "2023-05-01": {"minimum": 2.65, "taux_9h": 3.69}}})
+        self.assertEqual(table.version, "2024-01")
+        self.assertEqual(table.get_taux(date(2023, 12, 31)), FraisEntretien(2.65, 3.69/9))
+        self.assertEqual(table.get_taux(date(2024, 2, 1)), FraisEntretien(2.70, 3.78/9))
+
+        self.assertEqual(frais_entretien.get_frais_entretien_taux_horaire(date(2024, 2, 1), table),
+                         FraisEntretien(2.70, 3.78/9))
+        self.assertEqual(frais_entretien.get_frais_entretien_taux_horaire(date(2024, 2, 1)),
+                         FraisEntretien(2.65, 3.69/9))
+        calendrier = make_calendrier_mois(date(2024, 1, 1), table)
+        self.assertEqual(set(calendrier.frais_entretien_par_date.values()), {FraisEntretien(2.70, 3.78/9)})
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
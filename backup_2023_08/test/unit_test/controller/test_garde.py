@@ -0,0 +1,140 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller.garde import (  # nopep8 # noqa: E402
+    Garde, JourGarde, HeuresSemaine, sommer_heures_majorees)
+from simple_ass_mat.model import parametres  # nopep8 # noqa: E402
+from simple_ass_mat.controller.planning import (  # nopep8 # noqa: E402
+    Planning, PlanningJour, PlanningSemaine, PlanningAnnee)
+
+
+def make_planning():
+    jours = {0: {"horaires": [["08:00", "18:00"]], "dejeuner": True, "gouter": True}}
+    semaines = {0: {"lundi": 0, "mardi": 0, "mercredi": 0, "jeudi": 0, "vendredi": 0,
+                    "samedi": None, "dimanche": None}}
+    planning_jour = PlanningJour(jours)
+    return Planning(planning_jour, PlanningSemaine(semaines, planning_jour), PlanningAnnee({0: [[1, 47]]}),
+                    [[48, 52]])
+
+
+class TestJourGarde(unittest.TestCase):
+
+    def test_index_par_date(self):
+        garde = Garde({"2023": {"01": {"10": {"heures": [["08:00", "20:30"]], "dejeuner": False}}},
+                       2024: {2: {1: None}}}, make_planning())
+
+        self.assertEqual(garde.get_jour_garde(date(2023, 1, 10)), JourGarde(heures=12.5, dejeuner=False))
+        self.assertEqual(garde.get_jour_garde(date(2024, 2, 1)), JourGarde())
+        self.assertIsNone(garde.get_jour_garde(date(2023, 1, 11)))
+
+    def test_ajouter_jours_garde(self):
+        garde = Garde({"2023": {"01": {"10": {"absence_payee": True}}}}, make_planning())
+        garde.ajouter_jours_garde(iter([(date(2023, 1, 10), {"heures": [["08:00", "12:00"]]}),
+                                        (date(2023, 1, 11), {"absence_non_remuneree": True})]))
+
+        self.assertEqual(garde.get_jour_garde(date(2023, 1, 10)), JourGarde(heures=4))
+        self.assertEqual(garde.get_jour_garde(date(2023, 1, 11)), JourGarde(absence_non_remuneree=True))
+
+    def test_invalid_date(self):
+        with self.assertRaises(ValueError):
+            Garde({"2023": {"02": {"30": {"absence_payee": True}}}}, make_planning())
+
+
+class TestGetHeuresTravailleesJourParDate(unittest.TestCase):
+
+    def test_nominal(self):
+        garde = Garde({"2023": {"01": {"10": {"heures": [["08:00", "20:30"]]},
+                                       "11": {"absence_payee": True},
+                                       "12": {"absence_non_remuneree": True},
+                                       "13": {"dejeuner": False}}}}, make_planning())
+
+        self.assertEqual(garde.get_heures_travaillees_jour_par_date(date(2023, 1, 9)), 10)
+        self.assertEqual(garde.get_heures_travaillees_jour_par_date(date(2023, 1, 10)), 12.5)
+        self.assertEqual(garde.get_heures_travaillees_jour_par_date(date(2023, 1, 11)), 0)
+        self.assertEqual(garde.get_heures_travaillees_jour_par_date(date(2023, 1, 12)), 0)
+        self.assertEqual(garde.get_heures_travaillees_jour_par_date(date(2023, 1, 13)), 0)
+        self.assertTrue(garde.is_absence_non_remuneree_jour_par_date(date(2023, 1, 12)))
+        self.assertFalse(garde.is_absence_non_remuneree_jour_par_date(date(2023, 1, 11)))
+
+
+class TestGetHeuresSemaineParDate(unittest.TestCase):
+
+    def test_nominal(self):
+        garde = Garde({"2023": {"01": {"10": {"heures": [["08:00", "20:30"]]},
+                                       "11": {"absence_payee": True}}}}, make_planning())
+
+        heures_semaine = garde.get_heures_semaine_par_date(2023, 2)
+        self.assertEqual(heures_semaine, HeuresSemaine(heures_prevues=50, heures_realisees=42.5,
+                                                       heures_complementaires=0, heures_majorees=2.5))
+        self.assertEqual(garde.get_heures_complementaires_semaine_par_date(2023, 2), 0)
+        self.assertEqual(garde.get_heures_majorees_semaine_par_date(2023, 2), 2.5)
+
+    def test_seuil_du_registre(self):
+        garde = Garde({"2023": {"01": {"10": {"heures": [["08:00", "20:30"]]}}}}, make_planning())
+        with tempfile.TemporaryDirectory() as dirname:
+            filepath = Path(dirname) / "parametres.yaml"
+            filepath.write_text("- {date_effet: 2023-01-01, smic_horaire_brut: 11.27, ratio_brut_net: 0.7812, "
+                                "seuil_heures_majorees: 55, frais_entretien_minimum: 2.65, frais_entretien_9h: 3.61}",
+                                encoding="utf-8")
+            with mock.patch("simple_ass_mat.controller.garde.get_registre_parametres",
+                            return_value=parametres.RegistreParametres(filepath)):
+                heures_semaine = garde.get_heures_semaine_par_date(2023, 2)
+
+        self.assertEqual(heures_semaine.heures_complementaires, 2.5)
+        self.assertEqual(heures_semaine.heures_majorees, 0)
+
+    def test_jour_evalue_une_fois_par_mois(self):
+        planning = make_planning()
+        garde = Garde({"2023": {"01": {"10": {"heures": [["08:00", "20:30"]]}}}}, planning)
+        dates_evaluees = []
+        get_heures_jour = planning.get_heures_travaillees_jour_par_date
+
+        def compter(date_):
+            dates_evaluees.append(date_)
+            return get_heures_jour(date_)
+
+        planning.get_heures_travaillees_jour_par_date = compter
+        heures_semaines = garde.get_heures_semaines_mois_par_date(date(2023, 1, 1))
+
+        self.assertEqual(len(dates_evaluees), len(set(dates_evaluees)))
+        self.assertEqual(sommer_heures_majorees(heures_semaines), 2.5)
+
+
+class TestAvecFraisRepas(unittest.TestCase):
+
+    def test_nominal(self):
+        garde = Garde({"2023": {"01": {"10": {"heures": [["08:00", "20:30"]], "gouter": False},
+                                       "11": {"absence_payee": False},
+                                       "12": {"dejeuner": False}}}}, make_planning())
+
+        self.assertTrue(garde.avec_frais_repas_dejeuner_jour_par_date(date(2023, 1, 9)))
+        self.assertTrue(garde.avec_frais_repas_dejeuner_jour_par_date(date(2023, 1, 10)))
+        self.assertFalse(garde.avec_frais_repas_gouter_jour_par_date(date(2023, 1, 10)))
+        self.assertFalse(garde.avec_frais_repas_dejeuner_jour_par_date(date(2023, 1, 11)))
+        self.assertFalse(garde.avec_frais_repas_gouter_jour_par_date(date(2023, 1, 11)))
+        self.assertFalse(garde.avec_frais_repas_dejeuner_jour_par_date(date(2023, 1, 12)))
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
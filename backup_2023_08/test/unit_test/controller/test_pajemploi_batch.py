@@ -0,0 +1,71 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller import factory  # nopep8 # noqa: E402
+from simple_ass_mat.controller.pajemploi_declaration import PajemploiDeclaration  # nopep8 # noqa: E402
+from simple_ass_mat.controller.pajemploi_batch import PajemploiDeclarationBatch  # nopep8 # noqa: E402
+
+
+def load_contrats():
+    test_dirpath = Path(__file__).parent.parent.parent
+    data_filepaths = [
+        test_dirpath / "pajemploi" / "annee_complete" / "data_pajemploi_exemple_annee_complete.yml",
+        test_dirpath / "parent_usecases" / "parent_usecase_2" / "data_parent_usecase_2.yml"]
+
+    contrats = []
+    for data_filepath in data_filepaths:
+        with open(data_filepath, 'r', encoding='UTF-8') as file:
+            data = yaml.safe_load(file)
+        contrats.append(factory.make_contrat(data['contrat']))
+    return contrats
+
+
+class TestGetDeclarations(unittest.TestCase):
+
+    def setUp(self):
+        self.contrats = load_contrats()
+        self.today = date(2023, 2, 7)
+
+    def test_same_as_declaration(self):
+        for mois_courant in [date(2023, 1, 1), date(2023, 2, 1), date(2023, 9, 1)]:
+            declarations = PajemploiDeclarationBatch(self.contrats).get_declarations(mois_courant, self.today)
+            expected = [PajemploiDeclaration(contrat).get_declaration(mois_courant, self.today)
+                        for contrat in self.contrats]
+            self.assertListEqual(declarations, expected)
+
+    def test_processus(self):
+        mois_courant = date(2023, 1, 1)
+        contrats = self.contrats * 3
+        declarations = PajemploiDeclarationBatch(contrats).get_declarations(mois_courant, self.today,
+                                                                            processus=2, taille_lot=2)
+        expected = PajemploiDeclarationBatch(contrats).get_declarations(mois_courant, self.today)
+        self.assertListEqual(declarations, expected)
+
+    def test_invalid_taille_lot(self):
+        with self.assertRaises(ValueError):
+            PajemploiDeclarationBatch(self.contrats).get_declarations(date(2023, 1, 1), self.today, taille_lot=0)
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller.planning.planning_annee import PlanningAnnee  # nopep8 # noqa: E402
+from simple_ass_mat.controller.planning.planning_error import PlanningAnneeError, SemaineIdError  # nopep8 # noqa: E402
+
+
+class TestGetSemaineId(unittest.TestCase):
+
+    def test_nominal(self):
+        planning_annee = PlanningAnnee({0: [[1, 5], [8, 14]], 1: [[7], [16]]})
+
+        self.assertEqual(planning_annee.get_semaine_id(1), 0)
+        self.assertEqual(planning_annee.get_semaine_id(5), 0)
+        self.assertEqual(planning_annee.get_semaine_id(7), 1)
+        self.assertEqual(planning_annee.get_semaine_id(14), 0)
+        self.assertEqual(planning_annee.get_semaine_id(16), 1)
+
+    def test_semaine_numero_not_found(self):
+        planning_annee = PlanningAnnee({0: [[1, 5]], 1: [[7]]})
+
+        for semaine_numero in [0, 6, 8, 53, 54, -1]:
+            with self.assertRaises(SemaineIdError):
+                planning_annee.get_semaine_id(semaine_numero)
+
+
+class TestConstructor(unittest.TestCase):
+
+    def test_invalid_interval_length(self):
+        with self.assertRaises(PlanningAnneeError):
+            PlanningAnnee({0: [[1, 5, 7]]})
+
+    def test_invalid_interval_order(self):
+        with self.assertRaises(PlanningAnneeError):
+            PlanningAnnee({0: [[5, 1]]})
+
+    def test_invalid_interval_range(self):
+        with self.assertRaises(PlanningAnneeError):
+            PlanningAnnee({0: [[50, 54]]})
+
+    def test_overlapping_intervals(self):
+        with self.assertRaises(PlanningAnneeError):
+            PlanningAnnee({0: [[1, 10]], 1: [[10, 12]]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=protected-access
+
+import unittest
+import sys
+import os
+from datetime import date, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller.planning import (  # nopep8 # noqa: E402
+    Planning, PlanningJour, PlanningSemaine, PlanningAnnee)
+
+
+def make_planning():
+    jours = {0: {"horaires": [["08:00", "18:00"]], "dejeuner": True},
+             1: {"horaires": [["08:00", "12:00"]], "gouter": True}}
+    semaines = {0: {"lundi": 0, "mardi": 0, "mercredi": 1, "jeudi": 0, "vendredi": 0,
+                    "samedi": None, "dimanche": None},
+                1: {"lundi": None, "mardi": 1, "mercredi": None, "jeudi": 1, "vendredi": None,
+                    "samedi": None, "dimanche": None}}
+    annees = {0: [[1, 5], [8, 14], [17, 27], [36, 42], [45, 51]], 1: [[7], [16], [28], [34, 35], [44]]}
+    planning_jour = PlanningJour(jours)
+    return Planning(planning_jour, PlanningSemaine(semaines, planning_jour), PlanningAnnee(annees), [[29, 33]])
+
+
+class TestCompile(unittest.TestCase):
+
+    def test_same_as_resolution(self):
+        planning = make_planning()
+        planning_compile = planning.compile(2023)
+
+        i_date = date(2023, 1, 1)
+        while i_date.year == 2023:
+            jour_id = planning._resoudre_jour_id_par_date(i_date)
+            self.assertEqual(planning_compile.get_jour_id(i_date), jour_id)
+            self.assertEqual(planning_compile.avec_frais_repas_dejeuner(i_date), jour_id == 0)
+            self.assertEqual(planning_compile.avec_frais_repas_gouter(i_date), jour_id == 1)
+            i_date += timedelta(days=1)
+
+    def test_compiled_once_per_year(self):
+        planning = make_planning()
+        self.assertIs(planning.compile(2023), planning.compile(2023))
+        self.assertIsNot(planning.compile(2023), planning.compile(2024))
+
+    def test_mois(self):
+        planning = make_planning()
+        # 2023-02 (semaines %U): 05 type 0 du mercredi au samedi, 06 absente, 07 type 1, 08 et 09 type 0
+        self.assertEqual(planning.get_jours_travailles_planifies_mois_par_date(date(2023, 2, 1)), 3 + 2 + 5 + 2)
+        self.assertEqual(planning.get_heures_travaillees_prevu_mois_par_date(date(2023, 2, 1)),
+                         (10 + 4 + 10) + (4 + 4) + (10 + 10 + 4 + 10 + 10) + (10 + 10))
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
@@ -16,6 +16,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
 
 
 from simple_ass_mat.controller.planning import PlanningJour, JourIdError  # nopep8 # noqa: E402
+from simple_ass_mat.controller.planning.planning_error import HorairesError  # nopep8 # noqa: E402
 
 
 class TestHeuresTravailleesJourParId(unittest.TestCase):
@@ -40,6 +41,19 @@ class TestHeuresTravailleesJourParId(unittest.TestCase):
         with self.assertRaises(JourIdError):
             planning_jour.get_heures_travaillees(1)
 
+    def test_missing_horaires(self):
+        jours = {0: {"dejeuner": True}}
+        planning_jour = PlanningJour(jours)
+
+        with self.assertRaises(HorairesError):
+            planning_jour.get_heures_travaillees(0)
+
+    def test_invalid_horaires_at_construction(self):
+        jours = {0: {"horaires": [["08:00", "25:00"]]}}
+
+        with self.assertRaises(ValueError):
+            PlanningJour(jours)
+
 
 if __name__ == '__main__':
     import locale
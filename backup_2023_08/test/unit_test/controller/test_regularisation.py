@@ -0,0 +1,83 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))  # OK
+
+
+from simple_ass_mat.controller import factory  # nopep8 # noqa: E402
+from simple_ass_mat.controller.evaluation_mois import EvaluationMois  # nopep8 # noqa: E402
+from simple_ass_mat.controller.regularisation import regularisation_annuelle  # nopep8 # noqa: E402
+
+
+def make_contrat():
+    data_filepath = Path(__file__).parent.parent.parent / "pajemploi" / "annee_incomplete" \
+        / "data_pajemploi_exemple_annee_incomplete.yml"
+    with open(data_filepath, 'r', encoding='UTF-8') as file:
+        data = yaml.safe_load(file)
+    return factory.make_contrat(data['contrat'])
+
+
+class TestRegularisationAnnuelle(unittest.TestCase):
+
+    def test_same_as_evaluation_mois(self):
+        contrat = make_contrat()
+        regularisation = regularisation_annuelle(contrat, 2023)
+
+        self.assertEqual(len(regularisation.mois), 12)
+        # mois 10 a 12 non compares: sans heure prevue, EvaluationMois divise par zero dans le salaire net
+        for mois in range(1, 10):
+            evaluation = EvaluationMois(contrat, date(2023, mois, 1))
+            totaux = regularisation.mois[mois - 1]
+            self.assertEqual(totaux.heures_prevues, evaluation.heures_travaillees_prevu)
+            self.assertEqual(totaux.heures_absence_non_remuneree, evaluation.heure_absence_non_remuneree)
+            self.assertEqual(totaux.heures_complementaires, evaluation.heures_complementaires)
+            self.assertEqual(totaux.heures_majorees, evaluation.heures_majorees)
+            self.assertEqual(totaux.salaire_net_verse, evaluation.salaire_net)
+
+    def test_total(self):
+        regularisation = regularisation_annuelle(make_contrat(), 2023)
+
+        self.assertEqual(regularisation.total.heures_prevues, 1480)
+        self.assertEqual(regularisation.total.heures_realisees, 1410)
+        self.assertEqual(regularisation.total.heures_complementaires, 5)
+        self.assertEqual(regularisation.total.heures_majorees, 5)
+        self.assertEqual(regularisation.total.heures_absence_non_remuneree, 80)
+        self.assertAlmostEqual(regularisation.total.delta_salaire_net,
+                               regularisation.total.salaire_net_du - regularisation.total.salaire_net_verse)
+        self.assertAlmostEqual(regularisation.total.delta_salaire_net,
+                               sum(totaux.delta_salaire_net for totaux in regularisation.mois))
+
+    def test_jour_evalue_une_fois(self):
+        contrat = make_contrat()
+        dates_evaluees = []
+        get_heures_jour = contrat.planning.get_heures_travaillees_jour_par_date
+
+        def compter(date_):
+            dates_evaluees.append(date_)
+            return get_heures_jour(date_)
+
+        contrat.planning.get_heures_travaillees_jour_par_date = compter
+        regularisation_annuelle(contrat, 2023)
+        self.assertEqual(len(dates_evaluees), len(set(dates_evaluees)))
+
+
+if __name__ == '__main__':
+    import locale
+    locale.setlocale(locale.LC_ALL, 'fr-FR')
+
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+
+Benchmark the memory footprint of a Contrat of the planning model.
+
+Each contrat has its own creneaux, jours and semaine type, as contrats loaded from different user files:
+two jour types, one semaine type of four days for 47 weeks, one remuneration.
+The value objects are compared to plain classes holding the same attributes in an instance __dict__,
+as the model classes did before ValueObject.
+
+usage: python benchmark/bench_memory_contrat.py [--contrats N]
+"""
+# pylint: disable=wrong-import-position
+
+import argparse
+import sys
+import os
+import tracemalloc
+from datetime import time, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from simple_ass_mat.model.contrat import Contrat  # nopep8 # noqa: E402
+from simple_ass_mat.model.model_factory import make_planning_with_range  # nopep8 # noqa: E402
+from simple_ass_mat.model.planning import CreneauHoraire, JourAcceuil, SemaineAcceuil  # nopep8 # noqa: E402
+from simple_ass_mat.model.remuneration import Remuneration  # nopep8 # noqa: E402
+
+
+def make_semaine_acceuil(index: int) -> SemaineAcceuil:
+    """Semaine acceuil with horaires depending on index"""
+    minute = index % 60
+    jour_long = JourAcceuil(CreneauHoraire(time(8, minute), time(18, minute)))
+    jour_court = JourAcceuil(CreneauHoraire(time(8, minute), time(12, minute)))
+    return SemaineAcceuil(lundi=jour_long, mardi=jour_long, mercredi=jour_court, jeudi=jour_long)
+
+
+class PlainCreneauHoraire:  # pylint: disable=too-few-public-methods
+    """CreneauHoraire without __slots__"""
+
+    def __init__(self, horaire_debut: time, horaire_fin: time) -> None:
+        self._horaire_debut = horaire_debut
+        self._horaire_fin = horaire_fin
+        self._duree_minutes = (horaire_fin.hour * 60 + horaire_fin.minute) \
+            - (horaire_debut.hour * 60 + horaire_debut.minute)
+        self._duree = timedelta(minutes=self._duree_minutes)
+
+
+class PlainJourAcceuil:  # pylint: disable=too-few-public-methods
+    """JourAcceuil without __slots__"""
+
+    def __init__(self, creneau_horaire: PlainCreneauHoraire) -> None:
+        self._creneau_horaire = creneau_horaire
+
+
+class PlainSemaineAcceuil:  # pylint: disable=too-few-public-methods
+    """SemaineAcceuil without __slots__, jours by name"""
+
+    def __init__(self, **jours: PlainJourAcceuil) -> None:
+        self._jours = {jour: jours.get(jour)
+                       for jour in ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche")}
+
+
+class PlainRemuneration:  # pylint: disable=too-few-public-methods
+    """Remuneration without __slots__"""
+
+    def __init__(self, salaire_horaire_brut: float) -> None:
+        self._salaire_horaire_brut = salaire_horaire_brut
+
+
+def make_contrat(index: int) -> Contrat:
+    """Contrat with horaires depending on index"""
+    planning = make_planning_with_range({(1, 47): make_semaine_acceuil(index)}, [48, 49, 50, 51, 52])
+    return Contrat(planning, Remuneration(4.10 + index / 1000))
+
+
+def make_value_objects(index: int) -> tuple:
+    """Contrat objects without the Planning"""
+    return make_semaine_acceuil(index), Remuneration(4.10 + index / 1000)
+
+
+def make_plain_objects(index: int) -> tuple:
+    """Same objects as make_value_objects, from plain classes"""
+    minute = index % 60
+    jour_long = PlainJourAcceuil(PlainCreneauHoraire(time(8, minute), time(18, minute)))
+    jour_court = PlainJourAcceuil(PlainCreneauHoraire(time(8, minute), time(12, minute)))
+    semaine = PlainSemaineAcceuil(lundi=jour_long, mardi=jour_long, mercredi=jour_court, jeudi=jour_long)
+    return semaine, PlainRemuneration(4.10 + index / 1000)
+
+
+def measure(make, count: int) -> int:
+    """Return the memory allocated by count objects, in bytes"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [make(index) for index in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def main():
+    """main"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contrats", type=int, default=10000)
+    args = parser.parse_args()
+
+    for name, make in [("contrat", make_contrat), ("semaine, jours, creneaux, remuneration", make_value_objects)]:
+        size = measure(make, args.contrats)
+        print(f"{name}: {size / 1024 / 1024:.1f} MiB for {args.contrats}, {size / args.contrats:.0f} bytes each")
+
+    plain = measure(make_plain_objects, args.contrats) / args.contrats
+    slots = measure(make_value_objects, args.contrats) / args.contrats
+    print(f"value objects vs plain classes: {slots:.0f} vs {plain:.0f} bytes each, "
+          f"{100 * (plain - slots) / plain:.0f}% less")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+
+Benchmark YAML parsing, pure Python SafeLoader versus libyaml CSafeLoader.
+
+The contrat file is generated with a planning and one year of garde data per day,
+the size of a real user file after a year of declarations.
+
+usage: python benchmark/bench_yaml_loader.py [--annees N] [--repetitions N]
+"""
+# pylint: disable=wrong-import-position
+
+import argparse
+import datetime
+import sys
+import os
+import tempfile
+import timeit
+from pathlib import Path
+
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from simple_ass_mat.model.data_loader.yaml_file_loader import get_yaml_safe_loader  # nopep8 # noqa: E402
+
+
+def make_contrat_data(annees: int) -> dict:
+    """Contrat with planning and garde data for each day of the given number of years"""
+    garde = {}
+    date = datetime.date(2023, 1, 1)
+    while date.year < 2023 + annees:
+        if date.weekday() < 5:
+            jour = {"heures": [["08:00", "12:00"], ["13:30", "18:15"]], "dejeuner": True, "gouter": True}
+            if date.day % 17 == 0:
+                jour = {"absence_non_remuneree": True}
+            garde.setdefault(date.strftime("%Y"), {}).setdefault(date.strftime("%m"), {})[date.strftime("%d")] = jour
+        date += datetime.timedelta(days=1)
+
+    return {
+        "contrat": {
+            "description": "Benchmark contrat",
+            "remuneration": {"salaire_horaire_brut": 4.10},
+            "planning": {
+                "jours_type": {0: [["08:00", "18:00"]], 1: [["08:00", "12:00"]]},
+                "semaines_type": {0: {"lundi": 0, "mardi": 0, "mercredi": 1, "jeudi": 0, "vendredi": 0,
+                                      "samedi": None, "dimanche": None}},
+                "semaines_presences": {0: [[1, 5], [7, 14], [16, 30], [33, 50], [52]]},
+                "conges_payes": [[6], [15], [31, 32], [51]],
+            },
+            "garde": garde,
+        }
+    }
+
+
+def bench(filepath: Path, libyaml: bool, repetitions: int) -> float:
+    """Return the best parse time in seconds"""
+    loader = get_yaml_safe_loader(libyaml)
+
+    def parse():
+        with open(filepath, "r", encoding="utf-8") as file:
+            yaml.load(file, Loader=loader)
+
+    return min(timeit.repeat(parse, number=1, repeat=repetitions))
+
+
+def main():
+    """main"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--annees", type=int, default=1, help="years of garde data")
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dirpath:
+        filepath = Path(tmp_dirpath) / "contrat.yml"
+        with open(filepath, "w", encoding="utf-8") as file:
+            yaml.safe_dump(make_contrat_data(args.annees), file)
+
+        print(f"file size: {filepath.stat().st_size / 1024:.1f} KiB, {args.annees} year(s) of garde data")
+        print(f"libyaml available: {get_yaml_safe_loader() is not yaml.SafeLoader}")
+
+        python_time = bench(filepath, False, args.repetitions)
+        libyaml_time = bench(filepath, True, args.repetitions)
+        print(f"SafeLoader : {python_time * 1000:8.2f} ms")
+        print(f"CSafeLoader: {libyaml_time * 1000:8.2f} ms (x{python_time / libyaml_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,27 +7,46 @@ Description: Represent contrat entre parent employeur et ass.mat.
 
 from .remuneration import Remuneration
 from .planning import Planning
+from .value_object import ValueObject
 
 
-class Contrat:
-    """Contrat pour un enfant entre parent employeur et ass.mat."""
+class Contrat(ValueObject):
+    """Contrat pour un enfant entre parent employeur et ass.mat.
+
+    Planning is compared by identity
+    """
+
+    __slots__ = ("_planning", "_remuneration")
+    _planning: Planning
+    _remuneration: Remuneration
 
     def __init__(self, planning: Planning, remuneration: Remuneration) -> None:
-        self._planning = planning
-        self._remuneration = remuneration
+        self._set("_planning", planning)
+        self._set("_remuneration", remuneration)
+
+    def _values(self) -> tuple:
+        return self._planning, self._remuneration
+
+    def get_planning(self) -> Planning:
+        """Return le planning"""
+        return self._planning
+
+    def get_remuneration(self) -> Remuneration:
+        """Return la remuneration"""
+        return self._remuneration
 
     def get_duree_acceuil_hebdomadaire_moyen(self) -> float:
         """Return la durée d'acceuil hebdomadaire moyen
 
-        = nombre heure semaine * nombre semaine acceuil / 52
+        = nombre heure annee / 52, nombre heure annee est la somme des semaines d'acceuil
         """
-        return self._planning.get_nombre_heure_semaine() * self._planning.get_nombre_semaine_acceuil() / 52
+        return self._planning.get_nombre_heure_annee() / 52
 
     def get_duree_acceuil_mensualisee(self) -> float:
         """Return la durée d'acceuil mensualisée
 
-        = nombre heure par semaine * 52 / 12"""
-        return self._planning.get_nombre_heure_semaine() * 52 / 12
+        = nombre heure par semaine * 52 / 12, moyenne des semaines d'acceuil"""
+        return self._planning.get_nombre_heure_mensualisee()
 
     def get_remuneration_brut_mensualisee(self) -> float:
         """Return la remuneration brut mensualisee
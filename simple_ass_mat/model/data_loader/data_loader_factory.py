@@ -4,18 +4,67 @@ Date: 2023-08
 Description:
 """
 
-from .i_data_loader import IDataLoader
-from .yaml_file_loader import YamlFileLoader
+from pathlib import Path
+
+from .i_data_loader import IDataLoader, IGardeDataLoader
+from .yaml_file_loader import YamlFileLoader, FileFormatError
+from .snapshot_file_loader import SnapshotFileLoader, write_snapshot, compute_content_checksum
+from .garde_stream_loader import JsonLinesGardeLoader, CsvGardeLoader
 from .yaml_schema_validator import YamlSchemaValidator
+from .fast_schema_validator import FastSchemaValidator
 
 
 class DataLoaderFactory:
     """Data Loader Factory"""
 
     @staticmethod
-    def make_data_loader(data_loader_type: str) -> IDataLoader:
-        """Make data loader"""
+    def make_data_loader(data_loader_type: str, validator_type: str = "cerberus") -> IDataLoader:
+        """Make data loader
+
+        validator_type: "cerberus" or "fast", the schema compiled to Python checks
+        """
         if data_loader_type == "yaml":
-            validator = YamlSchemaValidator()
+            validator = DataLoaderFactory.make_schema_validator(validator_type)
             return YamlFileLoader(validator)
+        if data_loader_type == "snapshot":
+            return SnapshotFileLoader()
         raise ValueError(f"Unknown data loader type: {data_loader_type}")
+
+    @staticmethod
+    def load_with_snapshot(source_filepath: Path, snapshot_filepath: Path) -> IDataLoader:
+        """Return a loaded data loader, from the snapshot when it is up to date with the YAML file
+
+        Otherwise the YAML file is loaded and validated, and the snapshot is written again
+        with the checksum of the bytes that were parsed.
+        """
+        snapshot_loader = SnapshotFileLoader(source_filepath)
+        try:
+            snapshot_loader.load(snapshot_filepath)
+            return snapshot_loader
+        except (FileNotFoundError, FileFormatError):
+            pass
+
+        with open(source_filepath, "rb") as file:
+            content = file.read()
+        yaml_loader = YamlFileLoader(DataLoaderFactory.make_schema_validator("cerberus"))
+        yaml_loader.load_content(content)
+        write_snapshot(yaml_loader, compute_content_checksum(content), snapshot_filepath)
+        return yaml_loader
+
+    @staticmethod
+    def make_schema_validator(validator_type: str) -> YamlSchemaValidator | FastSchemaValidator:
+        """Make YAML schema validator"""
+        if validator_type == "cerberus":
+            return YamlSchemaValidator()
+        if validator_type == "fast":
+            return FastSchemaValidator()
+        raise ValueError(f"Unknown validator type: {validator_type}")
+
+    @staticmethod
+    def make_garde_data_loader(data_loader_type: str) -> IGardeDataLoader:
+        """Make garde data loader"""
+        if data_loader_type == "jsonl":
+            return JsonLinesGardeLoader()
+        if data_loader_type == "csv":
+            return CsvGardeLoader()
+        raise ValueError(f"Unknown garde data loader type: {data_loader_type}")
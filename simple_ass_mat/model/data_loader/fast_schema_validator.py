@@ -0,0 +1,230 @@
+"""
+Author: Nicolas Boutin
+Date: 2023-08
+Description: Fast schema validator, the Cerberus schema compiled to Python checks
+"""
+
+import logging
+from collections.abc import Callable, Mapping
+from typing import NamedTuple
+
+from cerberus import Validator
+
+from .yaml_schema_validator import get_schema
+
+logger = logging.getLogger(__name__)
+
+
+class ErrorType(NamedTuple):
+    """Error of a document value
+
+    groupes: for each field of path, rank of the rule that reached it, see _GROUPES
+    """
+    path: tuple
+    message: str
+    groupes: tuple[int, ...]
+
+
+CheckType = Callable[[Mapping, list[ErrorType]], None]
+
+# Cerberus messages, cerberus.errors.BasicErrorHandler
+_REQUIRED_FIELD = "required field"
+_UNKNOWN_FIELD = "unknown field"
+_NULL_VALUE = "null value not allowed"
+
+_SUPPORTED_RULES = {"type", "nullable", "required", "keysrules", "valuesrules", "schema"}
+# Cerberus reports the errors of these rules grouped, the groups of a value are sorted by rule name
+_GROUPES = {"keysrules": 0, "schema": 1, "valuesrules": 2}
+
+
+class SchemaCompiler:
+    """Generate the source of a check function from a Cerberus schema
+
+    Only the rules used by user_file_schema.yaml are supported, any other rule raises ValueError
+    so the checks cannot silently differ from Cerberus.
+    Rules are checked in Cerberus order: nullable, type, then the other rules in schema order.
+    """
+
+    def __init__(self, require_all: bool) -> None:
+        self._require_all = require_all
+        self._lines: list[str] = []
+        self._constants: dict[str, object] = {}
+        self._compteur = 0
+
+    def compile(self, schema: Mapping) -> CheckType:
+        """Return check(document, errors), errors is filled with (path, message)"""
+        self._lines = ["def check(document, errors):"]
+        self._compile_schema(schema, "document", [], [], 1)
+
+        namespace = dict(self._constants, ErrorType=ErrorType)
+        exec(compile(self.source, "<user_file_schema>", "exec"), namespace)  # pylint: disable=exec-used
+        return namespace["check"]
+
+    @property
+    def source(self) -> str:
+        """Generated source"""
+        return "\n".join(self._lines) + "\n"
+
+    def _emit(self, indent: int, line: str) -> None:
+        self._lines.append("    " * indent + line)
+
+    def _name(self, prefix: str) -> str:
+        self._compteur += 1
+        return f"{prefix}{self._compteur}"
+
+    def _constant(self, prefix: str, value) -> str:
+        name = self._name(prefix.upper())
+        self._constants[name] = value
+        return name
+
+    @staticmethod
+    def _path(path: list[str]) -> str:
+        return "(" + ", ".join(path) + ",)"
+
+    def _error(self, path: list[str], groupes: list[int], message: str) -> str:
+        return f"errors.append(ErrorType({self._path(path)}, {message!r}, {tuple(groupes)!r}))"
+
+    def _compile_rules(self, rules: Mapping, value: str, path: list[str], groupes: list[int],
+                       indent: int) -> None:
+        """Checks of one value"""
+        unsupported = set(rules) - _SUPPORTED_RULES
+        if unsupported:
+            raise ValueError(f"Unsupported schema rules {sorted(unsupported)} at {path}")
+        if set(rules) & {"keysrules", "valuesrules", "schema"} and rules.get("type") != "dict":
+            raise ValueError(f"Mapping rules without dict type at {path}")
+
+        self._emit(indent, f"if {value} is None:")
+        if rules.get("nullable", False):
+            self._emit(indent + 1, "pass")
+        else:
+            self._emit(indent + 1, self._error(path, groupes, _NULL_VALUE))
+
+        if "type" in rules:
+            type_definition = Validator.types_mapping[rules["type"]]
+            condition = f"not isinstance({value}, {self._constant('types', type_definition.included_types)})"
+            if type_definition.excluded_types:
+                condition += f" or isinstance({value}, {self._constant('types', type_definition.excluded_types)})"
+            self._emit(indent, f"elif {condition}:")
+            self._emit(indent + 1, self._error(path, groupes, f"must be of {rules['type']} type"))
+
+        if set(rules) & {"keysrules", "valuesrules", "schema"}:
+            self._emit(indent, "else:")
+        for rule, constraint in rules.items():
+            if rule == "keysrules":
+                key = self._name("key")
+                self._emit(indent + 1, f"for {key} in {value}:")
+                self._compile_rules(constraint, key, path + [key], groupes + [_GROUPES[rule]], indent + 2)
+            elif rule == "valuesrules":
+                key, item = self._name("key"), self._name("value")
+                self._emit(indent + 1, f"for {key}, {item} in {value}.items():")
+                self._compile_rules(constraint, item, path + [key], groupes + [_GROUPES[rule]], indent + 2)
+            elif rule == "schema":
+                self._compile_schema(constraint, value, path, groupes, indent + 1)
+
+    def _compile_schema(self, schema: Mapping, mapping: str, path: list[str], groupes: list[int],
+                        indent: int) -> None:
+        """Checks of each field of a mapping, then required and unknown fields"""
+        groupes = groupes + [_GROUPES["schema"]]
+        for field, rules in schema.items():
+            item = self._name("value")
+            self._emit(indent, f"if {field!r} in {mapping}:")
+            self._emit(indent + 1, f"{item} = {mapping}[{field!r}]")
+            self._compile_rules(rules, item, path + [repr(field)], groupes, indent + 1)
+            if rules.get("required", self._require_all):
+                self._emit(indent, "else:")
+                self._emit(indent + 1, self._error(path + [repr(field)], groupes, _REQUIRED_FIELD))
+
+        key = self._name("key")
+        self._emit(indent, f"for {key} in {mapping}:")
+        self._emit(indent + 1, f"if {key} not in {self._constant('fields', frozenset(schema))}:")
+        self._emit(indent + 2, self._error(path + [key], groupes, _UNKNOWN_FIELD))
+
+
+def _error_sort_key(error: ErrorType) -> tuple:
+    """Cerberus order: by group then by field at each level of the path
+
+    Fields are compared as cerberus.utils.compare_paths_lt, integer keys before string keys.
+    Cerberus cannot compare other keys and raises TypeError, they are sorted last by repr instead.
+    """
+    sort_key = []
+    for groupe, field in zip(error.groupes, error.path):
+        if isinstance(field, int):
+            sort_key.append((groupe, 0, field, ""))
+        elif isinstance(field, str):
+            sort_key.append((groupe, 1, 0, field))
+        else:
+            sort_key.append((groupe, 2, 0, repr(field)))
+    return tuple(sort_key)
+
+
+def make_errors_tree(errors: list[ErrorType]) -> dict:
+    """Cerberus errors format, messages of a field first then the errors of its children
+
+    Errors are sorted as Cerberus does, the sort is stable so the messages of a field keep the order of the rules.
+    """
+    tree: dict = {}
+    for path, message, _ in sorted(errors, key=_error_sort_key):
+        node = tree
+        for field in path[:-1]:
+            entry = node.setdefault(field, [])
+            if not entry or not isinstance(entry[-1], dict):
+                entry.append({})
+            node = entry[-1]
+
+        entry = node.setdefault(path[-1], [])
+        if entry and isinstance(entry[-1], dict):
+            entry.insert(len(entry) - 1, message)
+        else:
+            entry.append(message)
+    return tree
+
+
+class _CompiledSchema:  # pylint: disable=too-few-public-methods
+    """Check function of the last schema returned by get_schema"""
+
+    def __init__(self) -> None:
+        self._schema: Mapping | None = None
+        self._check: CheckType | None = None
+
+    def get_check(self) -> CheckType:
+        """Return the check function, compiled again once the schema cache is invalidated"""
+        schema = get_schema()
+        if self._check is None or self._schema is not schema:
+            self._check = SchemaCompiler(require_all=True).compile(schema)
+            self._schema = schema
+        return self._check
+
+
+_COMPILED_SCHEMA = _CompiledSchema()
+
+
+def get_check() -> CheckType:
+    """Return the check function of the cached schema"""
+    return _COMPILED_SCHEMA.get_check()
+
+
+class FastSchemaValidator:
+    """YAML Schema validator, same result and errors as YamlSchemaValidator without walking the schema
+
+    Errors are in Cerberus order, except in a mapping with both integer and string keys in error:
+    Cerberus order is not defined there, integer keys come first.
+    """
+
+    def __init__(self) -> None:
+        self._check = get_check()
+        self._errors: dict = {}
+
+    @property
+    def errors(self):
+        """Return errors"""
+        return self._errors
+
+    def validate(self, yaml_data):
+        """Validate YAML data"""
+        errors: list[ErrorType] = []
+        self._check({'document': yaml_data}, errors)
+        self._errors = make_errors_tree(errors)
+        if self._errors:
+            logger.error(self._errors)
+            return False
+        return True
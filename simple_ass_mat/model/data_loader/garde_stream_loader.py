@@ -0,0 +1,162 @@
+"""
+Author: Nicolas Boutin
+Date: 2023-08
+Description: Garde days stream loaders, JSON Lines and CSV
+"""
+
+import csv
+import datetime
+import json
+from abc import abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+
+from .i_data_loader import IGardeDataLoader, JourGardeType
+from .yaml_file_loader import FileFormatError
+
+
+class GardeStreamLoader(IGardeDataLoader):
+    """Read garde days line by line, one day per line
+
+    Only one line is held in memory at a time. The position of the last complete line read is kept,
+    so days appended to the file are read by load_nouveaux without reading the history again.
+    A line is read once it ends with a newline, a line still being written is left for the next read.
+    """
+
+    CHAMPS = ("absence_payee", "absence_non_remuneree", "heures", "dejeuner", "gouter")
+
+    def __init__(self) -> None:
+        self._filepath: Path | None = None
+        self._position = 0
+        self._numero_ligne = 0
+
+    def load(self, filepath: Path) -> Iterator[JourGardeType]:
+        """Read garde days from the beginning of the file"""
+        self._filepath = Path(filepath)
+        self._position = 0
+        self._numero_ligne = 0
+        self._reset()
+        return self._read()
+
+    def load_nouveaux(self) -> Iterator[JourGardeType]:
+        """Read garde days appended to the file since the last read"""
+        if self._filepath is None:
+            raise ValueError("load must be called before load_nouveaux")
+        return self._read()
+
+    def _read(self) -> Iterator[JourGardeType]:
+        """Read complete lines from the last position"""
+        with open(self._filepath, "rb") as file:
+            file.seek(self._position)
+            while True:
+                line = file.readline()
+                if not line.endswith(b"\n"):
+                    break
+
+                self._position = file.tell()
+                self._numero_ligne += 1
+                text = line.decode("utf-8").strip()
+                if not text:
+                    continue
+
+                try:
+                    jour_garde = self._parse_line(text)
+                except (ValueError, KeyError, TypeError) as error:
+                    raise FileFormatError(f"{self._filepath}:{self._numero_ligne}: {error}") from error
+
+                if jour_garde is not None:
+                    yield jour_garde
+
+    def _reset(self) -> None:
+        """Reset parsing state before reading from the beginning"""
+
+    @abstractmethod
+    def _parse_line(self, text: str) -> JourGardeType | None:
+        """Parse one line, return None if the line holds no garde day"""
+
+    @staticmethod
+    def _check_valeur(champ: str, valeur) -> None:
+        """Check a field value, heures are ordered [start, end] ranges of HH:MM times, flags are booleans"""
+        if champ not in GardeStreamLoader.CHAMPS:
+            raise ValueError(f"unknown field '{champ}'")
+        if champ != "heures":
+            if not isinstance(valeur, bool):
+                raise ValueError(f"field '{champ}' expects a boolean, got {valeur!r}")
+            return
+
+        if not isinstance(valeur, list):
+            raise ValueError(f"field 'heures' expects a list of time ranges, got {valeur!r}")
+        for plage in valeur:
+            if not isinstance(plage, list) or len(plage) != 2 or not all(isinstance(heure, str) for heure in plage):
+                raise ValueError(f"invalid time range {plage!r}")
+            debut, fin = (datetime.time.fromisoformat(heure) for heure in plage)
+            if debut > fin:
+                raise ValueError(f"time range {plage!r} ends before it starts")
+
+
+class JsonLinesGardeLoader(GardeStreamLoader):
+    """JSON Lines garde loader
+
+    {"date": "2023-01-10", "heures": [["08:00", "20:30"]], "dejeuner": true}
+    """
+
+    def _parse_line(self, text: str) -> JourGardeType:
+        record = json.loads(text)
+        if not isinstance(record, dict):
+            raise ValueError(f"expected a JSON object, got {type(record).__name__}")
+        if "date" not in record:
+            raise ValueError("missing field 'date'")
+        date = datetime.date.fromisoformat(record.pop("date"))
+
+        for champ, valeur in record.items():
+            GardeStreamLoader._check_valeur(champ, valeur)
+        return date, record
+
+
+class CsvGardeLoader(GardeStreamLoader):
+    """CSV garde loader, first line is the header, empty cells are not set
+
+    date,heures,absence_payee,absence_non_remuneree,dejeuner,gouter
+    2023-01-10,08:00-12:00 14:00-18:00,,,true,
+    """
+
+    _BOOLEENS = {"true": True, "1": True, "false": False, "0": False}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._colonnes: list[str] | None = None
+
+    def _reset(self) -> None:
+        self._colonnes = None
+
+    def _parse_line(self, text: str) -> JourGardeType | None:
+        valeurs = next(csv.reader([text]))
+
+        if self._colonnes is None:
+            colonnes = [colonne.strip() for colonne in valeurs]
+            champs_inconnus = set(colonnes) - set(GardeStreamLoader.CHAMPS) - {"date"}
+            if "date" not in colonnes or champs_inconnus:
+                raise ValueError(f"invalid header {colonnes}")
+            self._colonnes = colonnes
+            return None
+
+        if len(valeurs) != len(self._colonnes):
+            raise ValueError(f"expected {len(self._colonnes)} values, got {len(valeurs)}")
+
+        record = {}
+        for colonne, valeur in zip(self._colonnes, valeurs):
+            valeur = valeur.strip()
+            if valeur and colonne != "date":
+                record[colonne] = self._parse_valeur(colonne, valeur)
+
+        date = datetime.date.fromisoformat(valeurs[self._colonnes.index("date")].strip())
+        return date, record
+
+    @staticmethod
+    def _parse_valeur(colonne: str, valeur: str):
+        """Convert a CSV cell to the garde data structure"""
+        if colonne == "heures":
+            heures = [plage.split("-") for plage in valeur.split()]
+            GardeStreamLoader._check_valeur(colonne, heures)
+            return heures
+        return CsvGardeLoader._BOOLEENS[valeur.lower()]
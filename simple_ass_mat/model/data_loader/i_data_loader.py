@@ -4,7 +4,9 @@ Date: 2023-08
 Description:
 """
 
+import datetime
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
 
 RemunerationDataType = dict[str, float]
@@ -20,6 +22,16 @@ SemaineType = dict[str, int]
 
 JourType = dict[int, list] | None
 
+CongesPayesType = list[list[int]]
+
+JourGardeType = tuple[datetime.date, dict]
+"""
+JourGardeType type alias
+
+date: datetime.date
+jour: dict, keys absence_payee, absence_non_remuneree, heures, dejeuner, gouter
+"""
+
 
 class IDataLoader(ABC):
     """Interface Data Loader"""
@@ -43,3 +55,19 @@ class IDataLoader(ABC):
     @abstractmethod
     def get_jour_type_data(self, jour_id: int) -> JourType:
         """Return jour type data"""
+
+    @abstractmethod
+    def get_conges_payes_data(self) -> CongesPayesType:
+        """Return conges payes data"""
+
+
+class IGardeDataLoader(ABC):
+    """Interface Garde Data Loader, read garde days as a stream"""
+
+    @abstractmethod
+    def load(self, filepath: Path) -> Iterator[JourGardeType]:
+        """Read garde days from the beginning of the file"""
+
+    @abstractmethod
+    def load_nouveaux(self) -> Iterator[JourGardeType]:
+        """Read garde days appended to the file since the last read"""
@@ -0,0 +1,249 @@
+"""
+Author: Nicolas Boutin
+Date: 2023-08
+Description: Binary snapshot of the contrat data, reloaded without YAML parsing nor schema validation
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+from .i_data_loader import IDataLoader, RemunerationDataType, SemainesPresenceType, JourType, SemaineType, \
+    CongesPayesType
+from .yaml_file_loader import FileFormatError
+
+
+class StaleSnapshotError(FileFormatError):
+    """Snapshot written from another version of the source file"""
+
+
+JOURS_SEMAINE = ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche")
+
+# little endian, no padding
+# header: magic, version, sha256 of the source file
+_HEADER = struct.Struct("<4sH32s")
+_MAGIC = b"SAMS"
+_VERSION = 1
+_REMUNERATION = struct.Struct("<d")
+_COUNT = struct.Struct("<H")
+# jour type: id, nombre de creneaux, then debut et fin en minutes for each creneau
+_JOUR_TYPE = struct.Struct("<iH")
+_CRENEAU = struct.Struct("<HH")
+# semaine type: id, bitmask of the days with a jour type, jour type id of each day
+_SEMAINE_TYPE = struct.Struct("<iB7i")
+# semaines presences: semaine type id, nombre d'intervalles, then each intervalle: length, numeros de semaine
+_SEMAINES_PRESENCE = struct.Struct("<iH")
+_INTERVALLE = struct.Struct("<B")
+_NUMERO_SEMAINE = struct.Struct("<H")
+
+
+def compute_checksum(filepath: Path) -> bytes:
+    """Return sha256 of the file content"""
+    with open(filepath, "rb") as file:
+        return compute_content_checksum(file.read())
+
+
+def compute_content_checksum(content: bytes) -> bytes:
+    """Return sha256 of a file content already read"""
+    return hashlib.sha256(content).digest()
+
+
+def _horaire_to_minutes(horaire: str) -> int:
+    """08:30 -> 510, only HH:MM is supported to read back the same string"""
+    heure, minute = horaire.split(":")
+    minutes = int(heure) * 60 + int(minute)
+    if _minutes_to_horaire(minutes) != horaire:
+        raise ValueError(f"Unsupported horaire {horaire!r}, expected HH:MM")
+    return minutes
+
+
+def _minutes_to_horaire(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def write_snapshot(data_loader: IDataLoader, source_checksum: bytes, snapshot_filepath: Path) -> None:
+    """Write the data of a loaded data loader
+
+    source_checksum: compute_content_checksum of the content the data loader parsed,
+    computed from the same bytes so that a source file changed meanwhile is detected as stale.
+    The file is replaced atomically, a process reading the snapshot never sees a partial file.
+    """
+    semaines_presences = data_loader.get_semaines_presences_data()
+    semaines_type = {semaine_id: data_loader.get_semaine_type_data(semaine_id) for semaine_id in semaines_presences}
+
+    buffer = bytearray(_HEADER.pack(_MAGIC, _VERSION, source_checksum))
+    buffer += _REMUNERATION.pack(data_loader.get_remuneration_data()["salaire_horaire_brut"])
+    buffer += _pack_jours_type(data_loader, semaines_type)
+    buffer += _pack_semaines_type(semaines_type)
+    buffer += _pack_semaines_presences(semaines_presences)
+    conges_payes = data_loader.get_conges_payes_data()
+    buffer += _COUNT.pack(len(conges_payes))
+    buffer += _pack_intervalles(conges_payes)
+
+    snapshot_filepath = Path(snapshot_filepath)
+    with tempfile.NamedTemporaryFile("wb", dir=snapshot_filepath.parent, delete=False) as file:
+        file.write(buffer)
+    os.replace(file.name, snapshot_filepath)
+
+
+def _pack_jours_type(data_loader: IDataLoader, semaines_type: dict[int, SemaineType]) -> bytes:
+    """Jours type used by the semaines type, by id"""
+    jour_ids = sorted({jour_id for semaine_type in semaines_type.values() for jour_id in semaine_type.values()
+                       if jour_id is not None})
+    jours_type = {jour_id: data_loader.get_jour_type_data(jour_id) for jour_id in jour_ids}
+    jours_type = {jour_id: jour_type for jour_id, jour_type in jours_type.items() if jour_type is not None}
+
+    buffer = bytearray(_COUNT.pack(len(jours_type)))
+    for jour_id, jour_type in jours_type.items():
+        buffer += _JOUR_TYPE.pack(jour_id, len(jour_type))
+        for debut, fin in jour_type:
+            buffer += _CRENEAU.pack(_horaire_to_minutes(debut), _horaire_to_minutes(fin))
+    return bytes(buffer)
+
+
+def _pack_semaines_type(semaines_type: dict[int, SemaineType]) -> bytes:
+    buffer = bytearray(_COUNT.pack(len(semaines_type)))
+    for semaine_id, semaine_type in semaines_type.items():
+        jours = [semaine_type[jour] for jour in JOURS_SEMAINE]
+        masque = sum(1 << index for index, jour_id in enumerate(jours) if jour_id is not None)
+        buffer += _SEMAINE_TYPE.pack(semaine_id, masque, *[jour_id or 0 for jour_id in jours])
+    return bytes(buffer)
+
+
+def _pack_semaines_presences(semaines_presences: SemainesPresenceType) -> bytes:
+    buffer = bytearray(_COUNT.pack(len(semaines_presences)))
+    for semaine_id, intervalles in semaines_presences.items():
+        buffer += _SEMAINES_PRESENCE.pack(semaine_id, len(intervalles))
+        buffer += _pack_intervalles(intervalles)
+    return bytes(buffer)
+
+
+def _pack_intervalles(intervalles: list[list[int]]) -> bytes:
+    buffer = bytearray()
+    for intervalle in intervalles:
+        buffer += _INTERVALLE.pack(len(intervalle))
+        for numero_semaine in intervalle:
+            buffer += _NUMERO_SEMAINE.pack(numero_semaine)
+    return bytes(buffer)
+
+
+class SnapshotFileLoader(IDataLoader):
+    """Binary snapshot loader
+
+    The snapshot holds the sha256 of the YAML file it was written from.
+    When source_filepath is given, load raises StaleSnapshotError if the source file changed since.
+    """
+
+    def __init__(self, source_filepath: Path | None = None) -> None:
+        self._source_filepath = source_filepath
+        self._remuneration: RemunerationDataType = {}
+        self._jours_type: dict[int, JourType] = {}
+        self._semaines_type: dict[int, SemaineType] = {}
+        self._semaines_presences: SemainesPresenceType = {}
+        self._conges_payes: CongesPayesType = []
+
+    def load(self, filepath: Path) -> None:
+        """Read snapshot file"""
+        with open(filepath, "rb") as file:
+            data = file.read()
+
+        try:
+            self._unpack(memoryview(data))
+        except struct.error as error:
+            raise FileFormatError(f"{filepath}: truncated snapshot") from error
+
+    def _unpack(self, data: memoryview) -> None:
+        magic, version, checksum = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise FileFormatError(f"Unsupported snapshot {magic!r} version {version}")
+        if self._source_filepath is not None and checksum != compute_checksum(self._source_filepath):
+            raise StaleSnapshotError(f"Snapshot is older than {self._source_filepath}")
+        offset = _HEADER.size
+
+        (salaire_horaire_brut,) = _REMUNERATION.unpack_from(data, offset)
+        offset += _REMUNERATION.size
+        self._remuneration = {"salaire_horaire_brut": salaire_horaire_brut}
+
+        self._jours_type, offset = self._unpack_jours_type(data, offset)
+        self._semaines_type, offset = self._unpack_semaines_type(data, offset)
+        self._semaines_presences, offset = self._unpack_semaines_presences(data, offset)
+
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        self._conges_payes, offset = self._unpack_intervalles(data, offset, count)
+
+        if offset != len(data):
+            raise FileFormatError(f"Snapshot size {len(data)} differs from its content size {offset}")
+
+    @staticmethod
+    def _unpack_jours_type(data: memoryview, offset: int) -> tuple[dict[int, JourType], int]:
+        jours_type = {}
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(count):
+            jour_id, nombre_creneaux = _JOUR_TYPE.unpack_from(data, offset)
+            offset += _JOUR_TYPE.size
+            creneaux = []
+            for debut, fin in _CRENEAU.iter_unpack(data[offset:offset + nombre_creneaux * _CRENEAU.size]):
+                creneaux.append([_minutes_to_horaire(debut), _minutes_to_horaire(fin)])
+            offset += nombre_creneaux * _CRENEAU.size
+            jours_type[jour_id] = creneaux
+        return jours_type, offset
+
+    @staticmethod
+    def _unpack_semaines_type(data: memoryview, offset: int) -> tuple[dict[int, SemaineType], int]:
+        semaines_type = {}
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(count):
+            semaine_id, masque, *jour_ids = _SEMAINE_TYPE.unpack_from(data, offset)
+            offset += _SEMAINE_TYPE.size
+            semaines_type[semaine_id] = {
+                jour: jour_id if masque & (1 << index) else None
+                for index, (jour, jour_id) in enumerate(zip(JOURS_SEMAINE, jour_ids))}
+        return semaines_type, offset
+
+    @staticmethod
+    def _unpack_semaines_presences(data: memoryview, offset: int) -> tuple[SemainesPresenceType, int]:
+        semaines_presences = {}
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(count):
+            semaine_id, nombre_intervalles = _SEMAINES_PRESENCE.unpack_from(data, offset)
+            offset += _SEMAINES_PRESENCE.size
+            intervalles, offset = SnapshotFileLoader._unpack_intervalles(data, offset, nombre_intervalles)
+            semaines_presences[semaine_id] = intervalles
+        return semaines_presences, offset
+
+    @staticmethod
+    def _unpack_intervalles(data: memoryview, offset: int, count: int) -> tuple[list[list[int]], int]:
+        intervalles = []
+        for _ in range(count):
+            (longueur,) = _INTERVALLE.unpack_from(data, offset)
+            offset += _INTERVALLE.size
+            intervalles.append([numero for (numero,) in _NUMERO_SEMAINE.iter_unpack(
+                data[offset:offset + longueur * _NUMERO_SEMAINE.size])])
+            offset += longueur * _NUMERO_SEMAINE.size
+        return intervalles, offset
+
+    def get_remuneration_data(self) -> RemunerationDataType:
+        """Return remuneration data"""
+        return self._remuneration
+
+    def get_semaines_presences_data(self) -> SemainesPresenceType:
+        """Return semaines presences data"""
+        return self._semaines_presences
+
+    def get_semaine_type_data(self, semaine_id: int) -> SemaineType:
+        """Return semaines type data"""
+        return self._semaines_type[semaine_id]
+
+    def get_jour_type_data(self, jour_id: int) -> JourType:
+        """Return jour type data"""
+        return self._jours_type.get(jour_id)
+
+    def get_conges_payes_data(self) -> CongesPayesType:
+        """Return conges payes data"""
+        return self._conges_payes
@@ -8,28 +8,45 @@ from pathlib import Path
 
 import yaml
 
-from .i_data_loader import IDataLoader, RemunerationDataType, SemainesPresenceType, JourType, SemaineType
+from .i_data_loader import IDataLoader, RemunerationDataType, SemainesPresenceType, JourType, SemaineType, \
+    CongesPayesType
 
 
 class FileFormatError(Exception):
     """File format error"""
 
 
+def get_yaml_safe_loader(libyaml: bool = True) -> type[yaml.SafeLoader]:
+    """Return libyaml CSafeLoader when requested and available, else the pure Python SafeLoader"""
+    if libyaml:
+        return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.SafeLoader
+
+
 class YamlFileLoader(IDataLoader):
     """YAML File loader"""
 
-    def __init__(self, validator) -> None:
+    def __init__(self, validator, libyaml: bool = True) -> None:
+        """libyaml: parse with libyaml when available, fall back to the pure Python parser"""
         if not validator:
             raise ValueError("Validator is mandatory for YamlFileLoader construction")
 
         self._data = None
         self._validator = validator
+        self._yaml_loader = get_yaml_safe_loader(libyaml)
 
     def load(self, filepath: Path) -> None:
         """Read YAML file"""
         with open(filepath, "r", encoding="utf-8") as file:
-            self._data = yaml.safe_load(file)
+            self._data = yaml.load(file, Loader=self._yaml_loader)
+        self._validate()
 
+    def load_content(self, content: bytes) -> None:
+        """Parse the content of a YAML file already read"""
+        self._data = yaml.load(content.decode("utf-8"), Loader=self._yaml_loader)
+        self._validate()
+
+    def _validate(self) -> None:
         if not self._validator.validate(self._data):
             raise FileFormatError(self._validator.errors)
 
@@ -51,3 +68,7 @@ class YamlFileLoader(IDataLoader):
             return self._data["contrat"]["planning"]["jours_type"][jour_id]
         except KeyError:
             return None
+
+    def get_conges_payes_data(self) -> CongesPayesType:
+        """Return conges payes data"""
+        return self._data["contrat"]["planning"]["conges_payes"]
@@ -4,28 +4,43 @@ Date: 2023-08
 Description: YAML Schema validator
 """
 
+import functools
 import logging
 from pathlib import Path
 
 from cerberus import Validator
+from cerberus.schema import DefinitionSchema
 import yaml
 
+from .yaml_file_loader import get_yaml_safe_loader
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_FILEPATH: Path = Path(__file__).parent / 'user_file_schema.yaml'
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema() -> DefinitionSchema:
+    """Return the user file schema, parsed and checked by Cerberus once per process"""
+    with open(SCHEMA_FILEPATH, 'r', encoding='utf-8') as schema_file:
+        schema = yaml.load(schema_file, Loader=get_yaml_safe_loader())
+
+    return Validator(schema, require_all=True).schema
+
+
+def invalidate_schema_cache() -> None:
+    """Drop the cached schema, the schema file is read again by the next validator"""
+    get_schema.cache_clear()
+
 
 class YamlSchemaValidator:
     """YAML Schema validator"""
 
     # nest schema into document key to apply rules onto root item
     # \todo try with schema keyword for root key
+    # the schema is shared, the Validator is not since it holds the errors of the last validation
     def __init__(self) -> None:
-        schema_filepath: Path = Path(__file__).parent / 'user_file_schema.yaml'
-
-        with open(schema_filepath, 'r', encoding='utf-8') as schema_file:
-            schema = yaml.safe_load(schema_file)
-
-        self._validator = Validator(schema, require_all=True)
+        self._validator = Validator(get_schema(), require_all=True)
 
     @property
     def errors(self):
@@ -0,0 +1,128 @@
+"""
+Author: Nicolas Boutin
+Date: 2023-08
+Description: Historique d'un contrat sur plusieurs annees, une periode par avenant
+"""
+
+import bisect
+from datetime import date
+from typing import NamedTuple
+
+from .contrat import Contrat
+from .planning import Planning, SemaineAcceuil
+from .remuneration import Remuneration
+
+
+class PeriodeContrat(NamedTuple):
+    """Contrat en vigueur de debut jusqu'a la veille de la periode suivante"""
+
+    debut: date
+    contrat: Contrat
+
+
+class ResumePeriode(NamedTuple):
+    """Valeurs mensualisees d'une periode, calculees une fois par periode"""
+
+    duree_acceuil_hebdomadaire_moyen: float
+    duree_acceuil_mensualisee: float
+    remuneration_brut_mensualisee: float
+
+
+class _Avenant(NamedTuple):
+    """Ce qu'un avenant change, None si repris de la periode precedente"""
+
+    planning: Planning | None
+    remuneration: Remuneration | None
+
+
+class HistoriqueContratError(ValueError):
+    """Historique contrat error"""
+
+
+class HistoriqueContrat:
+    """Historique d'un contrat: periodes triees par date d'effet, recherche par bisection sur la date
+
+    Le contrat initial ouvre la premiere periode, chaque avenant ouvre une nouvelle periode
+    qui reprend le planning ou la remuneration de la periode precedente s'ils ne changent pas.
+    Un avenant a la date de debut du contrat modifie le contrat initial.
+    Les periodes sont resolues par date d'effet, un avenant ajoute ou remplace recalcule les periodes suivantes.
+    Les semaines sont reperees par annee et numero de semaine ISO.
+    """
+
+    def __init__(self, debut: date, contrat: Contrat, fin: date | None = None) -> None:
+        """fin: dernier jour du contrat, None si le contrat est en cours"""
+        self._contrat_initial = contrat
+        self._debuts: list[date] = [debut]
+        self._avenants: list[_Avenant] = [_Avenant(None, None)]
+        self._periodes: list[PeriodeContrat] = [PeriodeContrat(debut, contrat)]
+        self._resumes: list[ResumePeriode | None] = [None]
+        self._fin = fin
+
+    def ajouter_avenant(self, debut: date, planning: Planning | None = None,
+                        remuneration: Remuneration | None = None) -> PeriodeContrat:
+        """Ajoute un avenant en vigueur a partir de debut, remplace l'avenant de meme date"""
+        index = self._get_index(debut)
+        avenant = _Avenant(planning, remuneration)
+        if self._debuts[index] == debut:
+            self._avenants[index] = avenant
+        else:
+            index += 1
+            self._debuts.insert(index, debut)
+            self._avenants.insert(index, avenant)
+            self._periodes.insert(index, self._periodes[index - 1])
+            self._resumes.insert(index, None)
+        self._resoudre_periodes(index)
+        return self._periodes[index]
+
+    def get_periodes(self) -> list[PeriodeContrat]:
+        """Return les periodes par date d'effet"""
+        return list(self._periodes)
+
+    def get_periodes_entre(self, debut: date, fin: date) -> list[PeriodeContrat]:
+        """Return les periodes en vigueur entre debut et fin inclus"""
+        premier = max(bisect.bisect_right(self._debuts, debut) - 1, 0)
+        dernier = bisect.bisect_right(self._debuts, fin)
+        return self._periodes[premier:dernier]
+
+    def get_periode(self, date_: date) -> PeriodeContrat:
+        """Return la periode en vigueur a une date"""
+        return self._periodes[self._get_index(date_)]
+
+    def get_contrat(self, date_: date) -> Contrat:
+        """Return le contrat en vigueur a une date"""
+        return self.get_periode(date_).contrat
+
+    def get_resume(self, date_: date) -> ResumePeriode:
+        """Return les valeurs mensualisees de la periode en vigueur a une date"""
+        index = self._get_index(date_)
+        resume = self._resumes[index]
+        if resume is None:
+            contrat = self._periodes[index].contrat
+            resume = ResumePeriode(duree_acceuil_hebdomadaire_moyen=contrat.get_duree_acceuil_hebdomadaire_moyen(),
+                                   duree_acceuil_mensualisee=contrat.get_duree_acceuil_mensualisee(),
+                                   remuneration_brut_mensualisee=contrat.get_remuneration_brut_mensualisee())
+            self._resumes[index] = resume
+        return resume
+
+    def get_semaine_acceuil(self, date_: date) -> SemaineAcceuil | None:
+        """Return la semaine d'acceuil de la semaine ISO contenant date, None si pas d'acceuil cette semaine"""
+        return self.get_contrat(date_).get_planning().get_semaine_acceuil(date_.isocalendar().week)
+
+    def _resoudre_periodes(self, debut_index: int) -> None:
+        """Recalcule les periodes a partir de debut_index, dans l'ordre des dates d'effet"""
+        for index in range(debut_index, len(self._debuts)):
+            avenant = self._avenants[index]
+            precedent = self._periodes[index - 1].contrat if index > 0 else self._contrat_initial
+            contrat = Contrat(avenant.planning or precedent.get_planning(),
+                              avenant.remuneration or precedent.get_remuneration())
+            self._periodes[index] = PeriodeContrat(self._debuts[index], contrat)
+            self._resumes[index] = None
+
+    def _get_index(self, date_: date) -> int:
+        """Index de la periode en vigueur a une date"""
+        if self._fin is not None and date_ > self._fin:
+            raise HistoriqueContratError(f"Contrat termine le {self._fin}, pas de periode le {date_}")
+        index = bisect.bisect_right(self._debuts, date_) - 1
+        if index < 0:
+            raise HistoriqueContratError(f"Contrat debute le {self._debuts[0]}, pas de periode le {date_}")
+        return index
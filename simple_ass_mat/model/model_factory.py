@@ -4,7 +4,6 @@ Date: 2023-08
 Description:
 """
 
-from copy import deepcopy
 from datetime import time
 
 from .data_loader import IDataLoader
@@ -14,46 +13,66 @@ from .planning import Planning, SemaineAcceuil, JourAcceuil, CreneauHoraire
 
 
 class ModelFactory:
-    """Model Factory"""
+    """Model Factory
+
+    Planning objects are immutable, one instance is built per semaine type, jour type and creneau
+    and shared by every week using it.
+    """
 
     def __init__(self, data_loader: IDataLoader):
         self._data_loader = data_loader
+        self._semaines_acceuil: dict[int, SemaineAcceuil] = {}
+        self._jours_acceuil: dict[int, JourAcceuil | None] = {}
+        self._creneaux_horaire: dict[tuple[str, str], CreneauHoraire] = {}
 
     def make_contrat(self) -> Contrat:
         """Make contrat"""
         remuneration = self._make_remuneration(self._data_loader.get_remuneration_data())
-        planning = self._make_planning()
+        planning = Planning(self._make_semaines_acceuil(), self._make_semaines_conges_payes())
         return Contrat(planning=planning, remuneration=remuneration)
 
     def _make_remuneration(self, remuneration_data) -> Remuneration:
         """Make Remuneration"""
         return Remuneration(salaire_horaire_brut=remuneration_data["salaire_horaire_brut"])
 
-    def _make_planning(self) -> Planning:
-        """Make planning"""
+    def _make_semaines_acceuil(self) -> dict[int, SemaineAcceuil]:
+        """Make semaines acceuil par numero de semaine"""
 
         semaines_acceuil = {}
         semaines_presences_data = self._data_loader.get_semaines_presences_data()
 
         for semaine_id, numero_semaines_list in semaines_presences_data.items():
-            for numero_semaines_range in numero_semaines_list:
-
-                if len(numero_semaines_range) == 1:
-                    numero_semaine = numero_semaines_range[0]
-                    semaines_acceuil[numero_semaine] = self._make_semaine_acceuil(semaine_id)
-                elif len(numero_semaines_range) == 2:
-                    for numero_semaine in range(numero_semaines_range[0], numero_semaines_range[1]+1):
-                        semaines_acceuil[numero_semaine] = self._make_semaine_acceuil(semaine_id)
-                else:
-                    raise ValueError(f"Invalid range: {numero_semaines_range}")
+            semaine_acceuil = self._make_semaine_acceuil(semaine_id)
+            for numero_semaine in self._make_numeros_semaine(numero_semaines_list):
+                semaines_acceuil[numero_semaine] = semaine_acceuil
 
         return semaines_acceuil
 
+    def _make_semaines_conges_payes(self) -> list[int]:
+        """Make numeros de semaine de conges payes"""
+        return self._make_numeros_semaine(self._data_loader.get_conges_payes_data())
+
+    @staticmethod
+    def _make_numeros_semaine(numero_semaines_list: list[list[int]]) -> list[int]:
+        """[[1, 3], [5]] -> [1, 2, 3, 5]"""
+        numeros_semaine = []
+        for numero_semaines_range in numero_semaines_list:
+            if len(numero_semaines_range) == 1:
+                numeros_semaine.append(numero_semaines_range[0])
+            elif len(numero_semaines_range) == 2:
+                numeros_semaine.extend(range(numero_semaines_range[0], numero_semaines_range[1]+1))
+            else:
+                raise ValueError(f"Invalid range: {numero_semaines_range}")
+        return numeros_semaine
+
     def _make_semaine_acceuil(self, semaine_id: int) -> SemaineAcceuil:
-        """Make semaine acceuil"""
+        """Make semaine acceuil, once per semaine type"""
+        if semaine_id in self._semaines_acceuil:
+            return self._semaines_acceuil[semaine_id]
+
         semaine_type_data = self._data_loader.get_semaine_type_data(semaine_id)
 
-        return SemaineAcceuil(
+        semaine_acceuil = SemaineAcceuil(
             lundi=self._make_jour_acceuil(semaine_type_data["lundi"]),
             mardi=self._make_jour_acceuil(semaine_type_data["mardi"]),
             mercredi=self._make_jour_acceuil(semaine_type_data["mercredi"]),
@@ -62,27 +81,40 @@ class ModelFactory:
             samedi=self._make_jour_acceuil(semaine_type_data["samedi"]),
             dimanche=self._make_jour_acceuil(semaine_type_data["dimanche"]),
         )
+        self._semaines_acceuil[semaine_id] = semaine_acceuil
+        return semaine_acceuil
 
     def _make_jour_acceuil(self, jour_id: int) -> JourAcceuil:
-        """Make jour acceuil"""
+        """Make jour acceuil, once per jour type"""
+        if jour_id in self._jours_acceuil:
+            return self._jours_acceuil[jour_id]
+
+        jour_acceuil = None
         jour_type_data = self._data_loader.get_jour_type_data(jour_id)
-        if not jour_type_data:
-            return None
+        if jour_type_data:
+            creneau_horaire_data = jour_type_data[0]
+            jour_acceuil = JourAcceuil(creneau_horaire=self._make_creneau_horaire(creneau_horaire_data))
 
-        creneau_horaire_data = jour_type_data[0]
-        return JourAcceuil(creneau_horaire=self._make_creneau_horaire(creneau_horaire_data))
+        self._jours_acceuil[jour_id] = jour_acceuil
+        return jour_acceuil
 
     def _make_creneau_horaire(self, creneau_horaire_data: list[str]) -> CreneauHoraire:
-        """Make creneau horaire"""
-        return CreneauHoraire(
-            horaire_debut=time.fromisoformat(creneau_horaire_data[0] + ':00'),
-            horaire_fin=time.fromisoformat(creneau_horaire_data[1] + ':00'))
+        """Make creneau horaire, once per horaires"""
+        key = (creneau_horaire_data[0], creneau_horaire_data[1])
+        if key not in self._creneaux_horaire:
+            self._creneaux_horaire[key] = CreneauHoraire(
+                horaire_debut=time.fromisoformat(creneau_horaire_data[0] + ':00'),
+                horaire_fin=time.fromisoformat(creneau_horaire_data[1] + ':00'))
+        return self._creneaux_horaire[key]
 
 
 def make_planning_with_range(semaines_acceuil_ranges: dict[tuple, SemaineAcceuil], semaines_conges_payes: list[int]):
-    """Make Planning avec des intervals de semaines d acceuil"""
+    """Make Planning avec des intervals de semaines d acceuil
+
+    SemaineAcceuil is immutable, the same instance is shared by each week of an interval
+    """
     semaines_acceuil = {}
     for intervals, semaine_acceuil in semaines_acceuil_ranges.items():
         for semaine in range(intervals[0], intervals[1]+1):
-            semaines_acceuil[semaine] = deepcopy(semaine_acceuil)
+            semaines_acceuil[semaine] = semaine_acceuil
     return Planning(semaines_acceuil, semaines_conges_payes)
@@ -0,0 +1,87 @@
+"""
+Author: Nicolas Boutin
+Date: 2023-08
+Description: Legal parameters by effective date, loaded lazily from a data file
+"""
+
+import bisect
+import datetime
+import functools
+from pathlib import Path
+from typing import NamedTuple
+
+import yaml
+
+PARAMETRES_FILEPATH: Path = Path(__file__).parent / 'parametres.yaml'
+
+
+class ParametresLegaux(NamedTuple):
+    """Legal parameters in force from date_effet until the next effective date"""
+
+    date_effet: datetime.date
+    smic_horaire_brut: float
+    ratio_brut_net: float
+    seuil_heures_majorees: float
+    frais_entretien_minimum: float
+    frais_entretien_9h: float
+
+
+class RegistreParametres:
+    """Legal parameters by effective date
+
+    The data file is read on the first query. Each entry only lists the parameters that change,
+    the others are inherited from the previous entry, so each period is resolved once at load.
+    The period of the last query is checked first, successive dates of one period skip the bisection.
+    """
+
+    def __init__(self, filepath: Path = PARAMETRES_FILEPATH) -> None:
+        self._filepath = filepath
+        self._periodes: list[ParametresLegaux] | None = None
+        self._dates: list[datetime.date] = []
+        self._index = 0
+
+    def _charger(self) -> list[ParametresLegaux]:
+        """Read the data file and resolve the parameters of each period"""
+        with open(self._filepath, 'r', encoding='utf-8') as file:
+            entrees = yaml.safe_load(file)
+
+        periodes: list[ParametresLegaux] = []
+        valeurs: dict = {}
+        for entree in sorted(entrees, key=lambda entree: entree['date_effet']):
+            valeurs.update(entree)
+            try:
+                periodes.append(ParametresLegaux(**valeurs))
+            except TypeError as error:
+                raise ValueError(f"Incomplete parameters at {entree['date_effet']} in {self._filepath}") from error
+
+        self._dates = [periode.date_effet for periode in periodes]
+        return periodes
+
+    def get_periodes(self) -> list[ParametresLegaux]:
+        """Return the parameters of each period, by effective date"""
+        if self._periodes is None:
+            self._periodes = self._charger()
+        return self._periodes
+
+    def get_parametres(self, date: datetime.date) -> ParametresLegaux:
+        """Return the parameters in force at date"""
+        periodes = self.get_periodes()
+        index = self._index
+        if not self._is_en_vigueur(index, date):
+            index = bisect.bisect_right(self._dates, date) - 1
+            if index < 0:
+                raise ValueError(f"No legal parameters in force at {date}")
+            self._index = index
+        return periodes[index]
+
+    def _is_en_vigueur(self, index: int, date: datetime.date) -> bool:
+        """Whether the period at index is in force at date"""
+        if index >= len(self._dates) or date < self._dates[index]:
+            return False
+        return index + 1 == len(self._dates) or date < self._dates[index + 1]
+
+
+@functools.lru_cache(maxsize=None)
+def get_registre_parametres(filepath: Path = PARAMETRES_FILEPATH) -> RegistreParametres:
+    """Return the registry of a data file, shared by the whole process, the file is read on its first query"""
+    return RegistreParametres(filepath)
@@ -6,49 +6,83 @@ Description: Represent le planning de garde prevu par le contrat
 
 from datetime import time, timedelta
 
+from .value_object import ValueObject
+
 
 class PlanningError(ValueError):
     """Planning error"""
 
 
-class CreneauHoraire:
+class CreneauHoraire(ValueObject):
     """Creneau horaire"""
 
+    __slots__ = ("_horaire_debut", "_horaire_fin", "_duree_minutes", "_duree")
+    _horaire_debut: time
+    _horaire_fin: time
+    _duree_minutes: int
+    _duree: timedelta
+
     def __init__(self, horaire_debut: time, horaire_fin: time) -> None:
-        self._horaire_debut = horaire_debut
-        self._horaire_fin = horaire_fin
+        self._set("_horaire_debut", horaire_debut)
+        self._set("_horaire_fin", horaire_fin)
+        # les secondes ne sont pas supportees
+        duree_minutes = (horaire_fin.hour * 60 + horaire_fin.minute) - (horaire_debut.hour * 60 + horaire_debut.minute)
+        self._set("_duree_minutes", duree_minutes)
+        self._set("_duree", timedelta(minutes=duree_minutes))
+
+    def _values(self) -> tuple:
+        return self._horaire_debut, self._horaire_fin
+
+    @property
+    def duree_minutes(self) -> int:
+        """Return duree en minutes"""
+        return self._duree_minutes
 
     def duree(self) -> timedelta:
         """Return duree"""
-        return timedelta(hours=self._horaire_fin.hour, minutes=self._horaire_fin.minute,) \
-            - timedelta(hours=self._horaire_debut.hour, minutes=self._horaire_debut.minute)
+        return self._duree
 
 
-class JourAcceuil:
+class JourAcceuil(ValueObject):
     """Jour acceuil"""
 
+    __slots__ = ("_creneau_horaire",)
+    _creneau_horaire: CreneauHoraire | None
+
     def __init__(self, creneau_horaire: CreneauHoraire | None = None) -> None:
-        self._creneau_horaire = creneau_horaire
+        self._set("_creneau_horaire", creneau_horaire)
+
+    def _values(self) -> tuple:
+        return (self._creneau_horaire,)
 
     def get_nombre_heure_acceuil(self) -> float:
         """Return le nombre d'heure d'acceuil dans une journée"""
         return self._creneau_horaire.duree().seconds / 3600
 
 
-class SemaineAcceuil:
-    """Semaine acceuil"""
+class SemaineAcceuil(ValueObject):
+    """Semaine acceuil, jours indexed by weekday, 0 is lundi"""
 
     jour_t = JourAcceuil | None
 
+    __slots__ = ("_jours",)
+    _jours: tuple[jour_t, ...]
+
     def __init__(self, lundi: jour_t = None, mardi: jour_t = None, mercredi: jour_t = None,
                  jeudi: jour_t = None, vendredi: jour_t = None, samedi: jour_t = None, dimanche: jour_t = None) -> None:
-        self._jours = {"lundi": lundi, "mardi": mardi, "mercredi": mercredi,
-                       "jeudi": jeudi, "vendredi": vendredi, "samedi": samedi, "dimanche": dimanche}
+        self._set("_jours", (lundi, mardi, mercredi, jeudi, vendredi, samedi, dimanche))
+
+    def _values(self) -> tuple:
+        return self._jours
+
+    def get_jour(self, weekday: int) -> jour_t:
+        """Return jour acceuil of the weekday, 0 is lundi, like date.weekday()"""
+        return self._jours[weekday]
 
     def get_nombre_heure_acceuil(self) -> float:
         """Return nombre d'heure d'acceuil dans une semaine"""
         n_heure_acceuil = 0.0
-        for jour in self._jours.values():
+        for jour in self._jours:
             if jour:
                 n_heure_acceuil += jour.get_nombre_heure_acceuil()
         return n_heure_acceuil
@@ -59,6 +93,9 @@ class Planning:
     Pour chaque numero de semaine dans une annee, on definit:
     - soit une semaine acceuil
     - soit une semaine de conges payes ass_mat
+
+    Les aggregats sont calcules une fois par semaine type a la construction,
+    rebuild doit etre appele si semaines_acceuil est modifie.
     """
 
     _NOMBRE_SEMAINES_CONGES_PAYES = 5
@@ -73,13 +110,63 @@ class Planning:
         self._semaines_acceuil = semaines_acceuil
         self._semaines_conges_payes = semaines_conges_payes
 
+        self._nombre_semaines_par_type: dict[SemaineAcceuil, int] = {}
+        self._nombre_heure_par_type: dict[SemaineAcceuil, float] = {}
+        self._nombre_heure_annee = 0.0
+        self._nombre_heure_semaine = 0.0
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Compute again the aggregates of each semaine type"""
+        nombre_semaines_par_type: dict[SemaineAcceuil, int] = {}
+        for semaine_acceuil in self._semaines_acceuil.values():
+            nombre_semaines_par_type[semaine_acceuil] = nombre_semaines_par_type.get(semaine_acceuil, 0) + 1
+
+        self._nombre_semaines_par_type = nombre_semaines_par_type
+        self._nombre_heure_par_type = {semaine_acceuil: semaine_acceuil.get_nombre_heure_acceuil()
+                                       for semaine_acceuil in nombre_semaines_par_type}
+        self._nombre_heure_annee = sum(self._nombre_heure_par_type[semaine_acceuil] * nombre_semaines
+                                       for semaine_acceuil, nombre_semaines in nombre_semaines_par_type.items())
+
+        if len(self._nombre_heure_par_type) == 1:
+            # toutes les semaines sont identiques, pas d'arrondi de la moyenne
+            self._nombre_heure_semaine = next(iter(self._nombre_heure_par_type.values()))
+        elif self._semaines_acceuil:
+            self._nombre_heure_semaine = self._nombre_heure_annee / len(self._semaines_acceuil)
+        else:
+            self._nombre_heure_semaine = 0.0
+
     def get_nombre_semaine_acceuil(self):
         """Return le nombre de semaine d'acceuil dans une année"""
         return len(self._semaines_acceuil)
 
+    def get_nombre_semaine_conges_payes(self) -> int:
+        """Return le nombre de semaine de conges payes dans une année"""
+        return len(self._semaines_conges_payes)
+
     def get_nombre_heure_semaine(self):
-        """Return le nombre d'heure par semaine"""
-        return self._semaines_acceuil[1].get_nombre_heure_acceuil()
+        """Return le nombre d'heure par semaine d'acceuil
+
+        = moyenne des semaines types ponderee par leur nombre de semaines"""
+        return self._nombre_heure_semaine
+
+    def get_nombre_heure_mensualisee(self) -> float:
+        """Return le nombre d'heure mensualisee
+
+        = nombre heure par semaine * 52 / 12"""
+        return self._nombre_heure_semaine * 52 / 12
+
+    def get_nombre_heure_annee(self) -> float:
+        """Return le nombre d'heure d'acceuil dans une année"""
+        return self._nombre_heure_annee
+
+    def get_semaine_acceuil(self, numero_semaine: int) -> SemaineAcceuil | None:
+        """Return la semaine d'acceuil d'un numero de semaine, None si pas d'acceuil cette semaine"""
+        return self._semaines_acceuil.get(numero_semaine)
+
+    def get_nombre_semaines_par_type(self) -> dict[SemaineAcceuil, int]:
+        """Return le nombre de semaines d'acceuil de chaque semaine type"""
+        return dict(self._nombre_semaines_par_type)
 
     @staticmethod
     def _check_inputs(semaines_acceuil, semaines_conges_payes):
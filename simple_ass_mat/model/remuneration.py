@@ -4,19 +4,33 @@ Date: 2023-08
 Description:
 """
 
+import datetime
 
-class Remuneration:
+from .parametres import get_registre_parametres
+from .value_object import ValueObject
+
+
+class Remuneration(ValueObject):
     """Handle ass mat remuneration"""
 
-    _RATIO_BRUT_NET = 0.7812
+    __slots__ = ("_salaire_horaire_brut",)
+    _salaire_horaire_brut: float
 
     def __init__(self, salaire_horaire_brut: float) -> None:
-        self._salaire_horaire_brut = salaire_horaire_brut
+        self._set("_salaire_horaire_brut", salaire_horaire_brut)
+
+    def _values(self) -> tuple:
+        return (self._salaire_horaire_brut,)
 
     def get_salaire_horaire_brut(self):
         """Retourne le tarif horaire brut"""
         return self._salaire_horaire_brut
 
-    def get_salaire_horaire_net(self):
-        """Retourne le salaire horaire net"""
-        return self._salaire_horaire_brut * Remuneration._RATIO_BRUT_NET
+    def get_salaire_horaire_net(self, date: datetime.date):
+        """Retourne le salaire horaire net, au ratio en vigueur a date"""
+        return self._salaire_horaire_brut * Remuneration.get_ratio_brut_net(date)
+
+    @staticmethod
+    def get_ratio_brut_net(date: datetime.date) -> float:
+        """Retourne le ratio salaire net / salaire brut en vigueur a date"""
+        return get_registre_parametres().get_parametres(date).ratio_brut_net
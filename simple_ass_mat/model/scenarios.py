@@ -0,0 +1,81 @@
+"""
+Author: Nicolas Boutin
+Date: 2023-08
+Description: Remuneration of many scenarios of one planning, computed on numpy arrays
+"""
+
+import datetime
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .planning import Planning
+from .remuneration import Remuneration
+
+
+class ResultatsScenarios(NamedTuple):
+    """Results table, one value per scenario in each column, columns have the broadcast shape of the inputs"""
+
+    salaire_horaire_brut: np.ndarray
+    nombre_heure_semaine: np.ndarray
+    nombre_semaines_acceuil: np.ndarray
+    nombre_semaines_conges_payes: np.ndarray
+    annee_complete: np.ndarray
+    duree_acceuil_hebdomadaire_moyen: np.ndarray
+    duree_acceuil_mensualisee: np.ndarray
+    remuneration_brut_mensualisee: np.ndarray
+    remuneration_net_mensualisee: np.ndarray
+
+
+class Scenarios:
+    """What-if evaluation of a planning
+
+    Each argument of evaluer is a scalar or an array, arrays are broadcast together:
+    evaluer([4.0, 4.5]) gives 2 scenarios, evaluer(np.c_[4.0, 4.5], nombre_heure_semaine=[30, 40]) a 2x2 table.
+    The defaults are the values of the planning, so evaluer(taux) gives the Contrat remuneration for each taux.
+    The net remuneration uses the ratio brut / net in force at the date given to the constructor.
+
+    Annee complete, 47 semaines d'acceuil and 5 semaines de conges payes: duree mensualisee = heures * 52 / 12
+    Annee incomplete: duree mensualisee = heures * semaines d'acceuil / 12
+    """
+
+    _ANNEE_COMPLETE_SEMAINES_ACCEUIL = Planning._NOMBRE_SEMAINES_ACCEUIL  # pylint: disable=protected-access
+    _ANNEE_COMPLETE_SEMAINES_CONGES_PAYES = Planning._NOMBRE_SEMAINES_CONGES_PAYES  # pylint: disable=protected-access
+
+    def __init__(self, planning: Planning, date: datetime.date) -> None:
+        self._ratio_brut_net = Remuneration.get_ratio_brut_net(date)
+        self._nombre_heure_semaine = planning.get_nombre_heure_semaine()
+        self._nombre_semaines_acceuil = planning.get_nombre_semaine_acceuil()
+        self._nombre_semaines_conges_payes = planning.get_nombre_semaine_conges_payes()
+
+    def evaluer(self, salaire_horaire_brut: ArrayLike,
+                nombre_heure_semaine: ArrayLike | None = None,
+                nombre_semaines_acceuil: ArrayLike | None = None,
+                nombre_semaines_conges_payes: ArrayLike | None = None) -> ResultatsScenarios:
+        """Return the results of each scenario"""
+        salaire, heures, semaines, conges_payes = np.broadcast_arrays(
+            np.asarray(salaire_horaire_brut, dtype=np.float64),
+            np.asarray(self._nombre_heure_semaine if nombre_heure_semaine is None else nombre_heure_semaine,
+                       dtype=np.float64),
+            np.asarray(self._nombre_semaines_acceuil if nombre_semaines_acceuil is None else nombre_semaines_acceuil,
+                       dtype=np.int64),
+            np.asarray(self._nombre_semaines_conges_payes if nombre_semaines_conges_payes is None
+                       else nombre_semaines_conges_payes, dtype=np.int64))
+
+        annee_complete = (semaines == Scenarios._ANNEE_COMPLETE_SEMAINES_ACCEUIL) \
+            & (conges_payes == Scenarios._ANNEE_COMPLETE_SEMAINES_CONGES_PAYES)
+        hebdomadaire_moyen = heures * semaines / 52
+        mensualisee = np.where(annee_complete, heures * 52 / 12, heures * semaines / 12)
+        brut = salaire * mensualisee
+
+        return ResultatsScenarios(
+            salaire_horaire_brut=salaire,
+            nombre_heure_semaine=heures,
+            nombre_semaines_acceuil=semaines,
+            nombre_semaines_conges_payes=conges_payes,
+            annee_complete=annee_complete,
+            duree_acceuil_hebdomadaire_moyen=hebdomadaire_moyen,
+            duree_acceuil_mensualisee=mensualisee,
+            remuneration_brut_mensualisee=brut,
+            remuneration_net_mensualisee=brut * self._ratio_brut_net)
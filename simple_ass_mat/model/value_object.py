@@ -0,0 +1,45 @@
+"""
+Author: Nicolas Boutin
+Date: 2023-08
+Description: Base class of the immutable model objects
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ValueObject(ABC):
+    """Slotted immutable object, equal and hashed on its values
+
+    Subclasses declare __slots__, set their attributes with _set in __init__
+    and return their constructor arguments from _values.
+    """
+
+    __slots__ = ()
+
+    def _set(self, name: str, value) -> None:
+        """Set an attribute, only from __init__"""
+        object.__setattr__(self, name, value)
+
+    @abstractmethod
+    def _values(self) -> tuple:
+        """Return the constructor arguments"""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash((type(self), self._values()))
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self._values()!r}"
@@ -45,6 +45,14 @@ class TestDuree(unittest.TestCase):
         self.assertEqual(creneau.duree().total_seconds()/3600, 10)
 
 
+class TestDureeMinutes(unittest.TestCase):
+
+    def test_0815_1730(self):
+        creneau = CreneauHoraire(time.fromisoformat('08:15:00'), time.fromisoformat('17:30:00'))
+        self.assertEqual(creneau.duree_minutes, 9*60+15)
+        self.assertEqual(creneau.duree().total_seconds(), creneau.duree_minutes * 60)
+
+
 if __name__ == '__main__':
     import logging
     # from pathlib import Path
@@ -0,0 +1,191 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+import copy
+from pathlib import Path
+
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from simple_ass_mat.model.data_loader.yaml_schema_validator import YamlSchemaValidator  # nopep8 # noqa: E402
+from simple_ass_mat.model.data_loader.fast_schema_validator import (  # nopep8 # noqa: E402
+    FastSchemaValidator, SchemaCompiler)
+from simple_ass_mat.model.data_loader.data_loader_factory import DataLoaderFactory  # nopep8 # noqa: E402
+
+USER_FILE_FILEPATH = Path(__file__).parent / "user_file" / "user_file_all_data.yml"
+
+# one value of each YAML type, and the types Cerberus handles apart (bool is an int, tuple is a list)
+VALEURS = [None, "08:00", "", 0, 1, True, 4.10, [], [[1, 5]], (1,), {}, {0: []}, {"lundi": 0}, b"list"]
+
+
+def load_user_file() -> dict:
+    with open(USER_FILE_FILEPATH, "r", encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+
+def iter_mappings(data, path=()):
+    """Path of each mapping of data"""
+    if isinstance(data, dict):
+        yield path
+        for key, value in data.items():
+            yield from iter_mappings(value, path + (key,))
+
+
+def get_node(data, path):
+    for key in path:
+        data = data[key]
+    return data
+
+
+def make_documents(data: dict):
+    """data and its mutations: each field removed or replaced by each value, unknown keys added"""
+    yield data
+    for path in iter_mappings(data):
+        for key in get_node(data, path):
+            document = copy.deepcopy(data)
+            del get_node(document, path)[key]
+            yield document
+
+            for valeur in VALEURS:
+                document = copy.deepcopy(data)
+                get_node(document, path)[key] = copy.deepcopy(valeur)
+                yield document
+
+        # Cerberus cannot sort the errors of keys other than int and str, None or float keys raise TypeError
+        for key in ["inconnu", 7, True]:
+            for valeur in [None, 0, [1]]:
+                document = copy.deepcopy(data)
+                get_node(document, path)[key] = valeur
+                yield document
+
+
+def ordered(errors):
+    """Errors with the order of the keys, dict equality ignores it"""
+    if isinstance(errors, dict):
+        return [(key, ordered(value)) for key, value in errors.items()]
+    if isinstance(errors, list):
+        return [ordered(value) for value in errors]
+    return errors
+
+
+def has_mixed_keys(errors) -> bool:
+    """Integer and string keys in one mapping, Cerberus does not order them consistently
+
+    cerberus.utils.compare_paths_lt finds an integer lower than a string and a string lower than an integer,
+    the order then depends on the iteration order of Cerberus sets, that is on the string hash seed.
+    """
+    if isinstance(errors, dict):
+        return len({isinstance(key, int) for key in errors}) > 1 or any(map(has_mixed_keys, errors.values()))
+    if isinstance(errors, list):
+        return any(map(has_mixed_keys, errors))
+    return False
+
+
+class TestDifferential(unittest.TestCase):
+    """Same result and same errors as Cerberus, in the same order when Cerberus order is defined"""
+
+    def _assert_same(self, document):
+        cerberus_validator = YamlSchemaValidator()
+        fast_validator = FastSchemaValidator()
+        self.assertEqual(fast_validator.validate(document), cerberus_validator.validate(document), document)
+        self.assertEqual(fast_validator.errors, cerberus_validator.errors, document)
+        if not has_mixed_keys(cerberus_validator.errors):
+            self.assertEqual(ordered(fast_validator.errors), ordered(cerberus_validator.errors), document)
+
+    def test_user_file_mutations(self):
+        count = 0
+        with self.assertLogs(level="ERROR"):
+            for document in make_documents(load_user_file()):
+                self._assert_same(document)
+                count += 1
+        self.assertGreater(count, 300)
+
+    def test_mutations_of_mutations(self):
+        """Several errors in one document, unknown field next to a wrong type"""
+        data = load_user_file()
+        data["contrat"]["planning"]["semaines_type"]["a"] = {"lundi": "0", "autre": None}
+        data["contrat"]["planning"]["jours_type"] = {"0": None, 1: "08:00"}
+        del data["contrat"]["remuneration"]["salaire_horaire_brut"]
+        with self.assertLogs(level="ERROR"):
+            for document in make_documents(data):
+                self._assert_same(document)
+
+    def test_nested_errors_order(self):
+        """Errors in several sections, Cerberus sorts the fields by path"""
+        data = load_user_file()
+        data["contrat"]["remuneration"] = {"lundi": 0}
+        data["contrat"]["planning"]["conges_payes"] = 0
+        data["contrat"]["planning"]["semaines_type"]["lundi"] = 0
+        data["contrat"]["planning"]["semaines_presences"][7] = None
+        data["contrat"]["inconnu"] = None
+        del data["contrat"]["description"]
+        with self.assertLogs(level="ERROR"):
+            self._assert_same(data)
+
+        fast_validator = FastSchemaValidator()
+        with self.assertLogs(level="ERROR"):
+            fast_validator.validate(data)
+        self.assertListEqual(list(fast_validator.errors["document"][0]["contrat"][0]),
+                             ["description", "inconnu", "planning", "remuneration"])
+
+    def test_not_a_mapping(self):
+        with self.assertLogs(level="ERROR"):
+            for document in VALEURS + ["contrat"]:
+                self._assert_same(document)
+
+    def test_valid(self):
+        fast_validator = FastSchemaValidator()
+        self.assertTrue(fast_validator.validate(load_user_file()))
+        self.assertDictEqual(fast_validator.errors, {})
+
+
+class TestSchemaCompiler(unittest.TestCase):
+
+    def test_unsupported_rule(self):
+        with self.assertRaises(ValueError):
+            SchemaCompiler(require_all=True).compile({"document": {"type": "string", "regex": "[0-9]+"}})
+
+    def test_mapping_rule_without_dict_type(self):
+        with self.assertRaises(ValueError):
+            SchemaCompiler(require_all=True).compile({"document": {"type": "list", "schema": {}}})
+
+    def test_required(self):
+        check = SchemaCompiler(require_all=False).compile({"a": {"type": "integer"},
+                                                           "b": {"type": "integer", "required": True}})
+        errors = []
+        check({}, errors)
+        self.assertListEqual([(error.path, error.message) for error in errors], [(("b",), "required field")])
+
+
+class TestFactory(unittest.TestCase):
+
+    def test_load(self):
+        loader = DataLoaderFactory.make_data_loader("yaml", validator_type="fast")
+        loader.load(USER_FILE_FILEPATH)
+        self.assertDictEqual(loader.get_remuneration_data(), {'salaire_horaire_brut': 4.10})
+
+    def test_unknown_validator_type(self):
+        with self.assertRaises(ValueError):
+            DataLoaderFactory.make_data_loader("yaml", validator_type="json_schema")
+
+
+if __name__ == '__main__':
+    import logging
+    # from pathlib import Path
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[
+        logging.StreamHandler(sys.stdout),
+        # logging.FileHandler(Path(__file__).parent / Path(__file__ + '.log'), mode='w')
+    ])
+
+    unittest.main()
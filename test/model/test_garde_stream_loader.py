@@ -0,0 +1,126 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from datetime import date
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from simple_ass_mat.model.data_loader.data_loader_factory import DataLoaderFactory  # nopep8 # noqa: E402
+from simple_ass_mat.model.data_loader.yaml_file_loader import FileFormatError  # nopep8 # noqa: E402
+
+JOURS_GARDE = [
+    (date(2023, 1, 10), {"heures": [["08:00", "20:30"]], "dejeuner": True}),
+    (date(2023, 1, 11), {"absence_payee": True}),
+    (date(2023, 1, 12), {"heures": [["08:00", "12:00"], ["14:00", "18:00"]], "gouter": False}),
+]
+
+
+class TestLoad(unittest.TestCase):
+
+    def test_jsonl(self):
+        loader = DataLoaderFactory.make_garde_data_loader("jsonl")
+        jours = list(loader.load(Path(__file__).parent / "user_file" / "garde.jsonl"))
+        self.assertListEqual(jours, JOURS_GARDE)
+
+    def test_csv(self):
+        loader = DataLoaderFactory.make_garde_data_loader("csv")
+        jours = list(loader.load(Path(__file__).parent / "user_file" / "garde.csv"))
+        self.assertListEqual(jours, JOURS_GARDE)
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            DataLoaderFactory.make_garde_data_loader("xml")
+
+
+class TestLoadNouveaux(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dirpath = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dirpath)
+
+    def test_append(self):
+        for loader_type in ["jsonl", "csv"]:
+            filepath = self.tmp_dirpath / f"garde.{loader_type}"
+            shutil.copy(Path(__file__).parent / "user_file" / f"garde.{loader_type}", filepath)
+
+            loader = DataLoaderFactory.make_garde_data_loader(loader_type)
+            self.assertEqual(len(list(loader.load(filepath))), 3)
+            self.assertListEqual(list(loader.load_nouveaux()), [])
+
+            with open(filepath, "a", encoding="utf-8") as file:
+                if loader_type == "jsonl":
+                    file.write('{"date": "2023-01-13", "absence_non_remuneree": true}\n{"date": "2023-01-14"')
+                else:
+                    file.write("2023-01-13,,,true,,\n2023-01-14")
+
+            # the unterminated line is read once completed
+            self.assertListEqual(list(loader.load_nouveaux()),
+                                 [(date(2023, 1, 13), {"absence_non_remuneree": True})])
+
+            with open(filepath, "a", encoding="utf-8") as file:
+                file.write(', "gouter": true}\n' if loader_type == "jsonl" else ",,,,,true\n")
+            self.assertListEqual(list(loader.load_nouveaux()), [(date(2023, 1, 14), {"gouter": True})])
+
+    def test_load_nouveaux_before_load(self):
+        loader = DataLoaderFactory.make_garde_data_loader("jsonl")
+        with self.assertRaises(ValueError):
+            list(loader.load_nouveaux())
+
+    def test_invalid_line(self):
+        filepath = self.tmp_dirpath / "garde.jsonl"
+        filepath.write_text('{"date": "2023-01-13", "unknown": true}\n', encoding="utf-8")
+
+        loader = DataLoaderFactory.make_garde_data_loader("jsonl")
+        with self.assertRaises(FileFormatError):
+            list(loader.load(filepath))
+
+    def test_invalid_record(self):
+        filepath = self.tmp_dirpath / "garde.jsonl"
+        loader = DataLoaderFactory.make_garde_data_loader("jsonl")
+        for record in ['[]', '1', '"x"', 'null', '{"heures": [["08:00", "12:00"]]}', '{"date": 5}']:
+            filepath.write_text('{"date": "2023-01-13"}\n' + record + '\n', encoding="utf-8")
+            with self.assertRaisesRegex(FileFormatError, ":2: "):
+                list(loader.load(filepath))
+
+    def test_invalid_field(self):
+        filepath = self.tmp_dirpath / "garde.jsonl"
+        loader = DataLoaderFactory.make_garde_data_loader("jsonl")
+        for champs in ['"heures": "08:00-12:00"', '"heures": [["08:00"]]', '"heures": [["08:00", 12]]',
+                       '"heures": [["08:00", "25:00"]]', '"heures": [["12:00", "08:00"]]', '"heures": [null]',
+                       '"dejeuner": "true"', '"absence_payee": 1', '"gouter": null']:
+            filepath.write_text('{"date": "2023-01-13"}\n{"date": "2023-01-14", ' + champs + '}\n', encoding="utf-8")
+            with self.assertRaisesRegex(FileFormatError, ":2: "):
+                list(loader.load(filepath))
+
+        filepath = self.tmp_dirpath / "garde.csv"
+        loader = DataLoaderFactory.make_garde_data_loader("csv")
+        for heures in ["08:00", "08:00-", "08:00-12:00-14:00", "12:00-08:00", "8h-12h"]:
+            filepath.write_text(f"date,heures\n2023-01-13,{heures}\n", encoding="utf-8")
+            with self.assertRaisesRegex(FileFormatError, ":2: "):
+                list(loader.load(filepath))
+
+
+if __name__ == '__main__':
+    import logging
+    # from pathlib import Path
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[
+        logging.StreamHandler(sys.stdout),
+        # logging.FileHandler(Path(__file__).parent / Path(__file__ + '.log'), mode='w')
+    ])
+
+    unittest.main()
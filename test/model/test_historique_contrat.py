@@ -0,0 +1,109 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date, time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from simple_ass_mat.model.planning import CreneauHoraire, JourAcceuil, SemaineAcceuil  # nopep8 # noqa: E402
+from simple_ass_mat.model.model_factory import make_planning_with_range  # nopep8 # noqa: E402
+from simple_ass_mat.model.contrat import Contrat  # nopep8 # noqa: E402
+from simple_ass_mat.model.remuneration import Remuneration  # nopep8 # noqa: E402
+from simple_ass_mat.model.historique_contrat import (  # nopep8 # noqa: E402
+    HistoriqueContrat, HistoriqueContratError)
+
+
+def make_planning(horaire_fin: str):
+    """47 semaines d'acceuil de 5 jours, de 08:00 a horaire_fin"""
+    jour = JourAcceuil(CreneauHoraire(time.fromisoformat("08:00:00"), time.fromisoformat(horaire_fin)))
+    semaine = SemaineAcceuil(lundi=jour, mardi=jour, mercredi=jour, jeudi=jour, vendredi=jour)
+    return make_planning_with_range({(1, 47): semaine}, [48, 49, 50, 51, 52])
+
+
+class TestHistoriqueContrat(unittest.TestCase):
+
+    def setUp(self):
+        self.planning_8h = make_planning("16:00:00")
+        self.planning_6h = make_planning("14:00:00")
+        self.historique = HistoriqueContrat(date(2022, 9, 1), Contrat(self.planning_8h, Remuneration(4.0)),
+                                            fin=date(2025, 8, 31))
+        self.historique.ajouter_avenant(date(2024, 1, 1), remuneration=Remuneration(4.5))
+        self.historique.ajouter_avenant(date(2023, 1, 1), planning=self.planning_6h)
+
+    def test_get_contrat(self):
+        self.assertEqual(self.historique.get_contrat(date(2022, 12, 31)),
+                         Contrat(self.planning_8h, Remuneration(4.0)))
+        self.assertEqual(self.historique.get_contrat(date(2023, 1, 1)),
+                         Contrat(self.planning_6h, Remuneration(4.0)))
+        # l'avenant de 2024, ajoute avant celui de 2023, reprend le planning de 2023
+        self.assertEqual(self.historique.get_contrat(date(2025, 8, 31)),
+                         Contrat(self.planning_6h, Remuneration(4.5)))
+
+        with self.assertRaises(HistoriqueContratError):
+            self.historique.get_contrat(date(2022, 8, 31))
+        with self.assertRaises(HistoriqueContratError):
+            self.historique.get_contrat(date(2025, 9, 1))
+
+    def test_remplacer_avenant(self):
+        self.historique.ajouter_avenant(date(2024, 1, 1), remuneration=Remuneration(5.0))
+        self.assertEqual(len(self.historique.get_periodes()), 3)
+        self.assertEqual(self.historique.get_contrat(date(2024, 6, 1)).get_remuneration(), Remuneration(5.0))
+
+    def test_avenant_debut_contrat(self):
+        resume_2022 = self.historique.get_resume(date(2022, 12, 1))
+        self.historique.ajouter_avenant(date(2022, 9, 1), remuneration=Remuneration(5.0))
+        self.assertEqual(len(self.historique.get_periodes()), 3)
+        self.assertEqual(self.historique.get_contrat(date(2022, 9, 1)), Contrat(self.planning_8h, Remuneration(5.0)))
+        self.assertEqual(self.historique.get_contrat(date(2023, 6, 1)), Contrat(self.planning_6h, Remuneration(5.0)))
+        self.assertEqual(self.historique.get_contrat(date(2024, 6, 1)), Contrat(self.planning_6h, Remuneration(4.5)))
+        self.assertIsNot(self.historique.get_resume(date(2022, 12, 1)), resume_2022)
+
+        self.historique.ajouter_avenant(date(2022, 9, 1), planning=self.planning_6h)
+        self.assertEqual(self.historique.get_contrat(date(2022, 9, 1)), Contrat(self.planning_6h, Remuneration(4.0)))
+
+    def test_remplacer_avenant_precedent(self):
+        resume_2024 = self.historique.get_resume(date(2024, 6, 1))
+        planning_7h = make_planning("15:00:00")
+        self.historique.ajouter_avenant(date(2023, 1, 1), planning=planning_7h)
+        self.assertEqual(self.historique.get_contrat(date(2024, 6, 1)),
+                         Contrat(planning_7h, Remuneration(4.5)))
+        self.assertIsNot(self.historique.get_resume(date(2024, 6, 1)), resume_2024)
+        self.assertEqual(self.historique.get_resume(date(2024, 6, 1)).duree_acceuil_mensualisee, 35 * 52 / 12)
+
+    def test_get_periodes_entre(self):
+        debuts = [periode.debut for periode in self.historique.get_periodes_entre(date(2022, 10, 1),
+                                                                                  date(2023, 12, 31))]
+        self.assertEqual(debuts, [date(2022, 9, 1), date(2023, 1, 1)])
+
+    def test_get_resume(self):
+        resume = self.historique.get_resume(date(2023, 6, 1))
+        self.assertEqual(resume.duree_acceuil_mensualisee, 30 * 52 / 12)
+        self.assertEqual(resume.remuneration_brut_mensualisee, 4.0 * 30 * 52 / 12)
+        self.assertIs(self.historique.get_resume(date(2023, 12, 31)), resume)
+
+    def test_get_semaine_acceuil(self):
+        # 2023-01-02 est en semaine ISO 1, %U la numerote 1 aussi mais 2024-01-01 est en semaine ISO 1 et %U 0
+        self.assertIsNotNone(self.historique.get_semaine_acceuil(date(2024, 1, 1)))
+        self.assertIsNone(self.historique.get_semaine_acceuil(date(2023, 12, 1)))
+        self.assertEqual(self.historique.get_semaine_acceuil(date(2023, 3, 1)).get_nombre_heure_acceuil(), 30)
+
+
+if __name__ == '__main__':
+    import logging
+    # from pathlib import Path
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[
+        logging.StreamHandler(sys.stdout),
+        # logging.FileHandler(Path(__file__).parent / Path(__file__ + '.log'), mode='w')
+    ])
+
+    unittest.main()
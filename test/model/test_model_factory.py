@@ -0,0 +1,82 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from simple_ass_mat.model.model_factory import ModelFactory  # nopep8 # noqa: E402
+from simple_ass_mat.model.data_loader.data_loader_factory import DataLoaderFactory  # nopep8 # noqa: E402
+
+
+class CountingDataLoader:
+    """Count the calls to the data loader"""
+
+    def __init__(self, data_loader):
+        self._data_loader = data_loader
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        method = getattr(self._data_loader, name)
+
+        def counted(*args):
+            self.calls[(name, *args)] += 1
+            return method(*args)
+        return counted
+
+
+class TestMakeContrat(unittest.TestCase):
+
+    def test_types_built_once(self):
+        """47 semaines d'acceuil of semaine type 0, jour type 0 four days a week"""
+        data_loader = DataLoaderFactory.make_data_loader("yaml")
+        data_loader.load(Path(__file__).parent / "user_file" / "user_file_all_data.yml")
+        counting_data_loader = CountingDataLoader(data_loader)
+
+        ModelFactory(counting_data_loader).make_contrat()
+
+        self.assertEqual(counting_data_loader.calls[("get_semaine_type_data", 0)], 1)
+        self.assertEqual(counting_data_loader.calls[("get_jour_type_data", 0)], 1)
+        self.assertEqual(counting_data_loader.calls[("get_jour_type_data", None)], 1)
+
+    @staticmethod
+    def make_contrat(filename: str):
+        data_loader = DataLoaderFactory.make_data_loader("yaml")
+        data_loader.load(Path(__file__).parent / "user_file" / filename)
+        return ModelFactory(data_loader).make_contrat()
+
+    def test_semaine_type_unique(self):
+        """47 semaines de 40h"""
+        contrat = self.make_contrat("user_file_all_data.yml")
+        self.assertEqual(contrat.get_duree_acceuil_hebdomadaire_moyen(), 40*47/52)
+        self.assertEqual(contrat.get_duree_acceuil_mensualisee(), 40*52/12)
+        self.assertEqual(contrat.get_remuneration_brut_mensualisee(), 4.10*40*52/12)
+
+    def test_semaines_alternees(self):
+        """28 semaines de 40h, 19 semaines de 14h"""
+        contrat = self.make_contrat("user_file_semaines_alternees.yml")
+        nombre_heure_annee = 28*40 + 19*14
+        self.assertAlmostEqual(contrat.get_duree_acceuil_hebdomadaire_moyen(), nombre_heure_annee/52)
+        self.assertAlmostEqual(contrat.get_duree_acceuil_mensualisee(), nombre_heure_annee/47*52/12)
+
+
+if __name__ == '__main__':
+    import logging
+    # from pathlib import Path
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[
+        logging.StreamHandler(sys.stdout),
+        # logging.FileHandler(Path(__file__).parent / Path(__file__ + '.log'), mode='w')
+    ])
+
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from simple_ass_mat.model import parametres  # nopep8 # noqa: E402
+from simple_ass_mat.model.parametres import RegistreParametres, get_registre_parametres  # nopep8 # noqa: E402
+from simple_ass_mat.model.remuneration import Remuneration  # nopep8 # noqa: E402
+
+
+class TestRegistreParametres(unittest.TestCase):
+
+    def test_get_parametres(self):
+        registre = RegistreParametres()
+        self.assertEqual(registre.get_parametres(date(2022, 6, 15)).smic_horaire_brut, 10.85)
+        self.assertEqual(registre.get_parametres(date(2022, 6, 15)).frais_entretien_9h, 3.39)
+        self.assertEqual(registre.get_parametres(date(2023, 4, 30)).frais_entretien_9h, 3.61)
+        self.assertEqual(registre.get_parametres(date(2023, 5, 1)).date_effet, date(2023, 5, 1))
+        self.assertEqual(registre.get_parametres(date(2023, 5, 1)).seuil_heures_majorees, 45)
+        with self.assertRaises(ValueError):
+            registre.get_parametres(date(2021, 12, 31))
+
+    def test_lazy_and_memoized(self):
+        registre = RegistreParametres(Path("inexistant.yaml"))
+        with self.assertRaises(FileNotFoundError):
+            registre.get_parametres(date(2023, 1, 1))
+
+        registre = RegistreParametres()
+        parametres_mai = registre.get_parametres(date(2023, 5, 10))
+        with mock.patch("bisect.bisect_right", wraps=parametres.bisect.bisect_right) as bisect_mock:
+            self.assertIs(registre.get_parametres(date(2023, 5, 20)), parametres_mai)
+            self.assertIs(registre.get_parametres(date(2030, 1, 1)), parametres_mai)
+            self.assertEqual(bisect_mock.call_count, 0)
+            self.assertEqual(registre.get_parametres(date(2023, 4, 30)).date_effet, date(2023, 1, 1))
+            self.assertEqual(bisect_mock.call_count, 1)
+        with self.assertRaises(ValueError):
+            registre.get_parametres(date(2021, 12, 31))
+
+        self.assertIs(get_registre_parametres(), get_registre_parametres())
+
+    def test_incomplete(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            filepath = Path(dirname) / "parametres.yaml"
+            filepath.write_text("- date_effet: 2023-01-01\n  smic_horaire_brut: 11.27\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                RegistreParametres(filepath).get_parametres(date(2023, 1, 1))
+
+    def test_remuneration(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            filepath = Path(dirname) / "parametres.yaml"
+            filepath.write_text(PARAMETRES_2024, encoding="utf-8")
+            with mock.patch("simple_ass_mat.model.remuneration.get_registre_parametres",
+                            return_value=RegistreParametres(filepath)):
+                self.assertEqual(Remuneration.get_ratio_brut_net(date(2023, 12, 31)), 0.7812)
+                self.assertEqual(Remuneration.get_ratio_brut_net(date(2024, 1, 1)), 0.78)
+                self.assertEqual(Remuneration(4.0).get_salaire_horaire_net(date(2024, 1, 1)), 4.0 * 0.78)
+
+
+PARAMETRES_2024 = """
+- date_effet: 2023-01-01
+  smic_horaire_brut: 11.27
+  ratio_brut_net: 0.7812
+  seuil_heures_majorees: 45
+  frais_entretien_minimum: 2.65
+  frais_entretien_9h: 3.61
+- date_effet: 2024-01-01
+  ratio_brut_net: 0.78
+"""
+
+
+if __name__ == '__main__':
+    import logging
+    # from pathlib import Path
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[
+        logging.StreamHandler(sys.stdout),
+        # logging.FileHandler(Path(__file__).parent / Path(__file__ + '.log'), mode='w')
+    ])
+
+    unittest.main()
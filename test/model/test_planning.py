@@ -11,11 +11,12 @@ import unittest
 import sys
 import os
 from datetime import time
+from unittest import mock
 
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 
-from simple_ass_mat.model.planning import CreneauHoraire, JourAcceuil, SemaineAcceuil    # nopep8 # noqa: E402
+from simple_ass_mat.model.planning import CreneauHoraire, JourAcceuil, SemaineAcceuil, Planning  # nopep8 # noqa: E402
 from simple_ass_mat.model.model_factory import make_planning_with_range  # nopep8 # noqa: E402
 
 
@@ -59,6 +60,44 @@ class TestGetNombreHeureSemaine(unittest.TestCase):
         self.assertEqual(planning.get_nombre_heure_semaine(), 4*10)
 
 
+class TestAggregats(unittest.TestCase):
+
+    def setUp(self):
+        creneau = CreneauHoraire(time.fromisoformat('08:00:00'), time.fromisoformat('18:00:00'))
+        self.semaine_4_jours = SemaineAcceuil(lundi=JourAcceuil(creneau), mardi=JourAcceuil(creneau),
+                                              jeudi=JourAcceuil(creneau), vendredi=JourAcceuil(creneau))
+        self.semaine_2_jours = SemaineAcceuil(lundi=JourAcceuil(creneau), mardi=JourAcceuil(creneau))
+
+    def test_nombre_heure_annee(self):
+        planning = make_planning_with_range({(1, 40): self.semaine_4_jours, (41, 47): self.semaine_2_jours},
+                                            [48, 49, 50, 51, 52])
+        self.assertEqual(planning.get_nombre_heure_annee(), 40*40 + 7*20)
+        self.assertDictEqual(planning.get_nombre_semaines_par_type(),
+                             {self.semaine_4_jours: 40, self.semaine_2_jours: 7})
+        self.assertEqual(planning.get_nombre_heure_semaine(), (40*40 + 7*20) / 47)
+        self.assertEqual(planning.get_nombre_heure_mensualisee(), (40*40 + 7*20) / 47 * 52 / 12)
+
+    def test_computed_once_per_semaine_type(self):
+        with mock.patch.object(SemaineAcceuil, "get_nombre_heure_acceuil", autospec=True,
+                               return_value=40.0) as get_nombre_heure_acceuil:
+            planning = make_planning_with_range({(1, 40): self.semaine_4_jours, (41, 47): self.semaine_2_jours},
+                                                [48, 49, 50, 51, 52])
+            for _ in range(3):
+                planning.get_nombre_heure_semaine()
+                planning.get_nombre_heure_annee()
+        self.assertEqual(get_nombre_heure_acceuil.call_count, 2)
+
+    def test_rebuild(self):
+        semaines_acceuil = {numero_semaine: self.semaine_4_jours for numero_semaine in range(1, 48)}
+        planning = Planning(semaines_acceuil, [48, 49, 50, 51, 52])
+        self.assertEqual(planning.get_nombre_heure_semaine(), 40)
+
+        semaines_acceuil[1] = self.semaine_2_jours
+        planning.rebuild()
+        self.assertEqual(planning.get_nombre_heure_semaine(), (46*40 + 20) / 47)
+        self.assertEqual(planning.get_nombre_heure_annee(), 46*40 + 20)
+
+
 if __name__ == '__main__':
     import logging
     # from pathlib import Path
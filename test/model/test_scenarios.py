@@ -0,0 +1,80 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+from datetime import date, time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from simple_ass_mat.model.planning import CreneauHoraire, JourAcceuil, SemaineAcceuil  # nopep8 # noqa: E402
+from simple_ass_mat.model.model_factory import make_planning_with_range  # nopep8 # noqa: E402
+from simple_ass_mat.model.contrat import Contrat  # nopep8 # noqa: E402
+from simple_ass_mat.model.remuneration import Remuneration  # nopep8 # noqa: E402
+from simple_ass_mat.model.scenarios import Scenarios  # nopep8 # noqa: E402
+
+
+DATE = date(2023, 8, 1)
+
+
+def make_planning():
+    """47 semaines d'acceuil de 5 jours de 8h20"""
+    jour = JourAcceuil(CreneauHoraire(time.fromisoformat("08:00:00"), time.fromisoformat("16:20:00")))
+    semaine = SemaineAcceuil(lundi=jour, mardi=jour, mercredi=jour, jeudi=jour, vendredi=jour)
+    return make_planning_with_range({(1, 47): semaine}, [48, 49, 50, 51, 52])
+
+
+class TestEvaluer(unittest.TestCase):
+
+    def test_same_as_contrat(self):
+        planning = make_planning()
+        salaires = [3.5, 4.10, 4.25, 5.0]
+        resultats = Scenarios(planning, DATE).evaluer(salaires)
+
+        for index, salaire in enumerate(salaires):
+            contrat = Contrat(planning, Remuneration(salaire))
+            self.assertTrue(resultats.annee_complete[index])
+            self.assertEqual(resultats.duree_acceuil_hebdomadaire_moyen[index],
+                             contrat.get_duree_acceuil_hebdomadaire_moyen())
+            self.assertEqual(resultats.duree_acceuil_mensualisee[index], contrat.get_duree_acceuil_mensualisee())
+            self.assertEqual(resultats.remuneration_brut_mensualisee[index],
+                             contrat.get_remuneration_brut_mensualisee())
+            self.assertAlmostEqual(resultats.remuneration_net_mensualisee[index],
+                                   contrat.get_remuneration_brut_mensualisee() * Remuneration.get_ratio_brut_net(DATE))
+
+    def test_annee_incomplete(self):
+        resultats = Scenarios(make_planning(), DATE).evaluer(4.0, nombre_heure_semaine=40,
+                                                             nombre_semaines_acceuil=[47, 40],
+                                                             nombre_semaines_conges_payes=[5, 4])
+        np.testing.assert_array_equal(resultats.annee_complete, [True, False])
+        np.testing.assert_array_equal(resultats.duree_acceuil_mensualisee, [40 * 52 / 12, 40 * 40 / 12])
+        np.testing.assert_array_equal(resultats.remuneration_brut_mensualisee, [4.0 * 40 * 52 / 12, 4.0 * 40 * 40 / 12])
+
+    def test_table(self):
+        salaires = np.linspace(3.5, 6.0, 100)
+        heures = np.arange(10, 51)
+        resultats = Scenarios(make_planning(), DATE).evaluer(salaires[:, np.newaxis], nombre_heure_semaine=heures)
+
+        self.assertEqual(resultats.remuneration_brut_mensualisee.shape, (100, 41))
+        self.assertEqual(resultats.remuneration_brut_mensualisee[10, 30], salaires[10] * (heures[30] * 52 / 12))
+
+
+if __name__ == '__main__':
+    import logging
+    # from pathlib import Path
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[
+        logging.StreamHandler(sys.stdout),
+        # logging.FileHandler(Path(__file__).parent / Path(__file__ + '.log'), mode='w')
+    ])
+
+    unittest.main()
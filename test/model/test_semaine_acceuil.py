@@ -10,12 +10,14 @@
 import unittest
 import sys
 import os
+import pickle
 from datetime import time
 
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 
 from simple_ass_mat.model.planning import SemaineAcceuil, JourAcceuil, CreneauHoraire   # nopep8 # noqa: E402
+from simple_ass_mat.model.value_object import ValueObject  # nopep8 # noqa: E402
 
 
 class TestGetNombreHeureAcceuil(unittest.TestCase):
@@ -70,6 +72,45 @@ class TestGetNombreHeureAcceuil(unittest.TestCase):
         self.assertEqual(semaine.get_nombre_heure_acceuil(), 1+3+5+7+9)
 
 
+class TestValueObject(unittest.TestCase):
+
+    @staticmethod
+    def make_semaine(fin: str) -> SemaineAcceuil:
+        jour = JourAcceuil(CreneauHoraire(time.fromisoformat('08:00:00'), time.fromisoformat(fin)))
+        return SemaineAcceuil(lundi=jour, mercredi=jour)
+
+    def test_equal(self):
+        semaine = self.make_semaine('17:00:00')
+        self.assertEqual(semaine, self.make_semaine('17:00:00'))
+        self.assertEqual(hash(semaine), hash(self.make_semaine('17:00:00')))
+        self.assertNotEqual(semaine, self.make_semaine('18:00:00'))
+        self.assertEqual(len({semaine, self.make_semaine('17:00:00'), self.make_semaine('18:00:00')}), 2)
+
+    def test_immutable(self):
+        semaine = self.make_semaine('17:00:00')
+        with self.assertRaises(AttributeError):
+            semaine._jours = ()  # pylint: disable=protected-access
+        with self.assertRaises(AttributeError):
+            semaine.autre = None  # pylint: disable=attribute-defined-outside-init
+
+    def test_get_jour(self):
+        semaine = self.make_semaine('17:00:00')
+        self.assertEqual(semaine.get_jour(0), semaine.get_jour(2))
+        self.assertIsNone(semaine.get_jour(1))
+
+    def test_pickle(self):
+        semaine = self.make_semaine('17:00:00')
+        self.assertEqual(pickle.loads(pickle.dumps(semaine)), semaine)
+
+    def test_abstract(self):
+        class SansValeurs(ValueObject):  # pylint: disable=abstract-method
+            __slots__ = ()
+
+        with self.assertRaises(TypeError):
+            SansValeurs()  # pylint: disable=abstract-class-instantiated
+        self.assertFalse(hasattr(self.make_semaine('17:00:00'), '__dict__'))
+
+
 if __name__ == '__main__':
     import logging
     # from pathlib import Path
@@ -0,0 +1,104 @@
+"""
+:date 2023-08
+:author Nicolas Boutin
+"""
+# pylint: disable=logging-fstring-interpolation
+# pylint: disable=wrong-import-position
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+
+from simple_ass_mat.model.data_loader.data_loader_factory import DataLoaderFactory  # nopep8 # noqa: E402
+from simple_ass_mat.model.data_loader.yaml_file_loader import FileFormatError  # nopep8 # noqa: E402
+from simple_ass_mat.model.data_loader.snapshot_file_loader import (  # nopep8 # noqa: E402
+    SnapshotFileLoader, StaleSnapshotError, write_snapshot, compute_checksum, compute_content_checksum)
+from simple_ass_mat.model.model_factory import ModelFactory  # nopep8 # noqa: E402
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dirpath = Path(tempfile.mkdtemp())
+        self.source_filepath = self.tmp_dirpath / "user_file_all_data.yml"
+        shutil.copy(Path(__file__).parent / "user_file" / "user_file_all_data.yml", self.source_filepath)
+        self.snapshot_filepath = self.tmp_dirpath / "user_file_all_data.snapshot"
+
+        self.yaml_loader = DataLoaderFactory.make_data_loader("yaml")
+        self.yaml_loader.load(self.source_filepath)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dirpath)
+
+    def test_same_data(self):
+        write_snapshot(self.yaml_loader, compute_checksum(self.source_filepath), self.snapshot_filepath)
+        loader = DataLoaderFactory.make_data_loader("snapshot")
+        loader.load(self.snapshot_filepath)
+
+        self.assertDictEqual(loader.get_remuneration_data(), self.yaml_loader.get_remuneration_data())
+        self.assertDictEqual(loader.get_semaines_presences_data(), self.yaml_loader.get_semaines_presences_data())
+        self.assertDictEqual(loader.get_semaine_type_data(0), self.yaml_loader.get_semaine_type_data(0))
+        self.assertListEqual(loader.get_jour_type_data(0), self.yaml_loader.get_jour_type_data(0))
+        self.assertIsNone(loader.get_jour_type_data(1))
+        self.assertListEqual(loader.get_conges_payes_data(), self.yaml_loader.get_conges_payes_data())
+
+        ModelFactory(loader).make_contrat()
+
+    def test_stale(self):
+        write_snapshot(self.yaml_loader, compute_checksum(self.source_filepath), self.snapshot_filepath)
+        SnapshotFileLoader(self.source_filepath).load(self.snapshot_filepath)
+
+        with open(self.source_filepath, "a", encoding="utf-8") as file:
+            file.write("\n")
+        with self.assertRaises(StaleSnapshotError):
+            SnapshotFileLoader(self.source_filepath).load(self.snapshot_filepath)
+
+    def test_stale_checksum(self):
+        """The snapshot holds the checksum of the parsed content, not of the file when written"""
+        write_snapshot(self.yaml_loader, compute_content_checksum(b"older content"), self.snapshot_filepath)
+        SnapshotFileLoader().load(self.snapshot_filepath)
+        with self.assertRaises(StaleSnapshotError):
+            SnapshotFileLoader(self.source_filepath).load(self.snapshot_filepath)
+
+    def test_invalid_file(self):
+        write_snapshot(self.yaml_loader, compute_checksum(self.source_filepath), self.snapshot_filepath)
+        data = self.snapshot_filepath.read_bytes()
+
+        for invalid_data in [data[:-1], data + b"\0", b"YAML" + data[4:], data[:10]]:
+            self.snapshot_filepath.write_bytes(invalid_data)
+            with self.assertRaises(FileFormatError):
+                SnapshotFileLoader().load(self.snapshot_filepath)
+
+    def test_load_with_snapshot(self):
+        loader = DataLoaderFactory.load_with_snapshot(self.source_filepath, self.snapshot_filepath)
+        self.assertNotIsInstance(loader, SnapshotFileLoader)
+        self.assertTrue(self.snapshot_filepath.exists())
+
+        loader = DataLoaderFactory.load_with_snapshot(self.source_filepath, self.snapshot_filepath)
+        self.assertIsInstance(loader, SnapshotFileLoader)
+
+        with open(self.source_filepath, "a", encoding="utf-8") as file:
+            file.write("\n")
+        loader = DataLoaderFactory.load_with_snapshot(self.source_filepath, self.snapshot_filepath)
+        self.assertNotIsInstance(loader, SnapshotFileLoader)
+        loader = DataLoaderFactory.load_with_snapshot(self.source_filepath, self.snapshot_filepath)
+        self.assertIsInstance(loader, SnapshotFileLoader)
+
+
+if __name__ == '__main__':
+    import logging
+    # from pathlib import Path
+
+    logging.basicConfig(level=logging.DEBUG, handlers=[
+        logging.StreamHandler(sys.stdout),
+        # logging.FileHandler(Path(__file__).parent / Path(__file__ + '.log'), mode='w')
+    ])
+
+    unittest.main()
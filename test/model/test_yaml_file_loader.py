@@ -38,6 +38,18 @@ class TestLoad(unittest.TestCase):
         remuneration_data = loader.get_remuneration_data()
         self.assertDictEqual(remuneration_data,  {'salaire_horaire_brut': 4.10})
 
+    def test_libyaml_same_data(self):
+        """libyaml and pure Python parsers read the same data"""
+        filepath = Path(__file__).parent / "user_file" / "user_file_all_data.yml"
+        libyaml_loader = YamlFileLoader(ValidatorMock(), libyaml=True)
+        libyaml_loader.load(filepath)
+        python_loader = YamlFileLoader(ValidatorMock(), libyaml=False)
+        python_loader.load(filepath)
+
+        self.assertDictEqual(libyaml_loader.get_semaines_presences_data(), python_loader.get_semaines_presences_data())
+        self.assertDictEqual(libyaml_loader.get_semaine_type_data(0), python_loader.get_semaine_type_data(0))
+        self.assertListEqual(libyaml_loader.get_jour_type_data(0), python_loader.get_jour_type_data(0))
+
 
 if __name__ == '__main__':
     import logging
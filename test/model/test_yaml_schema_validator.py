@@ -10,9 +10,11 @@
 import unittest
 import sys
 import os
+from unittest import mock
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 
+from simple_ass_mat.model.data_loader import yaml_schema_validator  # nopep8 # noqa: E402
 from simple_ass_mat.model.data_loader.yaml_schema_validator import YamlSchemaValidator  # nopep8 # noqa: E402
 
 
@@ -51,6 +53,32 @@ class TestFullYamlSchema(unittest.TestCase):
         self.assertTrue(yaml_validator.validate(data))
 
 
+class TestSchemaCache(unittest.TestCase):
+
+    def tearDown(self):
+        yaml_schema_validator.invalidate_schema_cache()
+
+    def test_schema_read_once(self):
+        yaml_schema_validator.invalidate_schema_cache()
+        with mock.patch("builtins.open", wraps=open) as open_mock:
+            YamlSchemaValidator()
+            YamlSchemaValidator()
+        self.assertEqual(open_mock.call_count, 1)
+
+    def test_invalidate(self):
+        schema = yaml_schema_validator.get_schema()
+        self.assertIs(yaml_schema_validator.get_schema(), schema)
+
+        yaml_schema_validator.invalidate_schema_cache()
+        self.assertIsNot(yaml_schema_validator.get_schema(), schema)
+
+    def test_errors_not_shared(self):
+        invalid_validator = YamlSchemaValidator()
+        self.assertFalse(invalid_validator.validate({}))
+        self.assertTrue(invalid_validator.errors)
+        self.assertDictEqual(YamlSchemaValidator().errors, {})
+
+
 if __name__ == '__main__':
     import logging
     # from pathlib import Path